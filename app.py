@@ -1,11 +1,19 @@
 import sys
 import os
+import re
 import json
 import csv
+import io
 import duckdb
 import polars as pl
 import gc
+import queue
+import threading
 import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from operator import itemgetter
 try:
     import openpyxl
     from openpyxl.styles import Font
@@ -21,6 +29,12 @@ try:
 except ImportError:
     PARQUET_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import fitz  # PyMuPDF
     PDF_AVAILABLE = True
@@ -50,16 +64,114 @@ except ImportError:
     PLOTLY_AVAILABLE = False
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
-    QPushButton, QTextEdit, QTableWidget, QTableWidgetItem, QComboBox,
-    QLabel, QFileDialog, QMessageBox, QSplitter, QGroupBox, QTreeWidget,
-    QTreeWidgetItem, QHeaderView, QDialog, QFormLayout, QLineEdit,
+    QPushButton, QTextEdit, QComboBox,
+    QLabel, QFileDialog, QMessageBox, QSplitter, QGroupBox, QTreeView, QTableView,
+    QHeaderView, QDialog, QFormLayout, QLineEdit,
     QCheckBox, QSpinBox, QDialogButtonBox, QListWidget, QListWidgetItem,
     QMenu, QAction, QInputDialog, QRadioButton, QButtonGroup, QTabWidget,
     QAbstractItemView, QProgressBar, QCompleter, QProgressDialog, QScrollArea, QStyle
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QStringListModel, QRegExp
+from PyQt5.QtCore import Qt, QThread, QMimeData, QByteArray, QTimer, QSignalBlocker, pyqtSignal, QStringListModel, QRegExp, QAbstractItemModel, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QFont, QTextCursor, QSyntaxHighlighter, QTextCharFormat, QColor, QTextDocument, QPixmap, QPainter
 
+def _cell_str(value, _str=str):
+    """Format a result cell for copying or display, with NULL as an empty string"""
+    return '' if value is None else _str(value)
+
+def _display_cell(value, _str=str):
+    """Format a cell of the main results tables: NULL spelled out, very long values truncated"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, str):
+        # Truncate very long strings for display performance
+        return value[:1000] + '...' if len(value) > 1000 else value
+    return _str(value)[:1000]
+
+def rows_to_tsv(columns, rows):
+    """Serialize a header and result rows as tab-separated text (NULL as '') with csv.writer's C loop"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', lineterminator='\n')
+    writer.writerow(columns)
+    writer.writerows(rows)
+    # Drop the last line terminator in the buffer; rstrip() would copy the whole text once more
+    buffer.truncate(buffer.tell() - 1)
+    return buffer.getvalue()
+
+# Tokens that matter when splitting a script into statements: quoted strings (an unterminated
+# one runs to the end of the text), line and block comments, and statement separators
+_SQL_SPLIT_RE = re.compile(r"""'(?:[^'\\]|\\.)*(?:'|\Z)|"(?:[^"\\]|\\.)*(?:"|\Z)|--[^\n]*|/\*.*?(?:\*/|\Z)|;""", re.DOTALL)
+
+# Dashboard scripts launched on exported query results
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+NODE_PY = os.path.join(APP_DIR, 'node.py')
+DASHBOARD_PY = os.path.join(APP_DIR, 'dashboard.py')
+
+# Qt reports line breaks in selections as paragraph/line separators
+_QTX_TRANS = str.maketrans({'\u2029': '\n', '\u2028': '\n'})
+
+# Characters that are not allowed in unquoted table names
+_SANITIZE_RE = re.compile(r'[^0-9A-Za-z_]')
+
+# Identifiers produced by the name sanitizers
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+def quote_identifier(name):
+    """Validate a sanitized identifier and return it double-quoted for use in DDL"""
+    if not _IDENTIFIER_RE.fullmatch(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return f'"{name}"'
+
+# COPY ... TO options for the export formats DuckDB can write itself
+COPY_EXPORT_OPTIONS = {
+    'csv': 'FORMAT CSV, HEADER, DELIMITER {delimiter}',
+    'json': 'FORMAT JSON, ARRAY true',
+    'parquet': 'FORMAT PARQUET, COMPRESSION ZSTD',
+}
+
+def copy_export_sql(query, file_path, format_type, delimiter=','):
+    """Build a COPY statement that writes a query's complete result to file_path"""
+    def literal(text):
+        return "'" + text.replace("'", "''") + "'"
+    options = COPY_EXPORT_OPTIONS[format_type].format(delimiter=literal(delimiter))
+    # The closing parenthesis goes on its own line so a trailing -- comment can't swallow it
+    return f"COPY ({query.rstrip().rstrip(';')}\n) TO {literal(file_path)} ({options})"
+
+# path -> (mtime_ns, size, parsed data) for files read through read_json_file
+_json_file_cache = {}
+
+def read_json_file(path):
+    """Parse a JSON file, using orjson when it is installed.
+    
+    The parsed data is cached until the file's modification time or size changes; lists are
+    returned as shallow copies so callers can append to them without touching the cache.
+    """
+    stat = os.stat(path)
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        data = cached[2]
+    else:
+        if ORJSON_AVAILABLE:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            # UTF-8 like orjson, not the platform's default encoding
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        _json_file_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return list(data) if isinstance(data, list) else data
+
+def write_json_file(path, data):
+    """Write data as indented JSON through a temporary file, so a failed save never truncates the original"""
+    _json_file_cache.pop(path, None)
+    temp_path = path + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(temp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    os.replace(temp_path, path)
+
 def build_mysql_connection_string(connection_data):
     """Build MySQL connection string for DuckDB MySQL extension"""
     params = []
@@ -808,8 +920,7 @@ class SavedQueryManagerDialog(QDialog):
             
             # Save to file
             try:
-                with open('saved_queries.json', 'w') as f:
-                    json.dump(self.saved_queries, f, indent=2)
+                write_json_file('saved_queries.json', self.saved_queries)
                 QMessageBox.information(self, 'Changes Saved', 'Query changes have been saved successfully.')
                 self.populate_query_list()
             except Exception as e:
@@ -828,8 +939,7 @@ class SavedQueryManagerDialog(QDialog):
                 
                 # Save to file
                 try:
-                    with open('saved_queries.json', 'w') as f:
-                        json.dump(self.saved_queries, f, indent=2)
+                    write_json_file('saved_queries.json', self.saved_queries)
                     QMessageBox.information(self, 'Query Deleted', f'Query "{query_name}" has been deleted.')
                     self.populate_query_list()
                     self.clear_details()
@@ -1596,7 +1706,7 @@ class SQLQueryThread(QThread):
     def run(self):
         try:
             result = self.connection.execute(self.query).fetchall()
-            columns = [desc[0] for desc in self.connection.description]
+            columns = result_column_names(self.connection.description)
             self.result_ready.emit(columns, result)
         except Exception as e:
             self.error_occurred.emit(str(e))
@@ -1672,7 +1782,7 @@ class StreamingQueryThread(QThread):
                 
                 # Execute the paginated query
                 cursor = self.connection.execute(paginated_query)
-                columns = [desc[0] for desc in cursor.description]
+                columns = result_column_names(cursor.description)
                 self.progress_update.emit(75)  # 75% progress after query execution
             else:
                 # Handle non-SELECT queries (ALTER, CREATE, INSERT, UPDATE, DELETE, etc.)
@@ -1688,7 +1798,7 @@ class StreamingQueryThread(QThread):
                 
                 # For non-SELECT queries, we may not have columns or data to return
                 if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
+                    columns = result_column_names(cursor.description)
                 else:
                     # For DDL/DML operations, create a simple result indicator
                     columns = ['Result']
@@ -1773,24 +1883,21 @@ class StreamingQueryThread(QThread):
             self.progress_update.emit(100)  # 100% progress when complete
             self.batch_ready.emit(columns, batch_data, total_count, has_more)
             
-            # Clean up batch_data reference to free memory
-            del batch_data
-            gc.collect()
-            
         except Exception as e:
             if not self._is_cancelled:
                 self.error_occurred.emit(str(e))
 
 class FullExportQueryThread(QThread):
     """Thread for executing complete SQL queries for export purposes"""
-    export_ready = pyqtSignal(list, list)  # columns, data
+    export_ready = pyqtSignal(list, object)  # columns, data (row tuples, or a pyarrow Table with as_arrow)
     error_occurred = pyqtSignal(str)
     progress_update = pyqtSignal(int)  # progress percentage
     
-    def __init__(self, connection, query):
+    def __init__(self, connection, query, as_arrow=False):
         super().__init__()
         self.connection = connection
         self.query = query
+        self.as_arrow = as_arrow
         self._is_cancelled = False
     
     def cancel(self):
@@ -1818,6 +1925,14 @@ class FullExportQueryThread(QThread):
             
             self.progress_update.emit(50)
             
+            if self.as_arrow:
+                # Columnar fetch for writers that take Arrow directly, no Python row objects
+                table = fetch_arrow(cursor)
+                if not self._is_cancelled:
+                    self.progress_update.emit(100)
+                    self.export_ready.emit(columns, table)
+                return
+            
             # Fetch all data in batches to manage memory
             all_data = []
             batch_size = 10000
@@ -1846,79 +1961,1104 @@ class FullExportQueryThread(QThread):
             # Clean up
             gc.collect()
 
-class DuckDBSQLApp(QMainWindow):
-    def __init__(self):
+class CopyExportThread(QThread):
+    """Thread that writes a complete query result to a file with DuckDB's COPY ... TO"""
+    export_finished = pyqtSignal(object)  # rows written, None if DuckDB didn't report a count
+    error_occurred = pyqtSignal(str, bool)  # error, whether exporting the fetched rows may still work
+    
+    def __init__(self, connection, sql):
         super().__init__()
-        self.connection = duckdb.connect(':memory:')
-        # Create the localdb schema
-        self.connection.execute("CREATE SCHEMA IF NOT EXISTS localdb")
-        self.loaded_tables = {}  # filename -> table_name mapping
+        # A cursor of its own, so cancelling interrupts only the COPY and not the app's queries
+        self.connection = connection.cursor()
+        self.sql = sql
+        self._is_cancelled = False
+    
+    def cancel(self):
+        """Cancel the export by interrupting the running COPY"""
+        self._is_cancelled = True
+        try:
+            self.connection.interrupt()
+        except duckdb.Error:
+            pass  # The cursor is already closed
+    
+    def run(self):
+        try:
+            row = self.connection.execute(self.sql).fetchone()
+            if not self._is_cancelled:
+                self.export_finished.emit(row[0] if row else None)
+        except Exception as e:
+            if not self._is_cancelled:
+                # The row export would hit the same file or permission problem
+                retryable = not isinstance(e, (duckdb.IOException, duckdb.PermissionException, OSError))
+                self.error_occurred.emit(str(e), retryable)
+        finally:
+            self.connection.close()
+
+class MultiQueryThread(QThread):
+    """Thread for executing the statements of a multi-statement script in order"""
+    statement_started = pyqtSignal(int)  # statement number
+    statement_finished = pyqtSignal(int, object, object)  # statement number, columns (None without a result set), rows
+    statement_failed = pyqtSignal(int, str)  # statement number, error
+    
+    def __init__(self, connection, queries):
+        super().__init__()
+        # Statements share the app connection so temp tables and transactions carry over between them
+        self.connection = connection
+        self.queries = queries
+        self.is_cancelled = False
+    
+    def cancel(self):
+        """Skip the remaining statements and interrupt the running one"""
+        self.is_cancelled = True
+        try:
+            self.connection.interrupt()
+        except Exception:
+            pass
+    
+    def run(self):
+        for idx, query in enumerate(self.queries, 1):
+            if self.is_cancelled:
+                break
+            self.statement_started.emit(idx)
+            try:
+                cursor = self.connection.execute(query)
+                if cursor.description:
+                    columns = result_column_names(cursor.description)
+                    self.statement_finished.emit(idx, columns, fetch_result_rows(cursor))
+                else:
+                    self.statement_finished.emit(idx, None, None)
+            except Exception as e:
+                self.statement_failed.emit(idx, str(e))
+
+class ParquetExportThread(QThread):
+    """Thread for writing query results to a Parquet file for the dashboards"""
+    export_finished = pyqtSignal(str, str)  # parquet path, script path
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, connection, query, parquet_path, script_path):
+        super().__init__()
+        # A cursor is a separate connection to the same database, safe to use from this thread
+        self.connection = connection.cursor()
+        self.query = query
+        self.parquet_path = parquet_path
+        self.script_path = script_path
+    
+    def run(self):
+        try:
+            # The relation streams its result straight into the Parquet writer
+            self.connection.sql(self.query).write_parquet(self.parquet_path, compression='zstd')
+            self.export_finished.emit(self.parquet_path, self.script_path)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            self.connection.close()
+
+class ClipboardCopyThread(QThread):
+    """Thread for building whole-table or whole-column clipboard text from a query"""
+    text_ready = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, connection, query, column=None, header_text=''):
+        super().__init__()
+        # A cursor is a separate connection to the same database, safe to use from this thread
+        self.connection = connection.cursor()
+        self.query = query.strip().rstrip(';')
+        self.column = column
+        self.header_text = header_text
+        self._is_cancelled = False
+    
+    def cancel(self):
+        """Cancel the copy, interrupting the running query"""
+        self._is_cancelled = True
+        try:
+            self.connection.interrupt()
+        except Exception:
+            pass
+    
+    def run(self):
+        try:
+            text = self.table_text() if self.column is None else self.column_text()
+            
+            if text and not self._is_cancelled:
+                self.text_ready.emit(text)
+        except Exception as e:
+            if not self._is_cancelled:
+                self.error_occurred.emit(str(e))
+        finally:
+            self.connection.close()
+    
+    def table_text(self):
+        """Return the complete result as tab-separated text with a header row, written by DuckDB's CSV writer"""
+        import tempfile
         
-        # Connection storage file
-        self.connections_file = 'db_connections.json'
-        self.saved_connections = self.load_saved_connections()
-        self.active_connections = {}  # Store multiple active connections: {db_name: connection_data}
+        # DuckDB opens the file itself, so only reserve the name here
+        fd, temp_path = tempfile.mkstemp(suffix='.tsv')
+        os.close(fd)
+        try:
+            self.connection.sql(self.query).write_csv(temp_path, sep='\t', header=True)
+            with open(temp_path, 'r', encoding='utf-8', newline='') as f:
+                return f.read().rstrip('\r\n')
+        finally:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def column_text(self):
+        """Return the header and one column of the complete result as lines (NULL as ''), or None if there is no such column"""
+        # The closing parenthesis goes on its own line so a trailing -- comment can't swallow it
+        try:
+            columns = [desc[0] for desc in self.connection.execute(f"SELECT * FROM ({self.query}\n) LIMIT 0").description]
+        except duckdb.Error:
+            # Statements that can't be a subquery (PRAGMA, SHOW, ...) run as they are
+            return self.column_lines(self.connection.execute(self.query), self.column)
+        if self.column >= len(columns):
+            return None
+        
+        if columns.count(columns[self.column]) > 1:
+            # Ambiguous name, fall back to picking the column out of full rows
+            return self.column_lines(self.connection.execute(self.query), self.column)
+        
+        # Only fetch the one column
+        column_name = columns[self.column].replace('"', '""')
+        return self.column_lines(self.connection.execute(f'SELECT "{column_name}" FROM ({self.query}\n)'), 0)
+    
+    def column_lines(self, cursor, column):
+        """Stream one column of a result into the header plus one line per value, or None if there is no such column"""
+        if column >= len(cursor.description):
+            return None
+        
+        # Write each batch into the buffer instead of collecting every row first
+        buffer = io.StringIO()
+        buffer.write(self.header_text)
+        while not self._is_cancelled:
+            batch = cursor.fetchmany(32768)
+            if not batch:
+                break
+            buffer.write('\n')
+            buffer.write('\n'.join(map(_cell_str, [row[column] for row in batch])))
+        return buffer.getvalue()
+
+def result_column_names(description):
+    """Return the column names of a DuckDB cursor description, interned since they recur across pages and tabs"""
+    return [sys.intern(desc[0]) for desc in description]
+
+def fetch_arrow(result):
+    """Fetch a DuckDB result as a pyarrow Table (fetch_arrow_table is deprecated from duckdb 1.5)"""
+    to_arrow_table = getattr(result, 'to_arrow_table', None)
+    if to_arrow_table is not None:
+        return to_arrow_table()
+    return result.fetch_arrow_table()
+
+# Types whose Arrow values convert to different Python objects than fetchall() returns
+# (MonthDayNano tuples instead of timedeltas, key/value pair lists instead of dicts, raw bytes
+# for BIT and BIGNUM/VARINT, times without their offset, nanoseconds Python can't hold, lists for ARRAY)
+_ARROW_MISMATCHED_TYPES_RE = re.compile(
+    r'\b(?:INTERVAL|MAP|BIT|BIGNUM|VARINT|TIMETZ|TIME WITH TIME ZONE|TIMESTAMP_NS)\b|\[\d+\]')
+
+def fetch_result_rows(result):
+    """Fetch a complete DuckDB result for paging through it.
+    
+    With pyarrow the result stays in columnar Arrow buffers and only the page being shown is
+    turned into Python row tuples (see slice_result_rows); otherwise, or when a column holds
+    a type Arrow converts differently (INTERVAL, MAP, ...), the rows are fetched as tuples.
+    """
+    if PARQUET_AVAILABLE and not any(_ARROW_MISMATCHED_TYPES_RE.search(str(desc[1])) for desc in result.description):
+        return fetch_arrow(result)
+    return result.fetchall()
+
+def arrow_rows_via_duckdb(table):
+    """Convert an Arrow table to row tuples through DuckDB, which maps values Python can't hold
+    (infinite dates and timestamps) the same way fetchall() does"""
+    connection = duckdb.connect()
+    try:
+        # Positional names, DuckDB can't scan an Arrow table with duplicate column names
+        return connection.from_arrow(table.rename_columns([f'c{i}' for i in range(table.num_columns)])).fetchall()
+    finally:
+        connection.close()
+
+def slice_result_rows(rows, start, stop):
+    """Return rows[start:stop] as row tuples for a result from fetch_result_rows"""
+    if isinstance(rows, list):
+        return rows[start:stop]
+    page = rows.slice(start, stop - start)
+    try:
+        return list(zip(*[column.to_pylist() for column in page.columns]))
+    except (ValueError, OverflowError, pa.ArrowException):
+        return arrow_rows_via_duckdb(page)
+
+def last_page_index(total_rows, page_size):
+    """Return the zero-based index of the last page, 0 when there are no rows"""
+    return (total_rows - 1) // page_size if total_rows > 0 and page_size > 0 else 0
+
+def result_column_values(rows, column):
+    """Return every value of one column of a result from fetch_result_rows"""
+    if isinstance(rows, list):
+        return [row[column] if column < len(row) else None for row in rows]
+    try:
+        return rows.column(column).to_pylist()
+    except (ValueError, OverflowError, pa.ArrowException):
+        return [row[0] for row in arrow_rows_via_duckdb(rows.select([column]))]
+
+def categorize_repeated_strings(df, max_unique_ratio=0.5):
+    """Convert text columns with mostly repeated values to pandas categoricals, in place.
+    
+    Categories store each distinct string once, which keeps large dashboard frames small.
+    """
+    # By position, since a repeated column name (select a.id, b.id) selects a DataFrame.
+    # pandas 3 gives text its own str dtype, older versions store it as object
+    for position, dtype in enumerate(df.dtypes):
+        if not pd.api.types.is_string_dtype(dtype) and dtype != object:
+            continue
+        values = df.iloc[:, position]
+        try:
+            unique_count = values.nunique(dropna=True)
+        except TypeError:
+            # LIST and STRUCT values (arrays, lists, dicts) can't be hashed into categories
+            continue
+        if unique_count < max_unique_ratio * len(values):
+            df.isetitem(position, values.astype('category'))
+    return df
+
+def fetch_column_lists(result, *column_names):
+    """Fetch a DuckDB result as one Python list per named column.
+    
+    Uses a bulk Arrow conversion when pyarrow is available instead of building row tuples.
+    """
+    if PARQUET_AVAILABLE:
+        table = fetch_arrow(result)
+        return [table.column(name).to_pylist() for name in column_names]
+    
+    rows = result.fetchall()
+    if not rows:
+        return [[] for _ in column_names]
+    return [list(values) for values in zip(*rows)]
+
+def rows_to_polars(columns, rows):
+    """Build a Polars DataFrame from result column names and row tuples.
+    
+    Raises instead of silently dropping columns when names repeat (e.g. ``select a.id, b.id``).
+    """
+    return pl.DataFrame([pl.Series(column, [row[i] for row in rows]) for i, column in enumerate(columns)])
+
+class ResultClipboardCopyThread(QThread):
+    """Thread for building whole-table clipboard text from a result already held in memory"""
+    text_ready = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    CHUNK_ROWS = 65536  # Rows turned into Python tuples at a time
+    
+    def __init__(self, columns, rows):
+        super().__init__()
+        self.columns = columns
+        self.rows = rows  # From fetch_result_rows: row tuples or an Arrow table
+        self._is_cancelled = False
+    
+    def cancel(self):
+        """Cancel the copy; the text is dropped after the current chunk"""
+        self._is_cancelled = True
+    
+    def run(self):
+        try:
+            text = rows_to_tsv(self.columns, self.row_chunks())
+            if not self._is_cancelled:
+                self.text_ready.emit(text)
+        except Exception as e:
+            if not self._is_cancelled:
+                self.error_occurred.emit(str(e))
+    
+    def row_chunks(self):
+        """Yield the rows a chunk at a time, stopping early once cancelled"""
+        for start in range(0, len(self.rows), self.CHUNK_ROWS):
+            if self._is_cancelled:
+                return
+            yield from slice_result_rows(self.rows, start, start + self.CHUNK_ROWS)
+
+class AutocompleteRefreshThread(QThread):
+    """Thread for collecting table names for autocomplete without blocking the UI"""
+    tables_ready = pyqtSignal(list, dict)  # table names, {schema node id: [table names]}
+    PAGE_SIZE = 1000  # Tables per information_schema page for attached databases
+    
+    def __init__(self, connection, active_connections):
+        super().__init__()
+        # A cursor is a separate connection to the same database, safe to use from this thread
+        self.connection = connection.cursor()
+        self.active_connections = active_connections
+    
+    def run(self):
+        table_names = set()
+        tables_by_schema = {}
         
-        # Query tab management
-        self.query_tabs = {}  # tab_index -> {sql_editor, results_table, query_thread}
-        self.tab_counter = 0
+        try:
+            # Get localdb tables
+            local_tables, = fetch_column_lists(self.connection.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_schema = 'localdb' ORDER BY table_name"
+            ), 'table_name')
+            
+            tables_by_schema['localdb'] = local_tables
+            table_names.update(local_tables)
+            table_names.update(f'localdb.{table_name}' for table_name in local_tables)
+            
+            # Get remote database tables in bounded pages
+            for db_name, connection_data in self.active_connections.items():
+                try:
+                    database_name = connection_data.get('database', '')
+                    remote_tables = self.fetch_remote_table_names(db_name, database_name)
+                    
+                    tables_by_schema[db_name] = remote_tables
+                    table_names.update(remote_tables)
+                    table_names.update(f'{db_name}.{table_name}' for table_name in remote_tables)
+                except:
+                    pass
+        except Exception as e:
+            pass  # Error updating autocomplete
+        finally:
+            self.connection.close()
         
-        # Split screen management
-        self.split_screen_active = False
-        self.split_screen_widget = None
-        self.split_query_tabs = {}  # Track split screen tabs
-        self.last_active_sql_editor = None  # Track the last active SQL editor
+        # Table names repeated across schemas are only offered once
+        self.tables_ready.emit(sorted(table_names), tables_by_schema)
+    
+    def fetch_remote_table_names(self, db_name, database_name):
+        """List every table of an attached database using keyset pagination (no OFFSET)"""
+        table_names = []
+        last_table_name = ''
+        while True:
+            page, = fetch_column_lists(self.connection.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_catalog = ? AND table_schema = ? "
+                "AND table_name > ? ORDER BY table_name LIMIT ?",
+                [db_name, database_name, last_table_name, self.PAGE_SIZE]
+            ), 'table_name')
+            table_names.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                return table_names
+            last_table_name = page[-1]
+
+def fetch_schema_columns(connection, schema_identifier, database_name=''):
+    """Return {table: [(column, data_type), ...]} for localdb or an attached database in one query"""
+    if schema_identifier == 'localdb':
+        result = connection.execute(
+            "SELECT table_name, column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = 'localdb' ORDER BY table_name, ordinal_position"
+        )
+    else:
+        result = connection.execute(
+            "SELECT table_name, column_name, data_type FROM information_schema.columns "
+            "WHERE table_catalog = ? AND table_schema = ? ORDER BY table_name, ordinal_position",
+            [schema_identifier, database_name]
+        )
+    
+    tables = {}
+    for table_name, column_name, data_type in zip(*fetch_column_lists(result, 'table_name', 'column_name', 'data_type')):
+        tables.setdefault(table_name, []).append((column_name, data_type))
+    return tables
+
+class SchemaLoadThread(QThread):
+    """Thread for loading a schema's tables and columns for the schema tree"""
+    schema_loaded = pyqtSignal(str, dict)  # schema identifier, {table: [(column, data_type), ...]}
+    
+    def __init__(self, connection, schema_identifier, database_name):
+        super().__init__()
+        # A cursor is a separate connection to the same database, safe to use from this thread
+        self.connection = connection.cursor()
+        self.schema_identifier = schema_identifier
+        self.database_name = database_name
+    
+    def run(self):
+        try:
+            tables = fetch_schema_columns(self.connection, self.schema_identifier, self.database_name)
+        except Exception:
+            tables = {}  # Error loading tables
+        finally:
+            self.connection.close()
+        self.schema_loaded.emit(self.schema_identifier, tables)
+
+class SchemaNode:
+    """Node of the schema tree: a schema, table or column"""
+    __slots__ = ('name', 'kind', 'detail', 'identifier', 'parent', 'row', 'children')
+    
+    def __init__(self, name, kind, detail='', identifier=None, parent=None, row=0):
+        self.name = name
+        self.kind = kind
+        self.detail = detail
+        self.identifier = identifier  # e.g. 'localdb' or 'localdb.table_name'
+        self.parent = parent
+        self.row = row
+        # Schemas and tables load their children on first expand (None = not fetched yet)
+        self.children = None if kind in ('schema', 'table') else []
+
+class SchemaTreeModel(QAbstractItemModel):
+    """Item model for the schema tree; children are fetched lazily through fetchMore"""
+    HEADERS = ['Schema/Table', 'Type', 'Rows']
+    
+    def __init__(self, children_loader, parent=None):
+        super().__init__(parent)
+        self.children_loader = children_loader  # node -> [(name, kind, detail, identifier), ...]
+        self.root = SchemaNode('', 'root')
+        self.root.children = []
+    
+    def set_schemas(self, schemas):
+        """Replace the top-level nodes with [(label, identifier), ...]"""
+        self.beginResetModel()
+        self.root.children = [
+            SchemaNode(label, 'schema', '', identifier, self.root, row)
+            for row, (label, identifier) in enumerate(schemas)
+        ]
+        self.endResetModel()
+    
+    def node_from_index(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+    
+    def index(self, row, column, parent=QModelIndex()):
+        children = self.node_from_index(parent).children or []
+        if not (0 <= row < len(children)) or not (0 <= column < len(self.HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self.root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node_from_index(parent).children or [])
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def hasChildren(self, parent=QModelIndex()):
+        # Unfetched schemas and tables stay expandable until they are loaded
+        children = self.node_from_index(parent).children
+        return children is None or bool(children)
+    
+    def canFetchMore(self, parent):
+        return parent.isValid() and self.node_from_index(parent).children is None
+    
+    def fetchMore(self, parent):
+        node = self.node_from_index(parent)
+        if node.children is not None:
+            return
+        rows = self.children_loader(node)
+        node.children = []
+        if rows is None:
+            # Loading in the background; show a placeholder until set_children is called
+            rows = [('Loading...', 'placeholder', '', None)]
+        self.insert_children(parent, node, rows)
+    
+    def insert_children(self, parent, node, rows):
+        if not rows:
+            return
+        self.beginInsertRows(parent, 0, len(rows) - 1)
+        node.children = [
+            SchemaNode(name, kind, detail, identifier, node, row)
+            for row, (name, kind, detail, identifier) in enumerate(rows)
+        ]
+        self.endInsertRows()
+    
+    def schema_node(self, schema_identifier):
+        """Return the top-level node of a schema, or None if the tree no longer has it"""
+        for node in self.root.children:
+            if node.kind == 'schema' and node.identifier == schema_identifier:
+                return node
+        return None
+    
+    @staticmethod
+    def is_loading(node):
+        """Whether a node was expanded and still shows the loading placeholder"""
+        return bool(node.children) and node.children[0].kind == 'placeholder'
+    
+    def set_children(self, node, rows):
+        """Replace the children of a node once they have been loaded"""
+        parent = self.createIndex(node.row, 0, node)
+        if node.children:
+            self.beginRemoveRows(parent, 0, len(node.children) - 1)
+            node.children = []
+            self.endRemoveRows()
+        node.children = []
+        self.insert_children(parent, node, rows or [])
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return (node.name, node.kind, node.detail)[index.column()]
+        if role == Qt.UserRole and index.column() == 0:
+            return node.identifier
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+THEMES = {
+    'light': {
+        'background': '#ffffff',
+        'text': '#000000',
+        'button': '#f0f0f0',
+        'button_hover': '#e0e0e0',
+        'input': '#ffffff',
+        'border': '#cccccc',
+        'selection': '#0078d4',
+        'menu': '#ffffff',
+        'menu_hover': '#e0e0e0'
+    },
+    'dark': {
+        'background': '#2b2b2b',
+        'text': '#ffffff',
+        'button': '#404040',
+        'button_hover': '#505050',
+        'input': '#3c3c3c',
+        'border': '#555555',
+        'selection': '#0078d4',
+        'menu': '#2b2b2b',
+        'menu_hover': '#404040'
+    },
+    'blue': {
+        'background': '#1e3a5f',
+        'text': '#ffffff',
+        'button': '#2c5282',
+        'button_hover': '#3c6382',
+        'input': '#2a4a6b',
+        'border': '#4a6fa5',
+        'selection': '#63b3ed',
+        'menu': '#1e3a5f',
+        'menu_hover': '#2c5282'
+    },
+    'green': {
+        'background': '#1a4d3a',
+        'text': '#ffffff',
+        'button': '#2d7d32',
+        'button_hover': '#388e3c',
+        'input': '#2e5d3e',
+        'border': '#4caf50',
+        'selection': '#81c784',
+        'menu': '#1a4d3a',
+        'menu_hover': '#2d7d32'
+    },
+    'high_contrast': {
+        'background': '#000000',
+        'text': '#ffffff',
+        'button': '#ffffff',
+        'button_hover': '#ffff00',
+        'button_text': '#000000',
+        'button_hover_text': '#000000',
+        'input': '#000000',
+        'input_text': '#ffffff',
+        'border': '#ffffff',
+        'selection': '#ffff00',
+        'selection_text': '#000000',
+        'menu': '#000000',
+        'menu_hover': '#ffff00',
+        'menu_hover_text': '#000000'
+    }
+}
+
+# Only high contrast sets its own foreground colors; every other theme uses its text color
+for _theme in THEMES.values():
+    for _key in ('button_text', 'button_hover_text', 'input_text', 'selection_text', 'menu_hover_text'):
+        _theme.setdefault(_key, _theme['text'])
+del _theme, _key
+
+# Application stylesheet, filled in with a resolved theme by compiled_stylesheet
+_THEME_TEMPLATE = """
+        QMainWindow {{
+            background-color: {background};
+            color: {text};
+        }}
         
-        self.init_ui()
+        QWidget {{
+            background-color: {background};
+            color: {text};
+        }}
         
-        # Initialize theme system
-        self.current_theme = 'light'
-        self.load_theme_preference()
+        QPushButton {{
+            background-color: {button};
+            color: {button_text};
+            border: 2px solid {border};
+            padding: 5px 10px;
+            border-radius: 3px;
+            font-weight: bold;
+        }}
         
-
+        QPushButton:hover {{
+            background-color: {button_hover};
+            color: {button_hover_text};
+            border: 2px solid {border};
+        }}
         
-    def init_ui(self):
-        self.setWindowTitle('DuckDB SQL Query Application')
-        self.setGeometry(100, 100, 1200, 800)
+        QPushButton:pressed {{
+            background-color: {border};
+            color: {button_hover_text};
+        }}
         
-        # Create menu bar
-        self.create_menu_bar()
+        QLineEdit, QTextEdit, QPlainTextEdit {{
+            background-color: {input};
+            color: {input_text};
+            border: 2px solid {border};
+            padding: 3px;
+            border-radius: 2px;
+        }}
         
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        QTreeView {{
+            background-color: {input};
+            color: {input_text};
+            border: 2px solid {border};
+            selection-background-color: {selection};
+            selection-color: {selection_text};
+        }}
         
-        # Main layout with no margins to use full space
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(5, 5, 5, 5)
+        QTableView {{
+            background-color: {input};
+            color: {input_text};
+            border: 2px solid {border};
+            gridline-color: {border};
+            selection-background-color: {selection};
+            selection-color: {selection_text};
+        }}
         
-        # Create horizontal splitter for main content and schema tree
-        main_splitter = QSplitter(Qt.Horizontal)
+        QHeaderView::section {{
+            background-color: {button};
+            color: {button_text};
+            border: 2px solid {border};
+            padding: 3px;
+            font-weight: bold;
+        }}
         
-        # Left side container for tabbed queries
-        left_widget = QWidget()
-        left_layout = QVBoxLayout(left_widget)
+        QMenuBar {{
+            background-color: {menu};
+            color: {text};
+            border-bottom: 2px solid {border};
+        }}
         
-        # Create tab widget for multiple queries
-        self.query_tab_widget = QTabWidget()
-        self.query_tab_widget.setTabsClosable(False)  # We'll use custom close buttons
+        QMenuBar::item {{
+            background-color: transparent;
+            padding: 4px 8px;
+            color: {text};
+        }}
         
-        # Add initial query tab
-        self.add_new_query_tab()
+        QMenuBar::item:selected {{
+            background-color: {menu_hover};
+            color: {menu_hover_text};
+        }}
         
-        left_layout.addWidget(self.query_tab_widget)
+        QMenu {{
+            background-color: {menu};
+            color: {text};
+            border: 2px solid {border};
+        }}
         
-        # Database schema tree view (left side)
+        QMenu::item {{
+            padding: 4px 20px;
+            color: {text};
+        }}
+        
+        QMenu::item:selected {{
+            background-color: {menu_hover};
+            color: {menu_hover_text};
+        }}
+        
+        QGroupBox {{
+            color: {text};
+            border: 2px solid {border};
+            border-radius: 3px;
+            margin-top: 10px;
+            font-weight: bold;
+        }}
+        
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+            color: {text};
+        }}
+        
+        QLabel {{
+            color: {text};
+            font-weight: bold;
+        }}
+        
+        QComboBox {{
+            background-color: {input};
+            color: {input_text};
+            border: 2px solid {border};
+            padding: 3px;
+            border-radius: 2px;
+            font-weight: bold;
+        }}
+        
+        QComboBox::drop-down {{
+            border: none;
+            background-color: {button};
+        }}
+        
+        QComboBox::down-arrow {{
+            border: none;
+            color: {button_text};
+        }}
+        
+        QScrollBar:vertical {{
+            background-color: {background};
+            width: 15px;
+            border: 2px solid {border};
+        }}
+        
+        QScrollBar::handle:vertical {{
+            background-color: {button};
+            border-radius: 3px;
+            border: 1px solid {border};
+            min-height: 20px;
+        }}
+        
+        QScrollBar::handle:vertical:hover {{
+            background-color: {button_hover};
+        }}
+        
+        QScrollBar::add-line:vertical {{
+            background-color: {button};
+            height: 15px;
+            border: 1px solid {border};
+            subcontrol-position: bottom;
+            subcontrol-origin: margin;
+        }}
+        
+        QScrollBar::sub-line:vertical {{
+            background-color: {button};
+            height: 15px;
+            border: 1px solid {border};
+            subcontrol-position: top;
+            subcontrol-origin: margin;
+        }}
+        
+        QScrollBar::add-line:vertical:hover, QScrollBar::sub-line:vertical:hover {{
+            background-color: {button_hover};
+        }}
+        
+        QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {{
+            width: 8px;
+            height: 8px;
+            background-color: {button_text};
+        }}
+        
+        QScrollBar:horizontal {{
+            background-color: {background};
+            height: 15px;
+            border: 2px solid {border};
+        }}
+        
+        QScrollBar::handle:horizontal {{
+            background-color: {button};
+            border-radius: 3px;
+            border: 1px solid {border};
+            min-width: 20px;
+        }}
+        
+        QScrollBar::handle:horizontal:hover {{
+            background-color: {button_hover};
+        }}
+        
+        QScrollBar::add-line:horizontal {{
+            background-color: {button};
+            width: 15px;
+            border: 1px solid {border};
+            subcontrol-position: right;
+            subcontrol-origin: margin;
+        }}
+        
+        QScrollBar::sub-line:horizontal {{
+            background-color: {button};
+            width: 15px;
+            border: 1px solid {border};
+            subcontrol-position: left;
+            subcontrol-origin: margin;
+        }}
+        
+        QScrollBar::add-line:horizontal:hover, QScrollBar::sub-line:horizontal:hover {{
+            background-color: {button_hover};
+        }}
+        
+        QScrollBar::left-arrow:horizontal, QScrollBar::right-arrow:horizontal {{
+            width: 8px;
+            height: 8px;
+            background-color: {button_text};
+        }}
+        
+        QDialog {{
+            background-color: {background};
+            color: {text};
+            border: 2px solid {border};
+        }}
+        
+        QRadioButton {{
+            color: {text};
+            font-weight: bold;
+        }}
+        
+        QRadioButton::indicator {{
+            width: 15px;
+            height: 15px;
+            border: 2px solid {border};
+            border-radius: 8px;
+            background-color: {input};
+        }}
+        
+        QRadioButton::indicator:checked {{
+            background-color: {selection};
+            border: 2px solid {border};
+        }}
+        
+        QTabWidget::pane {{
+            border: 2px solid {border};
+            background-color: {background};
+        }}
+        
+        QTabBar::tab {{
+            background-color: {button};
+            color: {button_text};
+            border: 2px solid {border};
+            padding: 8px 12px;
+            margin-right: 2px;
+            border-bottom: none;
+            font-weight: bold;
+            min-width: 80px;
+            max-width: 200px;
+        }}
+        
+        QTabBar::tab:selected {{
+            background-color: {background};
+            color: {text};
+            border-bottom: 2px solid {background};
+        }}
+        
+        QTabBar::tab:hover {{
+            background-color: {button_hover};
+            color: {button_hover_text};
+        }}
+        
+        QTabBar::close-button {{
+            background-color: {button};
+            color: {button_text};
+            border: 1px solid {border};
+            border-radius: 2px;
+            width: 16px;
+            height: 16px;
+            margin: 2px;
+            font-weight: bold;
+            font-size: 12px;
+            subcontrol-position: right;
+        }}
+        
+        QTabBar::close-button:hover {{
+            background-color: {selection};
+            color: {selection_text};
+            border: 1px solid {text};
+        }}
+        
+        QTabBar::close-button:pressed {{
+            background-color: {border};
+            color: {button_hover_text};
+        }}
+        """
+
+@lru_cache(maxsize=8)
+def compiled_stylesheet(theme_name):
+    """Return the application stylesheet for a theme, formatted once per theme"""
+    return _THEME_TEMPLATE.format_map(THEMES[theme_name])
+
+_CLOSE_BUTTON_TEMPLATE = """
+            QPushButton {{
+                background-color: transparent;
+                border: none;
+                color: {text};
+                font-weight: bold;
+                font-size: 12px;
+            }}
+            QPushButton:hover {{
+                background-color: red;
+                color: white;
+                border-radius: 8px;
+            }}
+        """
+
+@lru_cache(maxsize=8)
+def close_button_stylesheet(theme_name):
+    """Return the stylesheet for the tab close buttons in a theme, formatted once per theme"""
+    return _CLOSE_BUTTON_TEMPLATE.format_map(THEMES[theme_name])
+
+class QueryTabStates(Mapping):
+    """Tab index -> tab state view over a QTabWidget whose pages carry their own state.
+    
+    Indices are resolved when looked up, so closing or moving a tab never
+    leaves the remaining tabs keyed by a stale index.
+    """
+    
+    def __init__(self, tab_widget):
+        self.tab_widget = tab_widget
+    
+    def __getitem__(self, index):
+        page = self.tab_widget.widget(index) if isinstance(index, int) and index >= 0 else None
+        state = getattr(page, 'tab_state', None)
+        if state is None:
+            raise KeyError(index)
+        return state
+    
+    def __iter__(self):
+        for index in range(self.tab_widget.count()):
+            if getattr(self.tab_widget.widget(index), 'tab_state', None) is not None:
+                yield index
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+
+class ResultTableModel(QAbstractTableModel):
+    """Read-only model over result rows; cell text is only built for the cells a view asks for"""
+    
+    def __init__(self, parent=None, formatter=_cell_str):
+        super().__init__(parent)
+        self.formatter = formatter  # value -> display text
+        self.columns = []
+        self.rows = []
+    
+    def set_rows(self, columns, rows):
+        """Replace the displayed columns and rows (a sequence of row tuples)"""
+        self.beginResetModel()
+        self.columns = list(columns)
+        self.rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            row = self.rows[index.row()]
+            column = index.column()
+            return self.formatter(row[column]) if column < len(row) else ''
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section] if section < len(self.columns) else None
+        return str(section + 1)
+    
+    def column_name(self, column):
+        """Return the header text of a column, or None when there is no such column"""
+        return str(self.columns[column]) if 0 <= column < len(self.columns) else None
+    
+    def row_text(self, row):
+        """Return the display text of every cell in one row"""
+        return [_cell_str(value) for value in self.rows[row]]
+
+class DuckDBSQLApp(QMainWindow):
+    RESULT_WIDGET_POOL_SIZE = 32  # Multi-query result tabs kept for reuse
+    COLUMN_FIT_SAMPLE_ROWS = 50  # Rows measured when fitting result columns to their contents
+    MULTI_QUERY_PAGE_CACHE_SIZE = 5  # Converted pages kept per multi-query result tab
+    
+    def __init__(self):
+        super().__init__()
+        self.connection = duckdb.connect(':memory:')
+        # Create the localdb schema
+        self.connection.execute("CREATE SCHEMA IF NOT EXISTS localdb")
+        self.loaded_tables = {}  # filename -> table_name mapping
+        self._schema_cache = {}  # schema node id -> {table: [(column, data_type), ...]}
+        self._schema_load_threads = {}  # (schema node id, cache generation) -> SchemaLoadThread in flight
+        self._schema_generation = 0  # Bumped whenever cached schema metadata is invalidated
+        self._dashboard_export_threads = set()  # ParquetExportThreads in flight
+        self._clipboard_copy_threads = set()  # ClipboardCopyThreads in flight
+        self._clipboard = QApplication.clipboard()  # Application-wide singleton, looked up once
+        self._eel_thread = None  # Runs every Eel dashboard, see launch_eel_dashboard
+        self._eel_requests = queue.Queue()  # (DataFrame, title) waiting for the Eel thread
+        self._retired_streaming_threads = set()  # Cancelled streaming threads that are still winding down
+        self._result_widget_pool = []  # Hidden multi-query result widgets, see _acquire_multi_query_result_widget
+        
+        # Autocomplete table name cache (filled by AutocompleteRefreshThread)
+        self._cached_table_names = []  # Sorted once, shared by every editor
+        self._cached_table_hash = None
+        self._cached_tables_by_schema = {}
+        self._cache_timestamp = 0
+        self._autocomplete_thread = None  # Refresh in flight
+        self._autocomplete_rerun = False  # Cache went stale while a refresh was in flight
+        
+        # Connection storage file
+        self.connections_file = 'db_connections.json'
+        self.saved_connections = self.load_saved_connections()
+        self._saved_connection_names = {conn['name'] for conn in self.saved_connections}
+        self.active_connections = {}  # Store multiple active connections: {db_name: connection_data}
+        
+        # Query tab management
+        self.tab_counter = 0
+        
+        # Split screen management
+        self.split_screen_active = False
+        self.split_screen_widget = None
+        self.split_query_tabs = weakref.WeakKeyDictionary()  # Track split screen tabs: tab_widget -> {tab_index: tab data}
+        self.last_active_sql_editor = None  # Track the last active SQL editor
+        self._close_button_style = close_button_stylesheet('light')  # Tabs created before the theme loads
+        
+        self.init_ui()
+        
+        # Initialize theme system
+        self.current_theme = 'light'
+        self._applied_stylesheet = None  # Last compiled_stylesheet() result passed to setStyleSheet
+        self._config_cache = {}  # Parsed config.json, written back by _flush_config
+        self._config_flush_pending = False
+        self.load_theme_preference()
+        
+
+        
+    def init_ui(self):
+        self.setWindowTitle('DuckDB SQL Query Application')
+        self.setGeometry(100, 100, 1200, 800)
+        
+        # Create menu bar
+        self.create_menu_bar()
+        
+        # Central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Main layout with no margins to use full space
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(5, 5, 5, 5)
+        
+        # Create horizontal splitter for main content and schema tree
+        main_splitter = QSplitter(Qt.Horizontal)
+        
+        # Left side container for tabbed queries
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        
+        # Create tab widget for multiple queries
+        self.query_tab_widget = QTabWidget()
+        self.query_tabs = QueryTabStates(self.query_tab_widget)  # tab_index -> {sql_editor, results_table, query_thread}
+        self.query_tab_widget.setTabsClosable(False)  # We'll use custom close buttons
+        
+        # Add initial query tab
+        self.add_new_query_tab()
+        
+        left_layout.addWidget(self.query_tab_widget)
+        
+        # Database schema tree view (left side)
         schema_group = QGroupBox('Database Schema')
         schema_layout = QVBoxLayout(schema_group)
         
-        self.schema_tree = QTreeWidget()
-        self.schema_tree.setHeaderLabels(['Schema/Table', 'Type', 'Rows'])
+        # Model-backed tree: tables and columns are only fetched when a node is expanded
+        self.schema_model = SchemaTreeModel(self.load_schema_children, self)
+        self.schema_tree = QTreeView()
+        self.schema_tree.setModel(self.schema_model)
         self.schema_tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.schema_tree.itemDoubleClicked.connect(self.on_table_double_click)
+        self.schema_tree.doubleClicked.connect(self.on_table_double_click)
         self.schema_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.schema_tree.customContextMenuRequested.connect(self.show_schema_context_menu)
-        self.schema_tree.itemExpanded.connect(self.on_schema_item_expanded)
         self.refresh_schema_tree()
         
         schema_layout.addWidget(self.schema_tree)
@@ -1981,7 +3121,7 @@ class DuckDBSQLApp(QMainWindow):
             default_table_name = os.path.splitext(filename)[0]
             
             # Clean default table name (remove special characters)
-            default_table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in default_table_name)
+            default_table_name = _SANITIZE_RE.sub('_', default_table_name)
             
             # Prompt user for table name
             table_name, ok = QInputDialog.getText(
@@ -1995,11 +3135,12 @@ class DuckDBSQLApp(QMainWindow):
             
             # Clean the user-provided table name
             table_name = table_name.strip()
-            table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in table_name)
+            table_name = _SANITIZE_RE.sub('_', table_name)
             
             # Determine file type and load accordingly
             file_ext = os.path.splitext(file_path)[1].lower()
             delimiter_info = ""  # For success message
+            conversion_error_occurred = False
             
             if file_ext == '.csv':
                 # Show delimiter selection dialog
@@ -2021,16 +3162,16 @@ class DuckDBSQLApp(QMainWindow):
                     escaped_delimiter = delimiter.replace("'", "''")
                     
                     # Use DuckDB's read_csv with specified delimiter
-                    query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_csv('{file_path}', delim='{escaped_delimiter}')"
+                    source = f"read_csv('{file_path}', delim='{escaped_delimiter}')"
                 else:
                     # User cancelled the dialog
                     return
             elif file_ext == '.parquet':
-                query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_parquet('{file_path}')"
+                source = f"read_parquet('{file_path}')"
             elif file_ext in ['.json', '.jsonl']:
-                query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_json_auto('{file_path}')"
+                source = f"read_json_auto('{file_path}')"
             elif file_ext == '.tsv':
-                query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_csv_auto('{file_path}', delim='\t')"
+                source = f"read_csv_auto('{file_path}', delim='\t')"
                 delimiter_info = " (delimiter: tab)"
             elif file_ext in ['.xlsx', '.xls']:
                 # Handle Excel files using Polars with sheet selection dialog
@@ -2055,8 +3196,14 @@ class DuckDBSQLApp(QMainWindow):
                     df = df.rename({col: col.strip() for col in df.columns})
                     
                     # Convert Polars DataFrame to DuckDB table
-                    self.connection.execute(f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT * FROM df")
-                    query = None  # Skip the normal query execution since we already loaded the data
+                    try:
+                        self.create_table_from_frame(table_name, df)
+                    except Exception:
+                        # Type conflicts: cast the frame already in memory to text instead of re-reading the file
+                        df_str = df.with_columns([pl.col(col).cast(pl.Utf8) for col in df.columns])
+                        self.create_table_from_frame(table_name, df_str)
+                        conversion_error_occurred = True
+                    source = None  # Skip the normal load since we already loaded the data
                     
                 except Exception as excel_error:
                     raise ValueError(f"Error loading Excel file: {str(excel_error)}")
@@ -2071,38 +3218,10 @@ class DuckDBSQLApp(QMainWindow):
                 raise ValueError(f"Unsupported file format: {file_ext}")
             
             # Execute the load query with error handling for type conversion
-            conversion_error_occurred = False
-            needs_column_rename = file_ext in ['.csv', '.tsv', '.parquet', '.json', '.jsonl']
-            
-            if query is not None:  # Skip execution for Excel files (already loaded)
+            if source is not None:  # Skip execution for Excel files (already loaded)
                 try:
-                    self.connection.execute(query)
-                    
-                    # Strip leading and trailing spaces from column names for CSV/TSV/Parquet/JSON
-                    if needs_column_rename:
-                        # Get column names from temp table
-                        columns_result = self.connection.execute(
-                            f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table_name}_temp' AND table_schema = 'localdb' ORDER BY ordinal_position"
-                        ).fetchall()
-                        
-                        # Build SELECT with renamed columns
-                        renamed_columns = []
-                        for col_tuple in columns_result:
-                            col_name = col_tuple[0]
-                            stripped_name = col_name.strip()
-                            if col_name != stripped_name:
-                                # Column needs renaming - use AS clause
-                                renamed_columns.append(f'"{col_name}" AS "{stripped_name}"')
-                            else:
-                                # Column is fine as-is
-                                renamed_columns.append(f'"{col_name}"')
-                        
-                        # Create final table with renamed columns
-                        rename_query = f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT {', '.join(renamed_columns)} FROM localdb.{table_name}_temp"
-                        self.connection.execute(rename_query)
-                        
-                        # Drop temp table
-                        self.connection.execute(f"DROP TABLE IF EXISTS localdb.{table_name}_temp")
+                    # Single pass: column names are stripped of leading/trailing spaces in the projection
+                    self.create_table_from_source(table_name, source)
                 except Exception as load_error:
                     # Check if it's a type conversion error
                     error_msg = str(load_error).lower()
@@ -2111,63 +3230,24 @@ class DuckDBSQLApp(QMainWindow):
                         # Retry with all columns as VARCHAR/text
                         try:
                             if file_ext == '.csv':
-                                # For CSV files, use all_varchar option
+                                # For CSV files, read everything as text in a single pass and skip malformed rows
                                 escaped_delimiter = delimiter.replace("'", "''")
-                                query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_csv('{file_path}', delim='{escaped_delimiter}', all_varchar=true)"
+                                source = f"read_csv_auto('{file_path}', delim='{escaped_delimiter}', header=true, all_varchar=true, ignore_errors=true)"
+                                cast_varchar = False
                             elif file_ext == '.parquet':
-                                # For Parquet, we can't force all varchar, so we'll try with union_by_name
-                                query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_parquet('{file_path}', union_by_name=true)"
+                                # Parquet has no all_varchar option, so cast every column to text on read
+                                source = f"read_parquet('{file_path}', union_by_name=true)"
+                                cast_varchar = True
                             elif file_ext in ['.json', '.jsonl']:
-                                # For JSON, try with union_by_name and ignore_errors
-                                query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_json_auto('{file_path}', union_by_name=true, ignore_errors=true)"
+                                # For JSON, try with union_by_name and ignore_errors and cast every column to text
+                                source = f"read_json_auto('{file_path}', union_by_name=true, ignore_errors=true)"
+                                cast_varchar = True
                             elif file_ext == '.tsv':
-                                 # For TSV files, use all_varchar option
-                                 query = f"CREATE OR REPLACE TABLE localdb.{table_name}_temp AS SELECT * FROM read_csv_auto('{file_path}', delim='\t', all_varchar=true)"
-                            elif file_ext in ['.xlsx', '.xls']:
-                                # For Excel files, try to reload with string conversion
-                                try:
-                                    if sheet_name:
-                                        df = pl.read_excel(file_path, sheet_name=sheet_name, read_csv_options={"dtypes": str})
-                                    else:
-                                        df = pl.read_excel(file_path, read_csv_options={"dtypes": str})
-                                    # Strip leading and trailing spaces from column names
-                                    df = df.rename({col: col.strip() for col in df.columns})
-                                    self.connection.execute(f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT * FROM df")
-                                except:
-                                    # If that fails too, just convert all columns to string after loading
-                                    # Strip leading and trailing spaces from column names
-                                    df = df.rename({col: col.strip() for col in df.columns})
-                                    df_str = df.with_columns([pl.col(col).cast(pl.Utf8) for col in df.columns])
-                                    self.connection.execute(f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT * FROM df_str")
+                                # For TSV files, read everything as text in a single pass and skip malformed rows
+                                source = f"read_csv_auto('{file_path}', delim='\t', header=true, all_varchar=true, ignore_errors=true)"
+                                cast_varchar = False
                             
-                            if file_ext not in ['.xlsx', '.xls']:  # Only execute query for non-Excel files
-                                self.connection.execute(query)
-                                
-                                # Strip leading and trailing spaces from column names for CSV/TSV/Parquet/JSON
-                                if file_ext in ['.csv', '.tsv', '.parquet', '.json', '.jsonl']:
-                                    # Get column names from temp table
-                                    columns_result = self.connection.execute(
-                                        f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table_name}_temp' AND table_schema = 'localdb' ORDER BY ordinal_position"
-                                    ).fetchall()
-                                    
-                                    # Build SELECT with renamed columns
-                                    renamed_columns = []
-                                    for col_tuple in columns_result:
-                                        col_name = col_tuple[0]
-                                        stripped_name = col_name.strip()
-                                        if col_name != stripped_name:
-                                            # Column needs renaming - use AS clause
-                                            renamed_columns.append(f'"{col_name}" AS "{stripped_name}"')
-                                        else:
-                                            # Column is fine as-is
-                                            renamed_columns.append(f'"{col_name}"')
-                                    
-                                    # Create final table with renamed columns
-                                    rename_query = f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT {', '.join(renamed_columns)} FROM localdb.{table_name}_temp"
-                                    self.connection.execute(rename_query)
-                                    
-                                    # Drop temp table
-                                    self.connection.execute(f"DROP TABLE IF EXISTS localdb.{table_name}_temp")
+                            self.create_table_from_source(table_name, source, cast_varchar)
                         except Exception as retry_error:
                             # If retry also fails, show the original error
                             raise load_error
@@ -2178,12 +3258,11 @@ class DuckDBSQLApp(QMainWindow):
             # Store the mapping
             self.loaded_tables[filename] = table_name
             
-            # Get row count
-            count_result = self.connection.execute(f"SELECT COUNT(*) FROM localdb.{table_name}").fetchone()
-            row_count = count_result[0]
+            # Get row count from table statistics (avoids a full COUNT(*) scan)
+            row_count = self.get_table_row_estimate(table_name)
             
             # Refresh the schema tree to show the new table
-            self.refresh_schema_tree()
+            self.schedule_schema_refresh()
             
             # Show success message with conversion info if applicable
             success_msg = f'Successfully loaded {filename} as localdb.{table_name}{delimiter_info}'
@@ -2203,6 +3282,42 @@ class DuckDBSQLApp(QMainWindow):
             QMessageBox.critical(self, 'Error Loading File', f'Failed to load file:\n{str(e)}')
             self.status_label.setText('Error loading file')
     
+    def create_table_from_frame(self, table_name, df):
+        """Create localdb.<table> from a Polars DataFrame via its Arrow buffers"""
+        # Registering the Arrow table explicitly avoids DuckDB's Python-scope lookup
+        # and lets it scan the Polars buffers without an intermediate copy
+        self.connection.register('polars_tmp', df.to_arrow())
+        try:
+            self.connection.execute(f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT * FROM polars_tmp")
+        finally:
+            self.connection.unregister('polars_tmp')
+    
+    def create_table_from_source(self, table_name, source, cast_varchar=False):
+        """Create localdb.<table> from a DuckDB table function in a single pass.
+        
+        Column names are stripped of leading and trailing spaces in the projection,
+        and every column is cast to VARCHAR when cast_varchar is set.
+        """
+        # LIMIT 0 only binds the reader, so this is a cheap header/schema sniff
+        columns = [col[0] for col in self.connection.execute(
+            f"SELECT * FROM {source} LIMIT 0"
+        ).description]
+        
+        select_list = []
+        for col_name in columns:
+            stripped_name = col_name.strip()
+            expression = f'CAST("{col_name}" AS VARCHAR)' if cast_varchar else f'"{col_name}"'
+            if cast_varchar or col_name != stripped_name:
+                # Column needs renaming (or a cast) - use AS clause
+                select_list.append(f'{expression} AS "{stripped_name}"')
+            else:
+                # Column is fine as-is
+                select_list.append(expression)
+        
+        self.connection.execute(
+            f"CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT {', '.join(select_list)} FROM {source}"
+        )
+    
     def open_pdf_viewer(self, file_path):
         """Open PDF file in the current query tab's result area"""
         if not PDF_AVAILABLE:
@@ -2226,10 +3341,8 @@ class DuckDBSQLApp(QMainWindow):
             # Hide the results table
             results_table.setVisible(False)
             
-            # Get the results group widget (parent of results_table)
-            results_group = results_table.parent()
-            while results_group and not isinstance(results_group, QGroupBox):
-                results_group = results_group.parent()
+            # Results group box stored when the tab was created
+            results_group = tab_data['results_group']
             
             if results_group:
                 # Update the group box title
@@ -2239,7 +3352,7 @@ class DuckDBSQLApp(QMainWindow):
                 results_layout = results_group.layout()
                 
                 # Create PDF viewer widget if it doesn't exist
-                if not hasattr(tab_data, 'pdf_viewer') or tab_data.get('pdf_viewer') is None:
+                if tab_data.get('pdf_viewer') is None:
                     pdf_viewer = PDFViewer()
                     tab_data['pdf_viewer'] = pdf_viewer
                     # Insert PDF viewer before the results table
@@ -2251,18 +3364,7 @@ class DuckDBSQLApp(QMainWindow):
                 pdf_viewer.setVisible(True)
                 if pdf_viewer.load_pdf(file_path):
                     # Hide pagination controls when showing PDF
-                    if 'page_info_label' in tab_data:
-                        tab_data['page_info_label'].setVisible(False)
-                    if 'first_page_btn' in tab_data:
-                        tab_data['first_page_btn'].setVisible(False)
-                    if 'prev_page_btn' in tab_data:
-                        tab_data['prev_page_btn'].setVisible(False)
-                    if 'next_page_btn' in tab_data:
-                        tab_data['next_page_btn'].setVisible(False)
-                    if 'last_page_btn' in tab_data:
-                        tab_data['last_page_btn'].setVisible(False)
-                    if 'page_size_combo' in tab_data:
-                        tab_data['page_size_combo'].setVisible(False)
+                    tab_data['pagination_container'].setVisible(False)
                     
                     self.status_label.setText(f'Opened PDF: {os.path.basename(file_path)}')
                 else:
@@ -2296,26 +3398,10 @@ class DuckDBSQLApp(QMainWindow):
             tab_data['pdf_viewer'].setVisible(False)
         
         # Show pagination controls
-        if 'page_info_label' in tab_data:
-            tab_data['page_info_label'].setVisible(True)
-        if 'first_page_btn' in tab_data:
-            tab_data['first_page_btn'].setVisible(True)
-        if 'prev_page_btn' in tab_data:
-            tab_data['prev_page_btn'].setVisible(True)
-        if 'next_page_btn' in tab_data:
-            tab_data['next_page_btn'].setVisible(True)
-        if 'last_page_btn' in tab_data:
-            tab_data['last_page_btn'].setVisible(True)
-        if 'page_size_combo' in tab_data:
-            tab_data['page_size_combo'].setVisible(True)
+        tab_data['pagination_container'].setVisible(True)
         
         # Restore group box title
-        results_group = results_table.parent()
-        while results_group and not isinstance(results_group, QGroupBox):
-            results_group = results_group.parent()
-        
-        if results_group:
-            results_group.setTitle('Query Results')
+        tab_data['results_group'].setTitle('Query Results')
         
         self.status_label.setText('Restored query results view')
     
@@ -2342,7 +3428,7 @@ class DuckDBSQLApp(QMainWindow):
             # Prompt user for table name
             folder_name = os.path.basename(folder_path)
             default_table_name = f'{folder_name}_combined'
-            default_table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in default_table_name)
+            default_table_name = _SANITIZE_RE.sub('_', default_table_name)
             
             table_name, ok = QInputDialog.getText(
                 self, 'Table Name', 
@@ -2355,7 +3441,7 @@ class DuckDBSQLApp(QMainWindow):
             
             # Clean the table name
             table_name = table_name.strip()
-            table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in table_name)
+            table_name = _SANITIZE_RE.sub('_', table_name)
 
             # Get sheet names from the first file for reference
             try:
@@ -2459,7 +3545,7 @@ class DuckDBSQLApp(QMainWindow):
         progress.show()
         
         combined_data = []
-        all_columns = set()
+        all_columns = {}  # Ordered set: first-seen column order across files
         file_info = []
         conversion_errors = False
         
@@ -2495,7 +3581,7 @@ class DuckDBSQLApp(QMainWindow):
                             # Read the sheet to get column names (polars doesn't support n_rows for Excel)
                             df = pl.read_excel(file_path, sheet_name=sheet_name)
                             # Strip leading and trailing spaces from column names
-                            all_columns.update([col.strip() for col in df.columns])
+                            all_columns.update({col.strip(): None for col in df.columns})
                         except Exception as sheet_error:
                             print(f'Warning: Could not read sheet {sheet_name} from {file_path}: {sheet_error}')
                             continue
@@ -2504,8 +3590,8 @@ class DuckDBSQLApp(QMainWindow):
                     print(f'Warning: Could not analyze {file_path}: {file_error}')
                     continue
             
-            # Convert to sorted list for consistent column order
-            all_columns = sorted(list(all_columns))
+            # Keep columns in the order they first appeared in the files
+            all_columns = list(all_columns)
             
             # Second pass: load and harmonize data
             for i, file_path in enumerate(excel_files):
@@ -2517,12 +3603,14 @@ class DuckDBSQLApp(QMainWindow):
                 QApplication.processEvents()
                 
                 try:
-                    file_data = self.load_and_harmonize_excel(file_path, all_columns, selected_sheets, use_first_sheet_from_all)
-                    if file_data:
-                        combined_data.extend(file_data)
+                    file_df = self.load_and_harmonize_excel(file_path, all_columns, selected_sheets, use_first_sheet_from_all)
+                    if file_df is not None and file_df.height:
+                        # Tag rows with their source file; a literal column stays a single value per frame
+                        file_name = os.path.basename(file_path)
+                        combined_data.append(file_df.with_columns(pl.lit(file_name).alias('source_file')))
                         file_info.append({
-                            'file': os.path.basename(file_path),
-                            'rows': len(file_data)
+                            'file': file_name,
+                            'rows': file_df.height
                         })
                 except Exception as file_error:
                     conversion_errors = True
@@ -2537,30 +3625,22 @@ class DuckDBSQLApp(QMainWindow):
                 QMessageBox.warning(self, 'No Data', 'No data could be loaded from the Excel files.')
                 return
             
-            # Create combined DataFrame
-            combined_df = pl.DataFrame(combined_data, schema={col: pl.Utf8 for col in all_columns})
-            
-            # Add source file column
-            source_files = []
-            for file_info_item in file_info:
-                source_files.extend([file_info_item['file']] * file_info_item['rows'])
-            
-            if len(source_files) == len(combined_data):
-                combined_df = combined_df.with_columns(pl.Series('source_file', source_files))
+            # Create combined DataFrame (every frame already shares the harmonized schema)
+            combined_df = pl.concat(combined_data, how='vertical')
+            combined_data = None
             
             # Load into DuckDB
-            self.connection.execute(f'CREATE OR REPLACE TABLE localdb.{table_name} AS SELECT * FROM combined_df')
+            self.create_table_from_frame(table_name, combined_df)
             
             # Store the mapping
             folder_name = os.path.basename(folder_path)
             self.loaded_tables[f'{folder_name}_combined'] = table_name
             
-            # Get row count
-            count_result = self.connection.execute(f'SELECT COUNT(*) FROM localdb.{table_name}').fetchone()
-            row_count = count_result[0]
+            # Row count is already known from the combined frame
+            row_count = combined_df.height
             
             # Refresh schema tree
-            self.refresh_schema_tree()
+            self.schedule_schema_refresh()
             
             # Show success message
             success_msg = f'Successfully combined {len(file_info)} Excel files into localdb.{table_name}'
@@ -2608,7 +3688,7 @@ class DuckDBSQLApp(QMainWindow):
     
     def load_and_harmonize_excel(self, file_path, all_columns, selected_sheets=None, use_first_sheet_from_all=False):
         """Load Excel file and harmonize its data to match the combined schema"""
-        file_data = []
+        sheet_frames = []
         
         try:
             # Determine which sheets to process
@@ -2629,30 +3709,22 @@ class DuckDBSQLApp(QMainWindow):
                     # Strip leading and trailing spaces from column names
                     df = df.rename({col: col.strip() for col in df.columns})
                     
-                    # Convert all columns to string to avoid type conflicts
-                    df = df.with_columns([pl.col(col).cast(pl.Utf8, strict=False) for col in df.columns])
-                    
-                    # Convert to list of dictionaries for easier manipulation
-                    sheet_data = df.to_dicts()
+                    # Harmonize to the combined schema: all columns as text, 'nan'/'null'/'' become None,
+                    # and columns missing from this sheet are filled with None
+                    harmonized = []
+                    for col in all_columns:
+                        if col in df.columns:
+                            value = pl.col(col).cast(pl.Utf8, strict=False)
+                            harmonized.append(
+                                pl.when(value.str.to_lowercase().is_in(['nan', 'null', '']))
+                                .then(None)
+                                .otherwise(value)
+                                .alias(col)
+                            )
+                        else:
+                            harmonized.append(pl.lit(None, dtype=pl.Utf8).alias(col))
                     
-                    # Harmonize each row to match the combined schema
-                    for row in sheet_data:
-                        harmonized_row = {}
-                        
-                        # Add existing columns
-                        for col in all_columns:
-                            if col in row:
-                                # Convert to string and handle None values
-                                value = row[col]
-                                if value is None or (isinstance(value, str) and value.lower() in ['nan', 'null', '']):
-                                    harmonized_row[col] = None
-                                else:
-                                    harmonized_row[col] = str(value)
-                            else:
-                                # Column doesn't exist in this file, set to None
-                                harmonized_row[col] = None
-                        
-                        file_data.append(harmonized_row)
+                    sheet_frames.append(df.select(harmonized))
                         
                 except Exception as sheet_error:
                     print(f'Warning: Could not load sheet {sheet_name} from {file_path}: {sheet_error}')
@@ -2662,7 +3734,9 @@ class DuckDBSQLApp(QMainWindow):
             print(f'Error loading {file_path}: {file_error}')
             raise
         
-        return file_data
+        if not sheet_frames:
+            return None
+        return pl.concat(sheet_frames, how='vertical')
     
     def get_active_sql_editor(self):
         """
@@ -2675,9 +3749,10 @@ class DuckDBSQLApp(QMainWindow):
             
             # Check if it's a split screen editor
             if hasattr(self, 'split_query_tabs'):
-                for tab_key, tab_data in self.split_query_tabs.items():
-                    if tab_data['sql_editor'] == self.last_active_sql_editor:
-                        return self.last_active_sql_editor, True
+                for widget_tabs in self.split_query_tabs.values():
+                    for tab_data in widget_tabs.values():
+                        if tab_data['sql_editor'] == self.last_active_sql_editor:
+                            return self.last_active_sql_editor, True
             
             # Check if it's the main editor
             current_tab_index = self.query_tab_widget.currentIndex()
@@ -2687,11 +3762,12 @@ class DuckDBSQLApp(QMainWindow):
         
         # Fallback: check if any split screen SQL editor has focus
         if hasattr(self, 'split_query_tabs'):
-            for tab_key, tab_data in self.split_query_tabs.items():
-                sql_editor = tab_data['sql_editor']
-                if sql_editor.hasFocus():
-                    self.last_active_sql_editor = sql_editor
-                    return sql_editor, True
+            for widget_tabs in self.split_query_tabs.values():
+                for tab_data in widget_tabs.values():
+                    sql_editor = tab_data['sql_editor']
+                    if sql_editor.hasFocus():
+                        self.last_active_sql_editor = sql_editor
+                        return sql_editor, True
         
         # Check if main SQL editor has focus or fall back to it as default
         current_tab_index = self.query_tab_widget.currentIndex()
@@ -2704,10 +3780,11 @@ class DuckDBSQLApp(QMainWindow):
         # Fallback: return None if no valid editor found
         return None, False
     
-    def on_table_double_click(self, item, column):
+    def on_table_double_click(self, index):
         """Handle double-click on table items in the schema tree"""
-        if item.text(1) == 'table':  # Only handle table items, not schema
-            full_table_name = item.data(0, Qt.UserRole)
+        node = self.schema_model.node_from_index(index)
+        if node.kind == 'table':  # Only handle table items, not schema
+            full_table_name = node.identifier
             if full_table_name:
                 # Get the active SQL editor (could be main or split screen)
                 sql_editor, is_split_screen = self.get_active_sql_editor()
@@ -2747,14 +3824,10 @@ class DuckDBSQLApp(QMainWindow):
             return
         
         # Fix for comments: Get selected text properly preserving line breaks
-        # cursor.selectedText() converts line breaks to \u2029 which breaks SQL comments
-        start_pos = cursor.selectionStart()
-        end_pos = cursor.selectionEnd()
-        
-        # Get the full text and extract the selected portion
-        full_text = sql_editor.toPlainText()
-        selected_query = full_text[start_pos:end_pos].strip()
-        
+        # cursor.selectedText() converts line breaks to \u2029 which breaks SQL comments,
+        # so copy only the selected fragment and normalise any remaining separators
+        selected_query = cursor.selection().toPlainText().translate(_QTX_TRANS).strip()
+
         if not selected_query:
             QMessageBox.warning(self, 'Empty Selection', 'Please select a valid SQL query.')
             return
@@ -2768,6 +3841,7 @@ class DuckDBSQLApp(QMainWindow):
         tab_data['current_query'] = selected_query
         tab_data['current_page'] = 0
         tab_data['total_rows'] = 0
+        tab_data['complete_data'] = None
         
         # Execute streaming query
         self.execute_streaming_query(current_tab_index)
@@ -2833,22 +3907,22 @@ class DuckDBSQLApp(QMainWindow):
         
         # Export to Excel action
         self.export_excel_action = export_menu.addAction('Export to Excel...')
-        self.export_excel_action.triggered.connect(lambda: self.export_results('excel', self.query_tab_widget.currentIndex()))
+        self.export_excel_action.triggered.connect(partial(self.export_current_results, 'excel'))
         self.export_excel_action.setEnabled(False)
         
         # Export to CSV action
         self.export_csv_action = export_menu.addAction('Export to CSV...')
-        self.export_csv_action.triggered.connect(lambda: self.export_results('csv', self.query_tab_widget.currentIndex()))
+        self.export_csv_action.triggered.connect(partial(self.export_current_results, 'csv'))
         self.export_csv_action.setEnabled(False)
         
         # Export to JSON action
         self.export_json_action = export_menu.addAction('Export to JSON...')
-        self.export_json_action.triggered.connect(lambda: self.export_results('json', self.query_tab_widget.currentIndex()))
+        self.export_json_action.triggered.connect(partial(self.export_current_results, 'json'))
         self.export_json_action.setEnabled(False)
         
         # Export to Parquet action
         self.export_parquet_action = export_menu.addAction('Export to Parquet...')
-        self.export_parquet_action.triggered.connect(lambda: self.export_results('parquet', self.query_tab_widget.currentIndex()))
+        self.export_parquet_action.triggered.connect(partial(self.export_current_results, 'parquet'))
         self.export_parquet_action.setEnabled(False)
         
         # View menu
@@ -2865,23 +3939,23 @@ class DuckDBSQLApp(QMainWindow):
         # Theme actions
         self.light_theme_action = theme_menu.addAction('Light Theme')
         self.light_theme_action.setCheckable(True)
-        self.light_theme_action.triggered.connect(lambda: self.set_theme('light'))
+        self.light_theme_action.triggered.connect(partial(self.set_theme_from_action, 'light'))
         
         self.dark_theme_action = theme_menu.addAction('Dark Theme')
         self.dark_theme_action.setCheckable(True)
-        self.dark_theme_action.triggered.connect(lambda: self.set_theme('dark'))
+        self.dark_theme_action.triggered.connect(partial(self.set_theme_from_action, 'dark'))
         
         self.blue_theme_action = theme_menu.addAction('Blue Theme')
         self.blue_theme_action.setCheckable(True)
-        self.blue_theme_action.triggered.connect(lambda: self.set_theme('blue'))
+        self.blue_theme_action.triggered.connect(partial(self.set_theme_from_action, 'blue'))
         
         self.green_theme_action = theme_menu.addAction('Green Theme')
         self.green_theme_action.setCheckable(True)
-        self.green_theme_action.triggered.connect(lambda: self.set_theme('green'))
+        self.green_theme_action.triggered.connect(partial(self.set_theme_from_action, 'green'))
         
         self.high_contrast_theme_action = theme_menu.addAction('High Contrast Theme')
         self.high_contrast_theme_action.setCheckable(True)
-        self.high_contrast_theme_action.triggered.connect(lambda: self.set_theme('high_contrast'))
+        self.high_contrast_theme_action.triggered.connect(partial(self.set_theme_from_action, 'high_contrast'))
         
         # Group theme actions
         from PyQt5.QtWidgets import QActionGroup
@@ -2895,6 +3969,14 @@ class DuckDBSQLApp(QMainWindow):
         # Set default theme
         self.light_theme_action.setChecked(True)
     
+    def export_current_results(self, format_type, checked=False):
+        """Export results of the current query tab (menu action slot)"""
+        self.export_results(format_type, self.query_tab_widget.currentIndex())
+    
+    def set_theme_from_action(self, theme_name, checked=False):
+        """Apply a theme (menu action slot; ignores the triggered() checked flag)"""
+        self.set_theme(theme_name)
+    
     def show_connection_dialog(self):
         """Show the database connection dialog"""
         dialog = DatabaseConnectionDialog(self)
@@ -2938,7 +4020,8 @@ class DuckDBSQLApp(QMainWindow):
             # Use different syntax based on DuckDB version
             try:
                 # Try newer DuckDB syntax first
-                attach_query = f"ATTACH '{connection_string}' AS {db_name} (TYPE mysql, READ_ONLY)"
+                escaped_connection_string = connection_string.replace("'", "''")
+                attach_query = f"ATTACH '{escaped_connection_string}' AS {quote_identifier(db_name)} (TYPE mysql, READ_ONLY)"
                 self.connection.execute(attach_query)
             except Exception as attach_error:
                 # Try alternative syntax
@@ -2972,13 +4055,12 @@ class DuckDBSQLApp(QMainWindow):
             self.disconnect_action.setEnabled(True)
             
             # Refresh schema tree to show remote tables
-            self.refresh_schema_tree()
+            self.schedule_schema_refresh()
             
             QMessageBox.information(self, 'Connection Successful', f'Successfully connected to {connection_data["name"]}')
             
             # Save this connection if it's not already saved
-            existing_names = [conn['name'] for conn in self.saved_connections]
-            if connection_data['name'] not in existing_names:
+            if connection_data['name'] not in self._saved_connection_names:
                 self.saved_connections.append(connection_data)
                 self.save_connections()
             
@@ -2988,13 +4070,11 @@ class DuckDBSQLApp(QMainWindow):
     
     def sanitize_db_name(self, name):
         """Convert connection name to valid database identifier"""
-        # Replace spaces and special characters with underscores
-        sanitized = ''.join(c if c.isalnum() else '_' for c in name)
+        # Replace spaces and special characters with underscores (same sanitizer as table names)
+        sanitized = _SANITIZE_RE.sub('_', name)[:50] or 'db_connection'
         # Ensure it starts with a letter or underscore
-        if sanitized and sanitized[0].isdigit():
+        if sanitized[0].isdigit():
             sanitized = '_' + sanitized
-        # Limit length and ensure it's not empty
-        sanitized = sanitized[:50] or 'db_connection'
         return sanitized.lower()
     
     def disconnect_database(self, db_name=None):
@@ -3003,22 +4083,34 @@ class DuckDBSQLApp(QMainWindow):
             if db_name:
                 # Disconnect specific database
                 if db_name in self.active_connections:
-                    self.connection.execute(f'DETACH {db_name}')
+                    self.connection.execute(f'DETACH {quote_identifier(db_name)}')
                     del self.active_connections[db_name]
             else:
-                # Disconnect all databases
-                for db_name in list(self.active_connections.keys()):
+                # Disconnect all databases under a single commit
+                db_names = list(self.active_connections.keys())
+                try:
+                    self.connection.begin()
+                    for db_name in db_names:
+                        self.connection.execute(f'DETACH {quote_identifier(db_name)}')
+                    self.connection.commit()
+                except:
+                    # Roll back and detach one by one so a single failure doesn't keep the others attached
                     try:
-                        self.connection.execute(f'DETACH {db_name}')
+                        self.connection.rollback()
                     except:
-                        pass  # Continue even if detach fails
+                        pass
+                    for db_name in db_names:
+                        try:
+                            self.connection.execute(f'DETACH IF EXISTS {quote_identifier(db_name)}')
+                        except:
+                            pass  # Continue even if detach fails
                 self.active_connections.clear()
             
             # Update UI
             if not self.active_connections:
                 self.disconnect_action.setEnabled(False)
             
-            self.refresh_schema_tree()
+            self.schedule_schema_refresh()
             
         except Exception as e:
             QMessageBox.warning(self, 'Disconnect Warning', f'Error during disconnect:\n{str(e)}')
@@ -3027,89 +4119,92 @@ class DuckDBSQLApp(QMainWindow):
         """Build connection string from connection data"""
         return build_mysql_connection_string(connection_data)
     
+    def schedule_schema_refresh(self):
+        """Refresh the schema tree and autocomplete after a short delay, coalescing repeated requests"""
+        # Cached metadata is stale right away, even if the tree is rebuilt a little later
+        self.invalidate_schema_cache()
+        if getattr(self, '_schema_refresh_pending', False):
+            return
+        self._schema_refresh_pending = True
+        QTimer.singleShot(100, self._run_scheduled_schema_refresh)
+    
+    def _run_scheduled_schema_refresh(self):
+        self._schema_refresh_pending = False
+        self.refresh_schema_tree()
+        
+        # Table names changed, so let the next autocomplete refresh run immediately
+        self._cache_timestamp = 0
+        self.update_autocomplete_with_tables()
+    
+    def get_table_row_estimate(self, table_name, schema_name='localdb'):
+        """Return the row count DuckDB keeps in its table statistics"""
+        result = self.connection.execute(
+            "SELECT estimated_size FROM duckdb_tables() WHERE schema_name = ? AND table_name = ?",
+            [schema_name, table_name]
+        ).fetchone()
+        return result[0] if result else 0
+    
     def refresh_schema_tree(self):
         """Refresh the schema tree to show current schemas only (lazy loading - optimized)"""
-        self.schema_tree.clear()
-        
-        # Create localdb schema node (always show it)
-        localdb_node = QTreeWidgetItem(self.schema_tree)
-        localdb_node.setText(0, 'localdb')
-        localdb_node.setText(1, 'schema')
-        localdb_node.setData(0, Qt.UserRole, 'localdb')  # Store schema identifier
-        
-        # Always add placeholder to make it expandable (lazy check for tables)
-        placeholder = QTreeWidgetItem(localdb_node)
-        placeholder.setText(0, 'Loading...')
-        placeholder.setText(1, 'placeholder')
+        # Tables may have been created, dropped or detached since the last refresh
+        self.invalidate_schema_cache()
         
-        # Add remote database schemas for all active connections
+        # localdb schema node (always show it), then one node per active remote connection
+        schemas = [('localdb', 'localdb')]
         for db_name, connection_data in self.active_connections.items():
             # Get the database name from connection data
             database_name = connection_data.get('database', '')
             connection_name = connection_data.get('name', 'Remote Database')
-            
-            # Create node without checking table count (lazy loading)
-            remote_node = QTreeWidgetItem(self.schema_tree)
-            remote_node.setText(0, f'{connection_name} ({database_name})')
-            remote_node.setText(1, 'schema')
-            remote_node.setData(0, Qt.UserRole, db_name)  # Store db_name for disconnect
-            
-            # Add placeholder child to make node expandable
-            placeholder = QTreeWidgetItem(remote_node)
-            placeholder.setText(0, 'Loading...')
-            placeholder.setText(1, 'placeholder')
+            schemas.append((f'{connection_name} ({database_name})', db_name))  # db_name used for disconnect
+        
+        self.schema_model.set_schemas(schemas)
     
     def update_autocomplete_with_tables(self):
         """Update SQL autocomplete with current table names from all schemas (cached)"""
-        # Use cached table names if available to avoid repeated queries
-        if not hasattr(self, '_cached_table_names') or not hasattr(self, '_cache_timestamp'):
-            self._cached_table_names = []
-            self._cache_timestamp = 0
+        import time
+        
+        # Only refresh cache if it's older than 5 seconds; the refresh runs in a
+        # background thread and pushes completions when it finishes
+        if time.time() - self._cache_timestamp <= 5:
+            return
+        
+        # Never run two refreshes at once; re-run once the current one finishes instead
+        if self._autocomplete_thread is not None:
+            self._autocomplete_rerun = True
+            return
         
+        self._autocomplete_thread = AutocompleteRefreshThread(self.connection, dict(self.active_connections))
+        self._autocomplete_thread.tables_ready.connect(self.handle_autocomplete_tables_ready)
+        self._autocomplete_thread.finished.connect(self._autocomplete_thread.deleteLater)
+        self._autocomplete_thread.start()
+    
+    def handle_autocomplete_tables_ready(self, table_names, tables_by_schema):
+        """Store table names found by the autocomplete thread and push them to the editors"""
         import time
-        current_time = time.time()
+        self._autocomplete_thread = None
         
-        # Only refresh cache if it's older than 5 seconds
-        if current_time - self._cache_timestamp > 5:
-            table_names = []
-            
-            try:
-                # Get localdb tables
-                local_tables = self.connection.execute(
-                    "SELECT table_name FROM information_schema.tables WHERE table_schema = 'localdb'"
-                ).fetchall()
-                
-                for table in local_tables:
-                    table_name = table[0]
-                    table_names.extend([
-                        table_name,
-                        f'localdb.{table_name}'
-                    ])
-                
-                # Get remote database tables (limit to avoid slowdown)
-                for db_name, connection_data in self.active_connections.items():
-                    try:
-                        database_name = connection_data.get('database', '')
-                        # Limit to first 1000 tables for performance
-                        remote_tables = self.connection.execute(
-                            f"SELECT table_name FROM information_schema.tables WHERE table_catalog = '{db_name}' AND table_schema = '{database_name}' LIMIT 1000"
-                        ).fetchall()
-                        
-                        for table in remote_tables:
-                            table_name = table[0]
-                            table_names.extend([
-                                table_name,
-                                f'{db_name}.{table_name}'
-                            ])
-                    except:
-                        pass
-                
-                self._cached_table_names = table_names
-                self._cache_timestamp = current_time
-            except Exception as e:
-                pass  # Error updating autocomplete
+        if self._autocomplete_rerun:
+            # Tables changed while this refresh was running; its result may be stale
+            self._autocomplete_rerun = False
+            self._cache_timestamp = 0
+            self.update_autocomplete_with_tables()
+            return
+        
+        self._cache_timestamp = time.time()
         
-        # Update autocomplete for all SQL editors with cached names
+        # Per-schema lists are reused by the schema tree while they are fresh
+        self._cached_tables_by_schema = tables_by_schema
+        
+        # Editors already hold the previous list, so only push when the set of names changed
+        table_hash = hash(frozenset(table_names))
+        if table_hash == self._cached_table_hash:
+            return
+        self._cached_table_hash = table_hash
+        self._cached_table_names = table_names  # Already sorted by the thread
+        self.push_autocomplete_to_editors()
+    
+    def push_autocomplete_to_editors(self):
+        """Add the cached table names to every SQL editor's completer"""
         if self._cached_table_names:
             for i in range(self.query_tab_widget.count()):
                 tab_widget = self.query_tab_widget.widget(i)
@@ -3121,128 +4216,128 @@ class DuckDBSQLApp(QMainWindow):
     def update_autocomplete_for_editor(self, sql_editor):
         """Update autocomplete for a specific SQL editor with current table names (cached)"""
         # Use cached table names if available
-        if hasattr(self, '_cached_table_names') and self._cached_table_names:
+        if self._cached_table_names:
             sql_editor.add_custom_completions(self._cached_table_names)
         else:
             # Build cache if not available
             self.update_autocomplete_with_tables()
     
-    def on_schema_item_expanded(self, item):
-        """Handle lazy loading when schema tree items are expanded"""
-        # Check if this item has placeholder children that need to be replaced
-        if item.childCount() > 0 and item.child(0).text(1) == 'placeholder':
-            # Remove placeholder
-            item.removeChild(item.child(0))
-            
-            # Load actual content based on item type
-            if item.text(1) == 'schema':
-                self.load_tables_for_schema(item)
-            elif item.text(1) == 'table':
-                self.load_columns_for_table(item)
-    
-    def load_tables_for_schema(self, schema_item):
-        """Load tables for a schema node (optimized - no row counts)"""
-        schema_identifier = schema_item.data(0, Qt.UserRole)
-        
-        if schema_identifier == 'localdb':
-            # Load local tables (without counting rows for performance)
-            try:
-                tables = self.connection.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'localdb' ORDER BY table_name").fetchall()
-                for table in tables:
-                    table_name = table[0]
-                    
-                    table_item = QTreeWidgetItem(schema_item)
-                    table_item.setText(0, table_name)
-                    table_item.setText(1, 'table')
-                    table_item.setText(2, '')  # Don't show row count for performance
-                    table_item.setData(0, Qt.UserRole, f'localdb.{table_name}')
-                    
-                    # Add placeholder for columns to make table expandable
-                    placeholder = QTreeWidgetItem(table_item)
-                    placeholder.setText(0, 'Loading...')
-                    placeholder.setText(1, 'placeholder')
-            except:
-                pass  # Error loading local tables
+    def load_schema_children(self, node):
+        """Return child rows (name, kind, detail, identifier) for an expanded schema tree node"""
+        if node.kind == 'schema':
+            return self.load_tables_for_schema(node.identifier)
+        elif node.kind == 'table':
+            return self.load_columns_for_table(node.identifier)
+        return []
+    
+    def start_schema_load(self, schema_identifier):
+        """Fetch a schema's tables and columns in a background thread"""
+        key = (schema_identifier, self._schema_generation)
+        if key in self._schema_load_threads:
+            return  # Already loading since the last invalidation
+        
+        database_name = self.active_connections.get(schema_identifier, {}).get('database', '')
+        thread = SchemaLoadThread(self.connection, schema_identifier, database_name)
+        thread.schema_loaded.connect(lambda identifier, tables: self.handle_schema_loaded(identifier, tables, key[1]))
+        thread.finished.connect(thread.deleteLater)
+        self._schema_load_threads[key] = thread
+        thread.start()
+    
+    def handle_schema_loaded(self, schema_identifier, tables, generation):
+        """Cache a schema loaded by SchemaLoadThread and show its tables in the tree"""
+        self._schema_load_threads.pop((schema_identifier, generation), None)
+        node = self.schema_model.schema_node(schema_identifier)
+        
+        if generation != self._schema_generation:
+            # The cache was invalidated while loading, so the result may be stale; load again
+            # if the tree is still waiting on this schema
+            if node is not None and (self.schema_model.is_loading(node) or
+                                     any(self.schema_model.is_loading(table_node) for table_node in node.children or [])):
+                self.start_schema_load(schema_identifier)
+            return
+        
+        self._schema_cache[schema_identifier] = tables
+        if node is None:
+            return  # Tree was refreshed while loading
+        if node.children is None or self.schema_model.is_loading(node):
+            self.schema_model.set_children(node, self.load_tables_for_schema(schema_identifier))
+            return
+        # Tables were listed from the autocomplete cache; fill in those expanded while columns loaded
+        for table_node in node.children:
+            if self.schema_model.is_loading(table_node):
+                self.schema_model.set_children(table_node, self.load_columns_for_table(table_node.identifier))
+    
+    def invalidate_schema_cache(self, schema_identifier=None):
+        """Drop cached schema metadata for one schema node, or for all of them"""
+        # Loads already in flight may have read the old metadata; their results are dropped
+        self._schema_generation += 1
+        if schema_identifier is None:
+            self._schema_cache.clear()
+            self._cached_tables_by_schema.clear()
         else:
-            # Load remote tables (without counting rows for performance)
-            if schema_identifier in self.active_connections:
-                connection_data = self.active_connections[schema_identifier]
-                database_name = connection_data.get('database', '')
-                
-                try:
-                    remote_tables = self.connection.execute(
-                        f"SELECT table_name FROM information_schema.tables WHERE table_catalog = '{schema_identifier}' AND table_schema = '{database_name}' ORDER BY table_name"
-                    ).fetchall()
-                    
-                    for table in remote_tables:
-                        table_name = table[0]
-                        
-                        table_item = QTreeWidgetItem(schema_item)
-                        table_item.setText(0, table_name)
-                        table_item.setText(1, 'table')
-                        table_item.setText(2, '')  # Don't show row count for performance
-                        table_item.setData(0, Qt.UserRole, f'{schema_identifier}.{table_name}')
-                        
-                        # Add placeholder for columns to make table expandable
-                        placeholder = QTreeWidgetItem(table_item)
-                        placeholder.setText(0, 'Loading...')
-                        placeholder.setText(1, 'placeholder')
-                except:
-                    pass  # Error loading remote tables
+            self._schema_cache.pop(schema_identifier, None)
+            self._cached_tables_by_schema.pop(schema_identifier, None)
+    
+    def load_tables_for_schema(self, schema_identifier):
+        """Load tables for a schema node (optimized - no row counts).
         
-        # Update autocomplete with newly loaded table names (async to avoid blocking)
-        QApplication.processEvents()  # Keep UI responsive
+        Returns None when the schema is not cached yet; it is then loaded in a
+        background thread and handle_schema_loaded fills in the tree.
+        """
+        if schema_identifier in self._schema_cache:
+            table_names = self._schema_cache[schema_identifier]
+        else:
+            # The autocomplete refresh may have listed this schema a moment ago; columns load on table expand
+            table_names = self.get_fresh_autocomplete_tables(schema_identifier)
+            if table_names is None:
+                self.start_schema_load(schema_identifier)
+                return None
+        
+        # Row counts are not shown for performance
+        return [
+            (table_name, 'table', '', f'{schema_identifier}.{table_name}')
+            for table_name in table_names
+        ]
+    
+    def get_fresh_autocomplete_tables(self, schema_identifier):
+        """Return a schema's table names from the autocomplete cache if it is under 5 seconds old"""
+        import time
+        if time.time() - self._cache_timestamp > 5:
+            return None
+        return self._cached_tables_by_schema.get(schema_identifier)
     
-    def load_columns_for_table(self, table_item):
+    def load_columns_for_table(self, full_table_name):
         """Load columns for a table node"""
-        full_table_name = table_item.data(0, Qt.UserRole)
         if not full_table_name:
-            return
+            return []
         
         # Parse schema and table name
         if '.' in full_table_name:
             schema_name, table_name = full_table_name.split('.', 1)
         else:
-            return
+            return []
         
-        try:
-            if schema_name == 'localdb':
-                # Load columns for local table
-                columns = self.connection.execute(
-                    f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{table_name}' AND table_schema = 'localdb' ORDER BY ordinal_position"
-                ).fetchall()
-            else:
-                # Load columns for remote table
-                if schema_name in self.active_connections:
-                    connection_data = self.active_connections[schema_name]
-                    database_name = connection_data.get('database', '')
-                    columns = self.connection.execute(
-                        f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{table_name}' AND table_catalog = '{schema_name}' AND table_schema = '{database_name}' ORDER BY ordinal_position"
-                    ).fetchall()
-                else:
-                    return
-            
-            # Add column items
-            for column in columns:
-                column_name, data_type = column
-                column_item = QTreeWidgetItem(table_item)
-                column_item.setText(0, column_name)
-                column_item.setText(1, 'column')
-                column_item.setText(2, data_type)
-        except:
-            pass  # Error loading columns
+        if schema_name not in self._schema_cache:
+            # Columns load with the rest of the schema in a background thread, see handle_schema_loaded
+            self.start_schema_load(schema_name)
+            return None
+        
+        # Columns come from the per-schema cache filled when the schema was loaded
+        columns = self._schema_cache[schema_name].get(table_name, [])
+        return [(column_name, 'column', data_type, None) for column_name, data_type in columns]
     
     def show_schema_context_menu(self, position):
         """Show context menu for schema tree items"""
-        item = self.schema_tree.itemAt(position)
-        if not item:
+        index = self.schema_tree.indexAt(position)
+        if not index.isValid():
             return
+        node = self.schema_model.node_from_index(index)
         
         menu = QMenu(self)
         
         # Check if this is a table item in the localdb schema
-        if item.text(1) == 'table':
-            full_table_name = item.data(0, Qt.UserRole)
+        if node.kind == 'table':
+            full_table_name = node.identifier
             if full_table_name and full_table_name.startswith('localdb.'):
                 # This is a localdb table - add remove option
                 table_name = full_table_name.replace('localdb.', '')
@@ -3254,10 +4349,10 @@ class DuckDBSQLApp(QMainWindow):
                 return
         
         # Check if this is a remote database schema node
-        if item.text(1) == 'schema' and item.data(0, Qt.UserRole):
-            db_name = item.data(0, Qt.UserRole)
+        if node.kind == 'schema' and node.identifier:
+            db_name = node.identifier
             if db_name in self.active_connections:
-                disconnect_action = QAction(f'Disconnect from {item.text(0)}', self)
+                disconnect_action = QAction(f'Disconnect from {node.name}', self)
                 disconnect_action.triggered.connect(lambda: self.disconnect_specific_database(db_name))
                 menu.addAction(disconnect_action)
                 
@@ -3277,7 +4372,9 @@ class DuckDBSQLApp(QMainWindow):
             
             if reply == QMessageBox.Yes:
                 # Drop the table
-                self.connection.execute(f'DROP TABLE IF EXISTS localdb.{table_name}')
+                # Table names can come from user SQL, so escape rather than validate them
+                quoted_table_name = table_name.replace('"', '""')
+                self.connection.execute(f'DROP TABLE IF EXISTS localdb."{quoted_table_name}"')
                 
                 # Remove from loaded_tables mapping if it exists
                 table_to_remove = None
@@ -3290,7 +4387,7 @@ class DuckDBSQLApp(QMainWindow):
                     del self.loaded_tables[table_to_remove]
                 
                 # Refresh the schema tree
-                self.refresh_schema_tree()
+                self.schedule_schema_refresh()
                 
                 # Update status
                 self.status_label.setText(f'Table "{table_name}" removed from localdb')
@@ -3310,248 +4407,253 @@ class DuckDBSQLApp(QMainWindow):
         if tab_index not in self.query_tabs:
             return
             
-        results_table = self.query_tabs[tab_index]['results_table']
-        item = results_table.itemAt(position)
+        tab_data = self.query_tabs[tab_index]
+        results_table = tab_data['results_table']
+        index = results_table.indexAt(position)
         
-        if not item:
+        if not index.isValid():
             return
-            
-        menu = QMenu(self)
+        
+        # The menu is built once per tab; its actions read the clicked cell from the tab data
+        if tab_data.get('results_menu') is None:
+            tab_data['results_menu'] = self.build_results_context_menu(tab_data)
+        tab_data['context_target'] = (tab_index, index.row(), index.column())
+        
+        tab_data['results_menu'].exec_(results_table.mapToGlobal(position))
+    
+    def build_results_context_menu(self, tab_data):
+        """Create the reusable results table context menu for a tab"""
+        # Owned by the results table, so it is deleted along with the tab
+        menu = QMenu(tab_data['results_table'])
         
         # Copy cell value
-        copy_cell_action = QAction('Copy Cell Value', self)
-        copy_cell_action.triggered.connect(lambda: self.copy_cell_value(tab_index, item.row(), item.column()))
+        copy_cell_action = QAction('Copy Cell Value', menu)
+        copy_cell_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'copy_cell'))
         menu.addAction(copy_cell_action)
         
         # Copy column with header
-        copy_column_action = QAction('Copy Column with Header', self)
-        copy_column_action.triggered.connect(lambda: self.copy_column_with_header(tab_index, item.column()))
+        copy_column_action = QAction('Copy Column with Header', menu)
+        copy_column_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'copy_column'))
         menu.addAction(copy_column_action)
         
         # Copy row with header
-        copy_row_action = QAction('Copy Row with Header', self)
-        copy_row_action.triggered.connect(lambda: self.copy_row_with_header(tab_index, item.row()))
+        copy_row_action = QAction('Copy Row with Header', menu)
+        copy_row_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'copy_row'))
         menu.addAction(copy_row_action)
         
         menu.addSeparator()
         
         # Copy entire table
-        copy_table_action = QAction('Copy Entire Table', self)
-        copy_table_action.triggered.connect(lambda: self.copy_entire_table(tab_index))
+        copy_table_action = QAction('Copy Entire Table', menu)
+        copy_table_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'copy_table'))
         menu.addAction(copy_table_action)
         
         # Add separator and Dashboard option
         menu.addSeparator()
         
         # Build Nodes Dashboard option
-        nodes_dashboard_action = QAction('🕸️ Build Nodes Dashboard', self)
-        nodes_dashboard_action.triggered.connect(lambda: self.open_nodes_dashboard(tab_index))
+        nodes_dashboard_action = QAction('🕸️ Build Nodes Dashboard', menu)
+        nodes_dashboard_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'nodes_dashboard'))
         menu.addAction(nodes_dashboard_action)
 
         # Build Main Dashboard option
-        main_dashboard_action = QAction('📊 Build Dashboard', self)
-        main_dashboard_action.triggered.connect(lambda: self.open_main_dashboard(tab_index))
+        main_dashboard_action = QAction('📊 Build Dashboard', menu)
+        main_dashboard_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'main_dashboard'))
         menu.addAction(main_dashboard_action)
         
         if EEL_AVAILABLE:
-            dashboard_action = QAction('📊 Open Dashboard', self)
-            dashboard_action.triggered.connect(lambda: self.open_eel_dashboard(tab_index))
+            dashboard_action = QAction('📊 Open Dashboard', menu)
+            dashboard_action.triggered.connect(partial(self.handle_results_menu_action, tab_data, 'eel_dashboard'))
             menu.addAction(dashboard_action)
         
-        menu.exec_(results_table.mapToGlobal(position))
+        return menu
+    
+    def handle_results_menu_action(self, tab_data, action_name, checked=False):
+        """Run a results context menu action on the cell recorded at right-click time"""
+        tab_index, row, column = tab_data['context_target']
+        if action_name == 'copy_cell':
+            self.copy_cell_value(tab_index, row, column)
+        elif action_name == 'copy_column':
+            self.copy_column_with_header(tab_index, column)
+        elif action_name == 'copy_row':
+            self.copy_row_with_header(tab_index, row)
+        elif action_name == 'copy_table':
+            self.copy_entire_table(tab_index)
+        elif action_name == 'nodes_dashboard':
+            self.open_nodes_dashboard(tab_index)
+        elif action_name == 'main_dashboard':
+            self.open_main_dashboard(tab_index)
+        elif action_name == 'eel_dashboard':
+            self.open_eel_dashboard(tab_index)
     
     def show_header_context_menu(self, position, tab_index):
         """Show context menu for table headers"""
         if tab_index not in self.query_tabs:
             return
             
-        results_table = self.query_tabs[tab_index]['results_table']
-        header = results_table.horizontalHeader()
+        tab_data = self.query_tabs[tab_index]
+        header = tab_data['results_table'].horizontalHeader()
         
         # Get the column index from the position
         column = header.logicalIndexAt(position)
         if column < 0:
             return
+        
+        # Built once per tab, like the results menu
+        if tab_data.get('header_menu') is None:
+            menu = QMenu(tab_data['results_table'])
             
-        menu = QMenu(self)
+            # Copy header value
+            copy_header_action = QAction('Copy Header', menu)
+            copy_header_action.triggered.connect(
+                lambda checked=False: self.copy_header_value(*tab_data['header_context_target'])
+            )
+            menu.addAction(copy_header_action)
+            tab_data['header_menu'] = menu
+        tab_data['header_context_target'] = (tab_index, column)
         
-        # Copy header value
-        copy_header_action = QAction('Copy Header', self)
-        copy_header_action.triggered.connect(lambda: self.copy_header_value(tab_index, column))
-        menu.addAction(copy_header_action)
+        tab_data['header_menu'].exec_(header.mapToGlobal(position))
+    
+    def _set_clipboard_text(self, text):
+        """Put text on the clipboard as pre-encoded UTF-8, avoiding an extra conversion of large payloads"""
+        mime = QMimeData()
+        mime.setData('text/plain', QByteArray(text.encode('utf-8')))
+        self._clipboard.setMimeData(mime)
+    
+    def start_clipboard_copy(self, query, data_name, column=None, header_text=''):
+        """Build clipboard text for a whole table or column in a ClipboardCopyThread, with a cancellable progress dialog"""
+        if not query:
+            QMessageBox.critical(self, 'Copy Error', f'Failed to copy {data_name} data:\nNo query to execute')
+            return
         
-        menu.exec_(header.mapToGlobal(position))
+        self.run_clipboard_copy(ClipboardCopyThread(self.connection, query, column, header_text), data_name)
+    
+    def run_clipboard_copy(self, copy_thread, data_name):
+        """Run a clipboard copy thread with a cancellable progress dialog"""
+        progress = QProgressDialog(f'Copying {data_name} data to clipboard...', 'Cancel', 0, 0, self)
+        progress.setWindowModality(Qt.NonModal)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        
+        copy_thread.text_ready.connect(self._set_clipboard_text)
+        copy_thread.error_occurred.connect(
+            lambda error: QMessageBox.critical(self, 'Copy Error', f'Failed to copy {data_name} data:\n{error}'))
+        copy_thread.finished.connect(lambda: self.finish_clipboard_copy(copy_thread, progress))
+        progress.canceled.connect(copy_thread.cancel)
+        self._clipboard_copy_threads.add(copy_thread)
+        copy_thread.start()
+        progress.show()
+    
+    def finish_clipboard_copy(self, copy_thread, progress):
+        """Close the progress dialog of a finished clipboard copy"""
+        progress.canceled.disconnect()  # Closing the dialog would otherwise report a cancel
+        progress.close()
+        progress.deleteLater()
+        self._clipboard_copy_threads.discard(copy_thread)
+        copy_thread.deleteLater()
+    
+    def get_result_headers(self, tab_data):
+        """Return the results table's header texts"""
+        return [str(column) for column in tab_data['result_model'].columns]
     
     def copy_header_value(self, tab_index, column):
         """Copy the header value to clipboard"""
         if tab_index not in self.query_tabs:
             return
             
-        results_table = self.query_tabs[tab_index]['results_table']
-        header_item = results_table.horizontalHeaderItem(column)
+        header_text = self.query_tabs[tab_index]['result_model'].column_name(column)
         
-        if header_item:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(header_item.text())
+        if header_text is not None:
+            self._set_clipboard_text(header_text)
+    
+    def _split_data(self, tab_widget, tab_index):
+        """Return the tracked data for a split screen tab, or None"""
+        return self.split_query_tabs.get(tab_widget, {}).get(tab_index)
     
     def copy_header_value_for_split(self, tab_widget, tab_index, column):
         """Copy the header value to clipboard for split screen tabs"""
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_data = self._split_data(tab_widget, tab_index)
+        if tab_data is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        results_table = tab_data['results_table']
-        header_item = results_table.horizontalHeaderItem(column)
+        header_text = tab_data['result_model'].column_name(column)
         
-        if header_item:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(header_item.text())
+        if header_text is not None:
+            self._set_clipboard_text(header_text)
     
     def copy_cell_value_for_split(self, tab_widget, tab_index, row, column):
         """Copy the value of a specific cell to clipboard for split screen tabs"""
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_data = self._split_data(tab_widget, tab_index)
+        if tab_data is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        results_table = tab_data['results_table']
-        item = results_table.item(row, column)
+        cell_text = tab_data['result_model'].index(row, column).data()
         
-        if item:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(item.text())
+        if cell_text is not None:
+            self._set_clipboard_text(cell_text)
     
     def copy_column_with_header_for_split(self, tab_widget, tab_index, column):
         """Copy entire column with header to clipboard for split screen tabs"""
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_data = self._split_data(tab_widget, tab_index)
+        if tab_data is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        results_table = tab_data['results_table']
-        
         # Get column header
-        header_item = results_table.horizontalHeaderItem(column)
-        header_text = header_item.text() if header_item else f'Column {column + 1}'
+        header_text = tab_data['result_model'].column_name(column) or f'Column {column + 1}'
+        
+        # The whole result is already in memory, no need to run the query again
+        complete_data = tab_data.get('data')
+        if complete_data:
+            if column < len(tab_data['columns']):
+                values = map(_cell_str, [row[column] if column < len(row) else None for row in complete_data])
+                self._set_clipboard_text('\n'.join([header_text, *values]))
+            return
         
-        # Get full data from complete query execution
-        try:
-            columns, full_data = self.execute_complete_query_for_split(tab_key)
-            if not columns or column >= len(columns):
-                return
-                
-            # Collect column data with header
-            column_data = [header_text]
-            
-            for row_data in full_data:
-                if column < len(row_data):
-                    cell_value = str(row_data[column]) if row_data[column] is not None else ''
-                    column_data.append(cell_value)
-                else:
-                    column_data.append('')
-            
-            # Copy to clipboard
-            clipboard = QApplication.clipboard()
-            clipboard.setText('\n'.join(column_data))
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Copy Error', f'Failed to copy column data:\n{str(e)}')
+        # Fetch only this column from the complete query in the background
+        self.start_clipboard_copy(tab_data['current_query'], 'column', column, header_text)
     
     def copy_row_with_header_for_split(self, tab_widget, tab_index, row):
         """Copy entire row with headers to clipboard for split screen tabs"""
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_data = self._split_data(tab_widget, tab_index)
+        if tab_data is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        results_table = tab_data['results_table']
-        
         # Get headers
-        headers = []
-        for col in range(results_table.columnCount()):
-            header_item = results_table.horizontalHeaderItem(col)
-            header_text = header_item.text() if header_item else f'Column {col + 1}'
-            headers.append(header_text)
-        
-        # Get row data
-        row_data = []
-        for col in range(results_table.columnCount()):
-            item = results_table.item(row, col)
-            cell_text = item.text() if item else ''
-            row_data.append(cell_text)
+        headers = self.get_result_headers(tab_data)
+        
+        # Get the row's display text from the model
+        model = tab_data['result_model']
+        row_data = [model.index(row, col).data() or '' for col in range(len(headers))]
         
         # Format as tab-separated values with headers
         result = '\t'.join(headers) + '\n' + '\t'.join(row_data)
         
         # Copy to clipboard
-        clipboard = QApplication.clipboard()
-        clipboard.setText(result)
+        self._set_clipboard_text(result)
     
     def copy_entire_table_for_split(self, tab_widget, tab_index):
         """Copy entire table with headers to clipboard for split screen tabs"""
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_data = self._split_data(tab_widget, tab_index)
+        if tab_data is None:
             return
             
-        # Get full data from complete query execution
-        try:
-            columns, full_data = self.execute_complete_query_for_split(tab_key)
-            if not columns:
-                return
-                
-            # Start with headers
-            table_data = ['\t'.join(columns)]
-            
-            # Add all row data
-            for row_data in full_data:
-                formatted_row = []
-                for cell_value in row_data:
-                    cell_text = str(cell_value) if cell_value is not None else ''
-                    formatted_row.append(cell_text)
-                table_data.append('\t'.join(formatted_row))
-            
-            # Copy to clipboard
-            clipboard = QApplication.clipboard()
-            clipboard.setText('\n'.join(table_data))
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Copy Error', f'Failed to copy table data:\n{str(e)}')
-    
-    def execute_complete_query_for_split(self, tab_key):
-        """Execute the complete query without pagination to get all results for split screen tabs"""
-        if tab_key not in self.split_query_tabs:
-            raise Exception("Invalid tab key")
-            
-        tab_data = self.split_query_tabs[tab_key]
-        query = tab_data['current_query']
-        
-        if not query:
-            raise Exception("No query to execute")
-            
-        if not self.connection:
-            raise Exception("No database connection available")
-            
-        # Execute the complete query without pagination
-        cursor = self.connection.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        
-        # Fetch all data
-        full_data = cursor.fetchall()
+        # The whole result is already in memory, serialize it without running the query again
+        if tab_data.get('data'):
+            self._set_clipboard_text(rows_to_tsv(tab_data['columns'], tab_data['data']))
+            return
         
-        return columns, full_data
+        # Let DuckDB serialize the complete query result as tab-separated text in the background
+        self.start_clipboard_copy(tab_data['current_query'], 'table')
     
     def copy_cell_value(self, tab_index, row, column):
         """Copy the value of a specific cell to clipboard"""
         if tab_index not in self.query_tabs:
             return
             
-        results_table = self.query_tabs[tab_index]['results_table']
-        item = results_table.item(row, column)
+        cell_text = self.query_tabs[tab_index]['result_model'].index(row, column).data()
         
-        if item:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(item.text())
+        if cell_text is not None:
+            self._set_clipboard_text(cell_text)
     
     def copy_column_with_header(self, tab_index, column):
         """Copy entire column with header to clipboard"""
@@ -3559,136 +4661,64 @@ class DuckDBSQLApp(QMainWindow):
             return
             
         tab_data = self.query_tabs[tab_index]
-        results_table = tab_data['results_table']
-        
         # Get column header
-        header_item = results_table.horizontalHeaderItem(column)
-        header_text = header_item.text() if header_item else f'Column {column + 1}'
+        header_text = tab_data['result_model'].column_name(column) or f'Column {column + 1}'
+        
+        # The whole result is already in memory, no need to run the query again
+        complete_data = tab_data.get('complete_data')
+        if complete_data:
+            if column < len(tab_data['columns']):
+                values = map(_cell_str, [row[column] if column < len(row) else None for row in complete_data])
+                self._set_clipboard_text('\n'.join([header_text, *values]))
+            return
         
-        # Get full data from complete query execution
-        try:
-            columns, full_data = self.execute_complete_query(tab_index)
-            if not columns or column >= len(columns):
-                return
-                
-            # Collect column data with header
-            column_data = [header_text]
-            
-            for row_data in full_data:
-                if column < len(row_data):
-                    cell_value = str(row_data[column]) if row_data[column] is not None else ''
-                    column_data.append(cell_value)
-                else:
-                    column_data.append('')
-            
-            # Copy to clipboard
-            clipboard = QApplication.clipboard()
-            clipboard.setText('\n'.join(column_data))
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Copy Error', f'Failed to copy column data:\n{str(e)}')
+        # Fetch only this column from the complete query in the background
+        self.start_clipboard_copy(tab_data['current_query'], 'column', column, header_text)
     
     def copy_row_with_header(self, tab_index, row):
         """Copy entire row with headers to clipboard"""
         if tab_index not in self.query_tabs:
             return
             
-        results_table = self.query_tabs[tab_index]['results_table']
-        
+        tab_data = self.query_tabs[tab_index]
         # Get headers
-        headers = []
-        for col in range(results_table.columnCount()):
-            header_item = results_table.horizontalHeaderItem(col)
-            header_text = header_item.text() if header_item else f'Column {col + 1}'
-            headers.append(header_text)
-        
-        # Get row data
-        row_data = []
-        for col in range(results_table.columnCount()):
-            item = results_table.item(row, col)
-            cell_text = item.text() if item else ''
-            row_data.append(cell_text)
+        headers = self.get_result_headers(tab_data)
+        
+        # Get the row's display text from the model
+        model = tab_data['result_model']
+        row_data = [model.index(row, col).data() or '' for col in range(len(headers))]
         
         # Format as tab-separated values with headers
         result = '\t'.join(headers) + '\n' + '\t'.join(row_data)
         
         # Copy to clipboard
-        clipboard = QApplication.clipboard()
-        clipboard.setText(result)
+        self._set_clipboard_text(result)
     
     def copy_entire_table(self, tab_index):
         """Copy entire table with headers to clipboard"""
         if tab_index not in self.query_tabs:
             return
             
-        # Get full data from complete query execution
-        try:
-            columns, full_data = self.execute_complete_query(tab_index)
-            if not columns:
-                return
-                
-            # Start with headers
-            table_data = ['\t'.join(columns)]
-            
-            # Add all row data
-            for row_data in full_data:
-                formatted_row = []
-                for cell_value in row_data:
-                    cell_text = str(cell_value) if cell_value is not None else ''
-                    formatted_row.append(cell_text)
-                table_data.append('\t'.join(formatted_row))
-            
-            # Copy to clipboard
-            clipboard = QApplication.clipboard()
-            clipboard.setText('\n'.join(table_data))
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Copy Error', f'Failed to copy table data:\n{str(e)}')
-
-    def open_nodes_dashboard(self, tab_index):
-        """Open the Nodes Dashboard (node.py) with the current query results"""
-        if tab_index not in self.query_tabs:
-            return
-            
         tab_data = self.query_tabs[tab_index]
-        query = tab_data.get('current_query')
         
-        if not query:
-            QMessageBox.warning(self, 'No Query', 'No active query to visualize.')
+        # The whole result is already in memory, serialize it without running the query again
+        if tab_data.get('complete_data'):
+            self._set_clipboard_text(rows_to_tsv(tab_data['columns'], tab_data['complete_data']))
             return
-            
-        try:
-            # Create temp file path
-            import tempfile
-            import subprocess
-            
-            # Create a temporary file name (we close the file descriptor because DuckDB will open it)
-            fd, temp_path = tempfile.mkstemp(suffix='.parquet')
-            os.close(fd)
-            
-            # Clean query (remove trailing semicolon)
-            clean_query = query.strip().rstrip(';')
-            
-            # Normalize path for DuckDB (replace backslashes with forward slashes to avoid escape issues)
-            duckdb_path = temp_path.replace('\\', '/')
-            
-            # Export directly using DuckDB
-            export_query = f"COPY ({clean_query}) TO '{duckdb_path}' (FORMAT PARQUET)"
-            self.connection.execute(export_query)
-            
-            # Launch node.py
-            app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'node.py')
-            
-            # Run in a separate process
-            subprocess.Popen([sys.executable, app_path, temp_path])
-            
-            self.status_label.setText(f'Opened Nodes Dashboard')
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Error', f'Failed to open Nodes Dashboard:\n{str(e)}')
+        
+        # Let DuckDB serialize the complete query result as tab-separated text in the background
+        self.start_clipboard_copy(tab_data['current_query'], 'table')
+
+    def open_nodes_dashboard(self, tab_index):
+        """Open the Nodes Dashboard (node.py) with the current query results"""
+        self._export_current_query_to_parquet(tab_index, NODE_PY, 'Nodes Dashboard')
 
     def open_main_dashboard(self, tab_index):
         """Open the Main Dashboard (dashboard.py) with the current query results"""
+        self._export_current_query_to_parquet(tab_index, DASHBOARD_PY, 'Dashboard')
+    
+    def _export_current_query_to_parquet(self, tab_index, script_path, dashboard_name):
+        """Export the tab's query results to a temporary Parquet file in the background, then launch script_path on it"""
         if tab_index not in self.query_tabs:
             return
             
@@ -3700,9 +4730,7 @@ class DuckDBSQLApp(QMainWindow):
             return
             
         try:
-            # Create temp file path
             import tempfile
-            import subprocess
             
             # Create a temporary file name (we close the file descriptor because DuckDB will open it)
             fd, temp_path = tempfile.mkstemp(suffix='.parquet')
@@ -3711,62 +4739,43 @@ class DuckDBSQLApp(QMainWindow):
             # Clean query (remove trailing semicolon)
             clean_query = query.strip().rstrip(';')
             
-            # Normalize path for DuckDB (replace backslashes with forward slashes to avoid escape issues)
-            duckdb_path = temp_path.replace('\\', '/')
+            export_thread = ParquetExportThread(self.connection, clean_query, temp_path, script_path)
+            export_thread.export_finished.connect(
+                lambda path, script: self.launch_dashboard(path, script, dashboard_name))
+            export_thread.error_occurred.connect(
+                lambda error: QMessageBox.critical(self, 'Error', f'Failed to open {dashboard_name}:\n{error}'))
+            export_thread.finished.connect(lambda: self._dashboard_export_threads.discard(export_thread))
+            self._dashboard_export_threads.add(export_thread)
+            export_thread.start()
             
-            # Export directly using DuckDB
-            export_query = f"COPY ({clean_query}) TO '{duckdb_path}' (FORMAT PARQUET)"
-            self.connection.execute(export_query)
-            
-            # Launch dashboard.py
-            main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py')
-            
-            # Run in a separate process
-            subprocess.Popen([sys.executable, main_path, temp_path])
-            
-            self.status_label.setText(f'Opened Dashboard')
+            self.status_label.setText(f'Preparing {dashboard_name}...')
             
         except Exception as e:
-            QMessageBox.critical(self, 'Error', f'Failed to open Dashboard:\n{str(e)}')
+            QMessageBox.critical(self, 'Error', f'Failed to open {dashboard_name}:\n{str(e)}')
     
-    def execute_complete_query(self, tab_index):
-        """Execute the complete query without pagination to get all results"""
-        if tab_index not in self.query_tabs:
-            raise Exception("Invalid tab index")
-            
-        tab_data = self.query_tabs[tab_index]
-        query = tab_data['current_query']
-        
-        if not query:
-            raise Exception("No query to execute")
-            
-        if not self.connection:
-            raise Exception("No database connection available")
-            
-        # Execute the complete query without pagination
-        cursor = self.connection.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        
-        # Fetch all data
-        full_data = cursor.fetchall()
-        
-        return columns, full_data
+    def launch_dashboard(self, parquet_path, script_path, dashboard_name):
+        """Run a dashboard script on an exported Parquet file in a separate process"""
+        try:
+            import subprocess
+            subprocess.Popen([sys.executable, script_path, parquet_path])
+            self.status_label.setText(f'Opened {dashboard_name}')
+        except Exception as e:
+            QMessageBox.critical(self, 'Error', f'Failed to open {dashboard_name}:\n{str(e)}')
     
     def load_saved_connections(self):
         """Load saved connections from file"""
         try:
             if os.path.exists(self.connections_file):
-                with open(self.connections_file, 'r') as f:
-                    return json.load(f)
+                return read_json_file(self.connections_file)
         except Exception as e:
             print(f"Error loading connections: {e}")
         return []
     
     def save_connections(self):
         """Save database connections to file"""
+        self._saved_connection_names = {conn['name'] for conn in self.saved_connections}
         try:
-            with open('db_connections.json', 'w') as f:
-                json.dump(self.saved_connections, f, indent=2)
+            write_json_file(self.connections_file, self.saved_connections)
         except Exception as e:
             print(f"Error saving connections: {e}")
     
@@ -3784,506 +4793,190 @@ class DuckDBSQLApp(QMainWindow):
             QMessageBox.warning(self, 'Empty Query', 'Please enter a SQL query to save.')
             return
         
-        # Get query name from user
-        name, ok = QInputDialog.getText(self, 'Save Query', 'Enter a name for this query:')
-        if not ok or not name.strip():
-            return
-        
-        # Get query description from user
-        description, ok = QInputDialog.getText(self, 'Save Query', 'Enter a description (optional):')
-        if not ok:
-            description = ''
-        
-        # Load existing saved queries
-        saved_queries = self.load_saved_queries()
-        
-        # Check if query name already exists
-        if any(q['name'] == name.strip() for q in saved_queries):
-            reply = QMessageBox.question(self, 'Query Exists', 
-                                       f'A query named "{name.strip()}" already exists. Do you want to overwrite it?',
-                                       QMessageBox.Yes | QMessageBox.No)
-            if reply != QMessageBox.Yes:
-                return
-            
-            # Remove existing query with same name
-            saved_queries = [q for q in saved_queries if q['name'] != name.strip()]
-        
-        # Add new query
-        from datetime import datetime
-        new_query = {
-            'name': name.strip(),
-            'description': description.strip(),
-            'query': query_text,
-            'date_saved': datetime.now().isoformat()
-        }
-        
-        saved_queries.append(new_query)
-        
-        # Save to file
-        try:
-            with open('saved_queries.json', 'w') as f:
-                json.dump(saved_queries, f, indent=2)
-            QMessageBox.information(self, 'Query Saved', f'Query "{name.strip()}" has been saved successfully.')
-        except Exception as e:
-            QMessageBox.critical(self, 'Save Error', f'Failed to save query: {str(e)}')
-    
-    def load_query(self):
-        """Load a saved query into the current tab"""
-        saved_queries = self.load_saved_queries()
-        
-        if not saved_queries:
-            QMessageBox.information(self, 'No Saved Queries', 'No saved queries found.')
-            return
-        
-        # Create a simple selection dialog
-        query_names = [f"{q['name']} - {q['description'][:50]}..." if len(q['description']) > 50 else f"{q['name']} - {q['description']}" for q in saved_queries]
-        
-        selected_query, ok = QInputDialog.getItem(self, 'Load Query', 'Select a query to load:', query_names, 0, False)
-        if not ok:
-            return
-        
-        # Find the selected query
-        selected_index = query_names.index(selected_query)
-        query_data = saved_queries[selected_index]
-        
-        # Load into current tab
-        current_tab_index = self.query_tab_widget.currentIndex()
-        if current_tab_index in self.query_tabs:
-            tab_data = self.query_tabs[current_tab_index]
-            tab_data['sql_editor'].setPlainText(query_data['query'])
-            QMessageBox.information(self, 'Query Loaded', f'Query "{query_data["name"]}" has been loaded.')
-        else:
-            QMessageBox.warning(self, 'No Active Tab', 'No active query tab found.')
-    
-    def show_query_manager(self):
-        """Show the query management dialog"""
-        saved_queries = self.load_saved_queries()
-        dialog = SavedQueryManagerDialog(self, saved_queries)
-        if dialog.exec_() == QDialog.Accepted:
-            # Refresh saved queries if any changes were made
-            pass
-    
-    def load_saved_queries(self):
-        """Load saved queries from JSON file"""
-        try:
-            if os.path.exists('saved_queries.json'):
-                with open('saved_queries.json', 'r') as f:
-                    return json.load(f)
-            return []
-        except Exception as e:
-            print(f"Error loading saved queries: {e}")
-            return []
-    
-    def add_custom_autocomplete_entries(self, entries):
-        """Add custom auto-complete entries to all SQL editors"""
-        if not isinstance(entries, (list, tuple)):
-            return
-        
-        # Add to global list
-        SQL_AUTOCOMPLETE_KEYWORDS.extend(entries)
-        
-        # Update all existing SQL editors in tabs
-        for i in range(self.query_tab_widget.count()):
-            tab_widget = self.query_tab_widget.widget(i)
-            if hasattr(tab_widget, 'findChild'):
-                sql_editor = tab_widget.findChild(SQLTextEdit)
-                if sql_editor:
-                    sql_editor.add_custom_completions(entries)
-    
-    def get_current_sql_editor(self):
-        """Get the SQL editor from the current tab"""
-        current_tab = self.query_tab_widget.currentWidget()
-        if current_tab and hasattr(current_tab, 'findChild'):
-            return current_tab.findChild(SQLTextEdit)
-        return None
-    
-    def closeEvent(self, event):
-        """Clean up when closing the application"""
-        if hasattr(self, 'query_thread') and self.query_thread.isRunning():
-            self.query_thread.terminate()
-            self.query_thread.wait()
-        
-        self.connection.close()
-        event.accept()
-
-    def set_theme(self, theme_name):
-        """Set the application theme"""
-        themes = {
-            'light': {
-                'background': '#ffffff',
-                'text': '#000000',
-                'button': '#f0f0f0',
-                'button_hover': '#e0e0e0',
-                'input': '#ffffff',
-                'border': '#cccccc',
-                'selection': '#0078d4',
-                'menu': '#ffffff',
-                'menu_hover': '#e0e0e0'
-            },
-            'dark': {
-                'background': '#2b2b2b',
-                'text': '#ffffff',
-                'button': '#404040',
-                'button_hover': '#505050',
-                'input': '#3c3c3c',
-                'border': '#555555',
-                'selection': '#0078d4',
-                'menu': '#2b2b2b',
-                'menu_hover': '#404040'
-            },
-            'blue': {
-                'background': '#1e3a5f',
-                'text': '#ffffff',
-                'button': '#2c5282',
-                'button_hover': '#3c6382',
-                'input': '#2a4a6b',
-                'border': '#4a6fa5',
-                'selection': '#63b3ed',
-                'menu': '#1e3a5f',
-                'menu_hover': '#2c5282'
-            },
-            'green': {
-                'background': '#1a4d3a',
-                'text': '#ffffff',
-                'button': '#2d7d32',
-                'button_hover': '#388e3c',
-                'input': '#2e5d3e',
-                'border': '#4caf50',
-                'selection': '#81c784',
-                'menu': '#1a4d3a',
-                'menu_hover': '#2d7d32'
-            },
-            'high_contrast': {
-                'background': '#000000',
-                'text': '#ffffff',
-                'button': '#ffffff',
-                'button_hover': '#ffff00',
-                'button_text': '#000000',
-                'button_hover_text': '#000000',
-                'input': '#000000',
-                'input_text': '#ffffff',
-                'border': '#ffffff',
-                'selection': '#ffff00',
-                'selection_text': '#000000',
-                'menu': '#000000',
-                'menu_hover': '#ffff00',
-                'menu_hover_text': '#000000'
-            }
-        }
-        
-        if theme_name not in themes:
-            return
-            
-        theme = themes[theme_name]
-        
-        # Apply theme stylesheet
-        # Handle high contrast theme specific colors
-        button_text = theme.get('button_text', theme['text'])
-        button_hover_text = theme.get('button_hover_text', theme['text'])
-        input_text = theme.get('input_text', theme['text'])
-        selection_text = theme.get('selection_text', theme['text'])
-        menu_hover_text = theme.get('menu_hover_text', theme['text'])
-        
-        stylesheet = f"""
-        QMainWindow {{
-            background-color: {theme['background']};
-            color: {theme['text']};
-        }}
-        
-        QWidget {{
-            background-color: {theme['background']};
-            color: {theme['text']};
-        }}
-        
-        QPushButton {{
-            background-color: {theme['button']};
-            color: {button_text};
-            border: 2px solid {theme['border']};
-            padding: 5px 10px;
-            border-radius: 3px;
-            font-weight: bold;
-        }}
-        
-        QPushButton:hover {{
-            background-color: {theme['button_hover']};
-            color: {button_hover_text};
-            border: 2px solid {theme['border']};
-        }}
-        
-        QPushButton:pressed {{
-            background-color: {theme['border']};
-            color: {button_hover_text};
-        }}
-        
-        QLineEdit, QTextEdit, QPlainTextEdit {{
-            background-color: {theme['input']};
-            color: {input_text};
-            border: 2px solid {theme['border']};
-            padding: 3px;
-            border-radius: 2px;
-        }}
-        
-        QTreeWidget {{
-            background-color: {theme['input']};
-            color: {input_text};
-            border: 2px solid {theme['border']};
-            selection-background-color: {theme['selection']};
-            selection-color: {selection_text};
-        }}
-        
-        QTableWidget {{
-            background-color: {theme['input']};
-            color: {input_text};
-            border: 2px solid {theme['border']};
-            gridline-color: {theme['border']};
-            selection-background-color: {theme['selection']};
-            selection-color: {selection_text};
-        }}
-        
-        QHeaderView::section {{
-            background-color: {theme['button']};
-            color: {button_text};
-            border: 2px solid {theme['border']};
-            padding: 3px;
-            font-weight: bold;
-        }}
-        
-        QMenuBar {{
-            background-color: {theme['menu']};
-            color: {theme['text']};
-            border-bottom: 2px solid {theme['border']};
-        }}
-        
-        QMenuBar::item {{
-            background-color: transparent;
-            padding: 4px 8px;
-            color: {theme['text']};
-        }}
-        
-        QMenuBar::item:selected {{
-            background-color: {theme['menu_hover']};
-            color: {menu_hover_text};
-        }}
-        
-        QMenu {{
-            background-color: {theme['menu']};
-            color: {theme['text']};
-            border: 2px solid {theme['border']};
-        }}
-        
-        QMenu::item {{
-            padding: 4px 20px;
-            color: {theme['text']};
-        }}
-        
-        QMenu::item:selected {{
-            background-color: {theme['menu_hover']};
-            color: {menu_hover_text};
-        }}
-        
-        QGroupBox {{
-            color: {theme['text']};
-            border: 2px solid {theme['border']};
-            border-radius: 3px;
-            margin-top: 10px;
-            font-weight: bold;
-        }}
-        
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-            color: {theme['text']};
-        }}
-        
-        QLabel {{
-            color: {theme['text']};
-            font-weight: bold;
-        }}
-        
-        QComboBox {{
-            background-color: {theme['input']};
-            color: {input_text};
-            border: 2px solid {theme['border']};
-            padding: 3px;
-            border-radius: 2px;
-            font-weight: bold;
-        }}
-        
-        QComboBox::drop-down {{
-            border: none;
-            background-color: {theme['button']};
-        }}
-        
-        QComboBox::down-arrow {{
-            border: none;
-            color: {button_text};
-        }}
-        
-        QScrollBar:vertical {{
-            background-color: {theme['background']};
-            width: 15px;
-            border: 2px solid {theme['border']};
-        }}
-        
-        QScrollBar::handle:vertical {{
-            background-color: {theme['button']};
-            border-radius: 3px;
-            border: 1px solid {theme['border']};
-            min-height: 20px;
-        }}
-        
-        QScrollBar::handle:vertical:hover {{
-            background-color: {theme['button_hover']};
-        }}
-        
-        QScrollBar::add-line:vertical {{
-            background-color: {theme['button']};
-            height: 15px;
-            border: 1px solid {theme['border']};
-            subcontrol-position: bottom;
-            subcontrol-origin: margin;
-        }}
-        
-        QScrollBar::sub-line:vertical {{
-            background-color: {theme['button']};
-            height: 15px;
-            border: 1px solid {theme['border']};
-            subcontrol-position: top;
-            subcontrol-origin: margin;
-        }}
-        
-        QScrollBar::add-line:vertical:hover, QScrollBar::sub-line:vertical:hover {{
-            background-color: {theme['button_hover']};
-        }}
-        
-        QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {{
-            width: 8px;
-            height: 8px;
-            background-color: {button_text};
-        }}
-        
-        QScrollBar:horizontal {{
-            background-color: {theme['background']};
-            height: 15px;
-            border: 2px solid {theme['border']};
-        }}
-        
-        QScrollBar::handle:horizontal {{
-            background-color: {theme['button']};
-            border-radius: 3px;
-            border: 1px solid {theme['border']};
-            min-width: 20px;
-        }}
-        
-        QScrollBar::handle:horizontal:hover {{
-            background-color: {theme['button_hover']};
-        }}
-        
-        QScrollBar::add-line:horizontal {{
-            background-color: {theme['button']};
-            width: 15px;
-            border: 1px solid {theme['border']};
-            subcontrol-position: right;
-            subcontrol-origin: margin;
-        }}
-        
-        QScrollBar::sub-line:horizontal {{
-            background-color: {theme['button']};
-            width: 15px;
-            border: 1px solid {theme['border']};
-            subcontrol-position: left;
-            subcontrol-origin: margin;
-        }}
-        
-        QScrollBar::add-line:horizontal:hover, QScrollBar::sub-line:horizontal:hover {{
-            background-color: {theme['button_hover']};
-        }}
+        # Get query name from user
+        name, ok = QInputDialog.getText(self, 'Save Query', 'Enter a name for this query:')
+        if not ok or not name.strip():
+            return
         
-        QScrollBar::left-arrow:horizontal, QScrollBar::right-arrow:horizontal {{
-            width: 8px;
-            height: 8px;
-            background-color: {button_text};
-        }}
+        # Get query description from user
+        description, ok = QInputDialog.getText(self, 'Save Query', 'Enter a description (optional):')
+        if not ok:
+            description = ''
         
-        QDialog {{
-            background-color: {theme['background']};
-            color: {theme['text']};
-            border: 2px solid {theme['border']};
-        }}
+        # Load existing saved queries
+        saved_queries = self.load_saved_queries()
         
-        QRadioButton {{
-            color: {theme['text']};
-            font-weight: bold;
-        }}
+        # Check if query name already exists
+        if any(q['name'] == name.strip() for q in saved_queries):
+            reply = QMessageBox.question(self, 'Query Exists', 
+                                       f'A query named "{name.strip()}" already exists. Do you want to overwrite it?',
+                                       QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+            
+            # Remove existing query with same name
+            saved_queries = [q for q in saved_queries if q['name'] != name.strip()]
         
-        QRadioButton::indicator {{
-            width: 15px;
-            height: 15px;
-            border: 2px solid {theme['border']};
-            border-radius: 8px;
-            background-color: {theme['input']};
-        }}
+        # Add new query
+        from datetime import datetime
+        new_query = {
+            'name': name.strip(),
+            'description': description.strip(),
+            'query': query_text,
+            'date_saved': datetime.now().isoformat()
+        }
         
-        QRadioButton::indicator:checked {{
-            background-color: {theme['selection']};
-            border: 2px solid {theme['border']};
-        }}
+        saved_queries.append(new_query)
         
-        QTabWidget::pane {{
-            border: 2px solid {theme['border']};
-            background-color: {theme['background']};
-        }}
+        # Save to file
+        try:
+            write_json_file('saved_queries.json', saved_queries)
+            QMessageBox.information(self, 'Query Saved', f'Query "{name.strip()}" has been saved successfully.')
+        except Exception as e:
+            QMessageBox.critical(self, 'Save Error', f'Failed to save query: {str(e)}')
+    
+    def load_query(self):
+        """Load a saved query into the current tab"""
+        saved_queries = self.load_saved_queries()
         
-        QTabBar::tab {{
-            background-color: {theme['button']};
-            color: {button_text};
-            border: 2px solid {theme['border']};
-            padding: 8px 12px;
-            margin-right: 2px;
-            border-bottom: none;
-            font-weight: bold;
-            min-width: 80px;
-            max-width: 200px;
-        }}
+        if not saved_queries:
+            QMessageBox.information(self, 'No Saved Queries', 'No saved queries found.')
+            return
         
-        QTabBar::tab:selected {{
-            background-color: {theme['background']};
-            color: {theme['text']};
-            border-bottom: 2px solid {theme['background']};
-        }}
+        # Create a simple selection dialog
+        query_names = [f"{q['name']} - {q['description'][:50]}..." if len(q['description']) > 50 else f"{q['name']} - {q['description']}" for q in saved_queries]
         
-        QTabBar::tab:hover {{
-            background-color: {theme['button_hover']};
-            color: {button_hover_text};
-        }}
+        selected_query, ok = QInputDialog.getItem(self, 'Load Query', 'Select a query to load:', query_names, 0, False)
+        if not ok:
+            return
         
-        QTabBar::close-button {{
-            background-color: {theme['button']};
-            color: {button_text};
-            border: 1px solid {theme['border']};
-            border-radius: 2px;
-            width: 16px;
-            height: 16px;
-            margin: 2px;
-            font-weight: bold;
-            font-size: 12px;
-            subcontrol-position: right;
-        }}
+        # Find the selected query
+        selected_index = query_names.index(selected_query)
+        query_data = saved_queries[selected_index]
         
-        QTabBar::close-button:hover {{
-            background-color: {theme['selection']};
-            color: {selection_text};
-            border: 1px solid {theme['text']};
-        }}
+        # Load into current tab
+        current_tab_index = self.query_tab_widget.currentIndex()
+        if current_tab_index in self.query_tabs:
+            tab_data = self.query_tabs[current_tab_index]
+            tab_data['sql_editor'].setPlainText(query_data['query'])
+            QMessageBox.information(self, 'Query Loaded', f'Query "{query_data["name"]}" has been loaded.')
+        else:
+            QMessageBox.warning(self, 'No Active Tab', 'No active query tab found.')
+    
+    def show_query_manager(self):
+        """Show the query management dialog"""
+        saved_queries = self.load_saved_queries()
+        dialog = SavedQueryManagerDialog(self, saved_queries)
+        if dialog.exec_() == QDialog.Accepted:
+            # Refresh saved queries if any changes were made
+            pass
+    
+    def load_saved_queries(self):
+        """Load saved queries from JSON file"""
+        try:
+            if os.path.exists('saved_queries.json'):
+                return read_json_file('saved_queries.json')
+            return []
+        except Exception as e:
+            print(f"Error loading saved queries: {e}")
+            return []
+    
+    def add_custom_autocomplete_entries(self, entries):
+        """Add custom auto-complete entries to all SQL editors"""
+        if not isinstance(entries, (list, tuple)):
+            return
         
-        QTabBar::close-button:pressed {{
-            background-color: {theme['border']};
-            color: {button_hover_text};
-        }}
-        """
+        # Add to global list
+        SQL_AUTOCOMPLETE_KEYWORDS.extend(entries)
+        
+        # Update all existing SQL editors in tabs
+        for i in range(self.query_tab_widget.count()):
+            tab_widget = self.query_tab_widget.widget(i)
+            if hasattr(tab_widget, 'findChild'):
+                sql_editor = tab_widget.findChild(SQLTextEdit)
+                if sql_editor:
+                    sql_editor.add_custom_completions(entries)
+    
+    def get_current_sql_editor(self):
+        """Get the SQL editor from the current tab"""
+        current_tab = self.query_tab_widget.currentWidget()
+        if current_tab and hasattr(current_tab, 'findChild'):
+            return current_tab.findChild(SQLTextEdit)
+        return None
+    
+    def closeEvent(self, event):
+        """Clean up when closing the application"""
+        threads = [tab_data.get('query_thread') for tab_data in self.query_tabs.values()]
+        threads.extend(tab_data.get('multi_query_thread') for tab_data in self.query_tabs.values())
+        threads.extend(tab_data.get('streaming_thread') for tab_data in self.query_tabs.values())
+        threads.extend(self._retired_streaming_threads)
+        for widget_tabs in self.split_query_tabs.values():
+            threads.extend(tab_data.get('query_thread') for tab_data in widget_tabs.values())
+            threads.extend(tab_data.get('streaming_thread') for tab_data in widget_tabs.values())
+        threads.append(getattr(self, 'query_thread', None))
+        threads.append(getattr(self, 'export_query_thread', None))
+        threads.append(self._autocomplete_thread)
+        threads.extend(self._schema_load_threads.values())
+        threads.extend(self._dashboard_export_threads)
+        threads.extend(self._clipboard_copy_threads)
+        threads = [thread for thread in threads if thread is not None and thread.isRunning()]
+        
+        # Ask workers to stop and cancel running queries instead of killing the threads,
+        # which could leave DuckDB in an inconsistent state. Metadata, dashboard and clipboard
+        # workers run on their own cursors, which the app connection's interrupt doesn't reach
+        connections = {id(self.connection): self.connection}
+        for thread in threads:
+            if hasattr(thread, 'cancel'):
+                thread.cancel()
+            connection = getattr(thread, 'connection', None)
+            if connection is not None:
+                connections[id(connection)] = connection
+        if threads:
+            self._interrupt_connections(connections.values())
+        # Wait for every worker to return: a QThread destroyed while running aborts the
+        # process, and closing the connection under a running query is unsafe. Interrupt
+        # again while waiting, for statements a worker started after the first interrupt
+        for thread in threads:
+            thread.quit()
+            while not thread.wait(1000):
+                self._interrupt_connections(connections.values())
+        
+        # Write a theme change that is still waiting for its debounce timer
+        if self._config_flush_pending:
+            self._flush_config()
         
-        self.setStyleSheet(stylesheet)
+        self.connection.close()
+        event.accept()
+
+    def _interrupt_connections(self, connections):
+        """Interrupt the running query on each connection, skipping cursors a worker already closed"""
+        for connection in connections:
+            try:
+                connection.interrupt()
+            except duckdb.Error:
+                pass
+
+    def set_theme(self, theme_name):
+        """Set the application theme"""
+        if theme_name not in THEMES:
+            return
+            
+        # Apply theme stylesheet; setting the same one again would still make Qt re-polish every widget
+        stylesheet = compiled_stylesheet(theme_name)
+        if stylesheet is not self._applied_stylesheet:
+            self.setStyleSheet(stylesheet)
+            self._applied_stylesheet = stylesheet
+        
+        # Tab close buttons have their own stylesheet, so restyle the existing ones too
+        close_button_style = close_button_stylesheet(theme_name)
+        if close_button_style is not self._close_button_style:
+            self._close_button_style = close_button_style
+            tab_states = list(self.query_tabs.values())
+            for widget_tabs in self.split_query_tabs.values():
+                tab_states.extend(widget_tabs.values())
+            for tab_data in tab_states:
+                if tab_data.get('close_button'):
+                    tab_data['close_button'].setStyleSheet(close_button_style)
         
         # Update theme action states
         for action in self.theme_group.actions():
@@ -4305,44 +4998,46 @@ class DuckDBSQLApp(QMainWindow):
         self.save_theme_preference()
     
     def save_theme_preference(self):
-        """Save the current theme preference to a file"""
+        """Save the current theme preference, coalescing rapid theme changes into one write"""
+        if self._config_cache.get('theme') == self.current_theme:
+            return
+        self._config_cache['theme'] = self.current_theme
+        if self._config_flush_pending:
+            return
+        self._config_flush_pending = True
+        QTimer.singleShot(500, self._flush_config)
+    
+    def _flush_config(self):
+        """Write the cached config to disk"""
+        if not self._config_flush_pending:
+            return
+        self._config_flush_pending = False
         try:
-            import json
-            import os
-            
             config_dir = os.path.expanduser('~/.duckdb_sql_app')
             os.makedirs(config_dir, exist_ok=True)
             
             config_file = os.path.join(config_dir, 'config.json')
-            config = {}
-            
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            
-            config['theme'] = self.current_theme
-            
             with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+                json.dump(self._config_cache, f, indent=2)
         except Exception as e:
             print(f"Error saving theme preference: {e}")
     
     def load_theme_preference(self):
         """Load the saved theme preference"""
         try:
-            import json
-            import os
-            
             config_file = os.path.expanduser('~/.duckdb_sql_app/config.json')
             
-            if os.path.exists(config_file):
+            # Open directly instead of checking os.path.exists first
+            try:
                 with open(config_file, 'r') as f:
                     config = json.load(f)
-                    
-                theme = config.get('theme', 'light')
-                self.set_theme(theme)
-            else:
-                self.set_theme('light')
+            except FileNotFoundError:
+                config = {}
+            
+            theme = config.get('theme', 'light')
+            # Keep the whole config so later saves don't have to re-read it
+            self._config_cache = config
+            self.set_theme(theme)
         except Exception as e:
             print(f"Error loading theme preference: {e}")
             self.set_theme('light')
@@ -4355,6 +5050,58 @@ class DuckDBSQLApp(QMainWindow):
     
 
 
+    def _build_pagination_bar(self, with_cancel=True):
+        """Create the page info label, page buttons, page size selector and progress bar.
+
+        Returns the widgets unwired so each caller connects its own handlers;
+        cancel_btn is None when with_cancel is False. The paging widgets share one
+        container so they can be shown or hidden with a single call.
+        """
+        pagination_layout = QHBoxLayout()
+        pagination_container = QWidget()
+        paging_layout = QHBoxLayout(pagination_container)
+        paging_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Page info and controls
+        page_info_label = QLabel('No results')
+        first_page_btn = QPushButton('First')
+        prev_page_btn = QPushButton('Previous')
+        next_page_btn = QPushButton('Next')
+        last_page_btn = QPushButton('Last')
+        
+        # Page size selector
+        page_size_label = QLabel('Rows per page:')
+        page_size_combo = QComboBox()
+        page_size_combo.addItems(['1000', '5000', '10000', '25000', '50000'])
+        page_size_combo.setCurrentText('10000')
+        
+        # Cancel query button
+        cancel_btn = None
+        if with_cancel:
+            cancel_btn = QPushButton('Cancel Query')
+            cancel_btn.setEnabled(False)
+        
+        # Progress bar
+        progress_bar = QProgressBar()
+        progress_bar.setVisible(False)
+        progress_bar.setMaximum(100)
+        
+        paging_layout.addWidget(page_info_label)
+        paging_layout.addStretch()
+        paging_layout.addWidget(first_page_btn)
+        paging_layout.addWidget(prev_page_btn)
+        paging_layout.addWidget(next_page_btn)
+        paging_layout.addWidget(last_page_btn)
+        paging_layout.addStretch()
+        paging_layout.addWidget(page_size_label)
+        paging_layout.addWidget(page_size_combo)
+        pagination_layout.addWidget(pagination_container)
+        if cancel_btn is not None:
+            pagination_layout.addWidget(cancel_btn)
+        
+        return (pagination_layout, pagination_container, page_info_label, first_page_btn, prev_page_btn,
+                next_page_btn, last_page_btn, page_size_label, page_size_combo, progress_bar, cancel_btn)
+    
     def add_new_query_tab(self):
         """Add a new query tab with SQL editor and results table"""
         self.tab_counter += 1
@@ -4420,45 +5167,18 @@ class DuckDBSQLApp(QMainWindow):
         results_layout = QVBoxLayout(results_group)
         
         # Pagination controls
-        pagination_layout = QHBoxLayout()
-        
-        # Page info and controls
-        page_info_label = QLabel('No results')
-        first_page_btn = QPushButton('First')
-        prev_page_btn = QPushButton('Previous')
-        next_page_btn = QPushButton('Next')
-        last_page_btn = QPushButton('Last')
-        
-        # Page size selector
-        page_size_label = QLabel('Rows per page:')
-        page_size_combo = QComboBox()
-        page_size_combo.addItems(['1000', '5000', '10000', '25000', '50000'])
-        page_size_combo.setCurrentText('10000')
-        
-        # Cancel query button
-        cancel_btn = QPushButton('Cancel Query')
-        cancel_btn.setEnabled(False)
-        
-        # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setVisible(False)
-        progress_bar.setMaximum(100)
-        
-        pagination_layout.addWidget(page_info_label)
-        pagination_layout.addStretch()
-        pagination_layout.addWidget(first_page_btn)
-        pagination_layout.addWidget(prev_page_btn)
-        pagination_layout.addWidget(next_page_btn)
-        pagination_layout.addWidget(last_page_btn)
-        pagination_layout.addStretch()
-        pagination_layout.addWidget(page_size_label)
-        pagination_layout.addWidget(page_size_combo)
-        pagination_layout.addWidget(cancel_btn)
+        (pagination_layout, pagination_container, page_info_label, first_page_btn, prev_page_btn, next_page_btn,
+         last_page_btn, page_size_label, page_size_combo, progress_bar,
+         cancel_btn) = self._build_pagination_bar()
         
         # Add progress bar below pagination controls
         results_layout.addWidget(progress_bar)
         
-        results_table = QTableWidget()
+        # The model only formats the cells being painted
+        results_table = QTableView()
+        result_model = ResultTableModel(results_table, _display_cell)
+        results_table.setModel(result_model)
+        results_table.horizontalHeader().setResizeContentsPrecision(self.COLUMN_FIT_SAMPLE_ROWS)
         
         results_layout.addLayout(pagination_layout)
         results_layout.addWidget(results_table)
@@ -4475,49 +5195,39 @@ class DuckDBSQLApp(QMainWindow):
         
         # Set up context menu for results table (after tab_index is defined)
         results_table.setContextMenuPolicy(Qt.CustomContextMenu)
-        results_table.customContextMenuRequested.connect(lambda pos, tab_idx=tab_index: self.show_results_context_menu(pos, tab_idx))
+        results_table.customContextMenuRequested.connect(lambda pos: self.show_results_context_menu(pos, self.query_tab_widget.indexOf(tab_widget)))
         
         # Set up context menu for table headers
         results_table.horizontalHeader().setContextMenuPolicy(Qt.CustomContextMenu)
-        results_table.horizontalHeader().customContextMenuRequested.connect(lambda pos, tab_idx=tab_index: self.show_header_context_menu(pos, tab_idx))
+        results_table.horizontalHeader().customContextMenuRequested.connect(lambda pos: self.show_header_context_menu(pos, self.query_tab_widget.indexOf(tab_widget)))
         
         # Create custom close button for this tab
         close_button = QPushButton('×')
         close_button.setFixedSize(16, 16)
-        close_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {self.get_current_theme_color('text')};
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: red;
-                color: white;
-                border-radius: 8px;
-            }}
-        """)
+        close_button.setStyleSheet(self._close_button_style)
         close_button.setToolTip('Close tab')
-        close_button.clicked.connect(lambda: self.close_query_tab(tab_index))
+        close_button.clicked.connect(lambda: self.close_query_tab(self.query_tab_widget.indexOf(tab_widget)))
         
         # Add close button to tab
         self.query_tab_widget.tabBar().setTabButton(tab_index, self.query_tab_widget.tabBar().RightSide, close_button)
         
-        # Connect pagination controls
-        first_page_btn.clicked.connect(lambda: self.go_to_page(tab_index, 0))
-        prev_page_btn.clicked.connect(lambda: self.prev_page(tab_index))
-        next_page_btn.clicked.connect(lambda: self.next_page(tab_index))
-        last_page_btn.clicked.connect(lambda: self.go_to_last_page(tab_index))
-        page_size_combo.currentTextChanged.connect(lambda: self.change_page_size(tab_index))
-        cancel_btn.clicked.connect(lambda: self.cancel_query(tab_index))
-        
-        # Store tab components
-        self.query_tabs[tab_index] = {
+        # Connect pagination controls; the index is looked up on click since closing a tab shifts the others
+        index_of = self.query_tab_widget.indexOf
+        first_page_btn.clicked.connect(lambda: self.go_to_page(index_of(tab_widget), 0))
+        prev_page_btn.clicked.connect(lambda: self.prev_page(index_of(tab_widget)))
+        next_page_btn.clicked.connect(lambda: self.next_page(index_of(tab_widget)))
+        last_page_btn.clicked.connect(lambda: self.go_to_last_page(index_of(tab_widget)))
+        page_size_combo.currentTextChanged.connect(lambda: self.change_page_size(index_of(tab_widget)))
+        cancel_btn.clicked.connect(lambda: self.cancel_query(index_of(tab_widget)))
+        
+        # Store tab components on the tab page itself
+        tab_widget.tab_state = {
             'sql_editor': sql_editor,
             'results_table': results_table,
+            'result_model': result_model,
             'query_thread': None,
             'streaming_thread': None,
+            'stopping_streaming_thread': None,  # Cancelled streaming thread the next query waits for
             'close_button': close_button,
             'page_info_label': page_info_label,
             'first_page_btn': first_page_btn,
@@ -4525,8 +5235,11 @@ class DuckDBSQLApp(QMainWindow):
             'next_page_btn': next_page_btn,
             'last_page_btn': last_page_btn,
             'page_size_combo': page_size_combo,
+            'page_size': int(page_size_combo.currentText()),  # updated by the page size handlers
             'cancel_btn': cancel_btn,
             'progress_bar': progress_bar,
+            'results_group': results_group,
+            'pagination_container': pagination_container,
             'current_page': 0,
             'total_rows': 0,
             'current_query': '',
@@ -4538,20 +5251,6 @@ class DuckDBSQLApp(QMainWindow):
         
         return tab_index
     
-    def get_current_theme_color(self, color_type):
-        """Get color from current theme"""
-        if hasattr(self, 'themes') and hasattr(self, 'current_theme'):
-            theme = self.themes[self.current_theme]
-            return theme.get(color_type, '#000000')
-        else:
-            # Default colors when themes aren't loaded yet
-            defaults = {
-                'text': '#000000',
-                'background': '#ffffff',
-                'button': '#f0f0f0'
-            }
-            return defaults.get(color_type, '#000000')
-    
     def close_query_tab(self, index):
         """Close a query tab with comprehensive memory cleanup"""
         if self.query_tab_widget.count() <= 1:
@@ -4563,10 +5262,7 @@ class DuckDBSQLApp(QMainWindow):
             tab_data = self.query_tabs[index]
             
             # Stop streaming thread
-            if tab_data.get('streaming_thread'):
-                tab_data['streaming_thread'].cancel()
-                tab_data['streaming_thread'].wait()
-                tab_data['streaming_thread'] = None
+            self._retire_streaming_thread(tab_data)
                 
             # Stop query thread
             if tab_data.get('query_thread'):
@@ -4574,26 +5270,27 @@ class DuckDBSQLApp(QMainWindow):
                 tab_data['query_thread'].wait()
                 tab_data['query_thread'] = None
             
+            # Stop a multi-statement script and keep its result widgets for reuse
+            if tab_data.get('multi_query_thread'):
+                tab_data['multi_query_thread'].cancel()
+                tab_data['multi_query_thread'].wait()
+                tab_data['multi_query_thread'] = None
+            if tab_data.get('multi_query_widget'):
+                self._release_multi_query_result_widgets(tab_data['multi_query_widget'])
+            
             # Clear table data to free memory
-            if 'results_table' in tab_data:
-                tab_data['results_table'].clearContents()
-                tab_data['results_table'].setRowCount(0)
-                tab_data['results_table'].setColumnCount(0)
+            if 'result_model' in tab_data:
+                tab_data['result_model'].set_rows([], [])
             
             # Clear stored data
             tab_data.clear()
-            del self.query_tabs[index]
+            self.query_tab_widget.widget(index).tab_state = None
             
-        # Remove the tab
+        # Remove the tab; query_tabs follows the tab widget, so the other tabs need no reindexing.
+        # removeTab doesn't delete the page, so delete it (and the menus it owns) explicitly
+        page = self.query_tab_widget.widget(index)
         self.query_tab_widget.removeTab(index)
-        
-        # Update tab indices in query_tabs dict
-        new_query_tabs = {}
-        for i in range(self.query_tab_widget.count()):
-            old_index = list(self.query_tabs.keys())[i] if i < len(self.query_tabs) else i
-            if old_index in self.query_tabs:
-                new_query_tabs[i] = self.query_tabs[old_index]
-        self.query_tabs = new_query_tabs
+        page.deleteLater()
         
         # Force garbage collection to free memory
         gc.collect()
@@ -4610,11 +5307,9 @@ class DuckDBSQLApp(QMainWindow):
         cursor = sql_editor.textCursor()
         if cursor.hasSelection():
             # Fix for comments: Get selected text properly preserving line breaks
-            # cursor.selectedText() converts line breaks to \u2029 which breaks SQL comments
-            start_pos = cursor.selectionStart()
-            end_pos = cursor.selectionEnd()
-            full_text = sql_editor.toPlainText()
-            query_text = full_text[start_pos:end_pos].strip()
+            # cursor.selectedText() converts line breaks to \u2029 which breaks SQL comments,
+            # so copy only the selected fragment and normalise any remaining separators
+            query_text = cursor.selection().toPlainText().translate(_QTX_TRANS).strip()
         else:
             query_text = sql_editor.toPlainText().strip()
         
@@ -4638,65 +5333,24 @@ class DuckDBSQLApp(QMainWindow):
             tab_data['current_query'] = queries[0]
             tab_data['current_page'] = 0
             tab_data['total_rows'] = 0
+            tab_data['complete_data'] = None
             
             # Execute streaming query
             self.execute_streaming_query(tab_index)
     
-    def split_sql_statements(self, query_text):
-        """Split SQL text into individual statements, handling strings and comments"""
-        statements = []
-        current_statement = []
-        in_string = False
-        in_comment = False
-        string_char = None
-        
-        lines = query_text.split('\n')
-        
-        for line in lines:
-            i = 0
-            while i < len(line):
-                char = line[i]
-                
-                # Handle line comments
-                if not in_string and i < len(line) - 1 and line[i:i+2] == '--':
-                    # Rest of line is comment
-                    current_statement.append(line[i:])
-                    break
-                
-                # Handle string literals
-                if char in ('"', "'") and not in_comment:
-                    if not in_string:
-                        in_string = True
-                        string_char = char
-                    elif char == string_char:
-                        # Check if it's escaped
-                        if i > 0 and line[i-1] == '\\':
-                            pass  # Escaped quote
-                        else:
-                            in_string = False
-                            string_char = None
-                
-                # Handle semicolon (statement separator)
-                if char == ';' and not in_string and not in_comment:
-                    current_statement.append(char)
-                    stmt = ''.join(current_statement).strip()
-                    if stmt and stmt != ';':
-                        statements.append(stmt.rstrip(';').strip())
-                    current_statement = []
-                    i += 1
-                    continue
-                
-                current_statement.append(char)
-                i += 1
-            
-            # Add newline if not at end
-            if current_statement:
-                current_statement.append('\n')
+    def split_sql_statements(self, query_text):
+        """Split SQL text into individual statements, handling strings and comments"""
+        statements = []
+        start = 0
+        
+        # Strings and comments are matched whole, so only semicolons outside them split statements
+        for match in _SQL_SPLIT_RE.finditer(query_text):
+            if match.group() == ';':
+                statements.append(query_text[start:match.start()].strip())
+                start = match.end()
         
         # Add remaining statement
-        stmt = ''.join(current_statement).strip()
-        if stmt and stmt != ';':
-            statements.append(stmt.rstrip(';').strip())
+        statements.append(query_text[start:].strip())
         
         return [s for s in statements if s]  # Filter empty statements
     
@@ -4710,37 +5364,22 @@ class DuckDBSQLApp(QMainWindow):
         # Hide the original single-result widgets
         tab_data['results_table'].setVisible(False)
         tab_data['progress_bar'].setVisible(False)
-        tab_data['page_info_label'].setVisible(False)
-        tab_data['first_page_btn'].setVisible(False)
-        tab_data['prev_page_btn'].setVisible(False)
-        tab_data['next_page_btn'].setVisible(False)
-        tab_data['last_page_btn'].setVisible(False)
-        tab_data['page_size_combo'].setVisible(False)
-        tab_data['cancel_btn'].setVisible(False)
-        
-        # Find the results group widget
-        results_group = tab_data['results_table'].parent()
-        while results_group and not isinstance(results_group, QGroupBox):
-            results_group = results_group.parent()
+        tab_data['pagination_container'].setVisible(False)
         
-        if not results_group:
-            return
+        # Stop a script that is still running in this tab
+        if tab_data.get('multi_query_thread'):
+            tab_data['multi_query_thread'].cancel()
+            tab_data['multi_query_thread'].wait()
+            tab_data['multi_query_thread'] = None
         
-        # Get the layout
+        # Both widgets are stored on the tab when it is created / first used
+        results_group = tab_data['results_group']
         results_layout = results_group.layout()
-        
-        # Check if we already have a multi-query tab widget
-        multi_query_tab_widget = None
-        for i in range(results_layout.count()):
-            widget = results_layout.itemAt(i).widget()
-            if isinstance(widget, QTabWidget) and hasattr(widget, '_is_multi_query_widget'):
-                multi_query_tab_widget = widget
-                break
+        multi_query_tab_widget = tab_data.get('multi_query_widget')
         
         # If no multi-query widget exists, create one
         if not multi_query_tab_widget:
             multi_query_tab_widget = QTabWidget()
-            multi_query_tab_widget._is_multi_query_widget = True
             multi_query_tab_widget.setTabPosition(QTabWidget.South)
             multi_query_tab_widget.setMovable(True)
             
@@ -4774,8 +5413,8 @@ class DuckDBSQLApp(QMainWindow):
             results_layout.addWidget(multi_query_tab_widget)
             multi_query_tab_widget.setVisible(True)
         else:
-            # Clear existing tabs
-            multi_query_tab_widget.clear()
+            # Clear existing tabs, keeping their widgets for this run
+            self._release_multi_query_result_widgets(multi_query_tab_widget)
             multi_query_tab_widget.setVisible(True)
         
         # Update title
@@ -4784,49 +5423,92 @@ class DuckDBSQLApp(QMainWindow):
         # Store reference to multi-query widget
         tab_data['multi_query_widget'] = multi_query_tab_widget
         
-        # Execute each query and create a tab for each result
+        # Create a tab for each statement's result
+        tab_states = {}
         for idx, query in enumerate(queries, 1):
-            # Create widget for this result
+            # Reuse a result widget from an earlier script when one is available
+            result_widget = self._acquire_multi_query_result_widget()
+            
+            # Store pagination state for this tab
+            tab_state = {
+                'query': query,
+                'current_page': 0,
+                'total_rows': 0,
+                'columns': [],
+                'all_data': [],
+                'page_size': int(result_widget.parts['page_size_combo'].currentText()),  # updated by the page size handlers
+                'tab_index': tab_index,
+                'result_index': idx,
+                'multi_query_tab_widget': multi_query_tab_widget,
+                'result_widget': result_widget
+            }
+            tab_state.update(result_widget.parts)
+            result_widget.tab_state = tab_state
+            tab_states[idx] = tab_state
+            
+            # Create compact tab label
+            query_preview = query.replace('\n', ' ').strip()
+            tab_label = f'Result {idx}'
+            
+            # Add tab with tooltip showing full query
+            tab_position = multi_query_tab_widget.addTab(result_widget, tab_label)
+            multi_query_tab_widget.setTabToolTip(tab_position, query_preview)
+        
+        # Run the statements in order in the background, filling in each tab as its statement finishes
+        multi_query_thread = MultiQueryThread(self.connection, queries)
+        multi_query_thread.statement_started.connect(
+            lambda idx: self.status_label.setText(f'Executing statement {idx} of {len(queries)}...'))
+        multi_query_thread.statement_finished.connect(
+            lambda idx, columns, all_data: self.handle_multi_query_result(tab_states[idx], columns, all_data))
+        multi_query_thread.statement_failed.connect(
+            lambda idx, error: self.handle_multi_query_error(tab_states[idx], error))
+        multi_query_thread.finished.connect(
+            lambda: self.handle_multi_query_finished(tab_data, multi_query_thread, len(queries)))
+        tab_data['multi_query_thread'] = multi_query_thread
+        tab_data['cancel_btn'].setEnabled(True)
+        multi_query_thread.start()
+    
+    def _acquire_multi_query_result_widget(self):
+        """Return an empty multi-query result widget, reusing a pooled one when possible.
+        
+        The widget's child widgets are in result_widget.parts and its signals are wired once,
+        to whichever tab state is in result_widget.tab_state at the time.
+        """
+        if self._result_widget_pool:
+            result_widget = self._result_widget_pool.pop()
+            parts = result_widget.parts
+            
+            # Undo whatever the previous statement's result did to the widgets
+            parts['result_table'].setVisible(True)
+            page_info_label = parts['page_info_label']
+            page_info_label.setText('No results')
+            page_info_label.setStyleSheet('')
+            page_info_label.setWordWrap(False)
+            for key in ('first_page_btn', 'prev_page_btn', 'next_page_btn', 'last_page_btn',
+                        'page_size_label', 'page_size_combo'):
+                parts[key].setVisible(True)
+            blocker = QSignalBlocker(parts['page_size_combo'])
+            parts['page_size_combo'].setCurrentText('10000')
+            blocker.unblock()
+        else:
             result_widget = QWidget()
             result_layout = QVBoxLayout(result_widget)
             result_layout.setContentsMargins(5, 5, 5, 5)
             
             # Pagination controls (same style as single query)
-            pagination_layout = QHBoxLayout()
-            
-            # Page info and controls
-            page_info_label = QLabel('No results')
-            first_page_btn = QPushButton('First')
-            prev_page_btn = QPushButton('Previous')
-            next_page_btn = QPushButton('Next')
-            last_page_btn = QPushButton('Last')
-            
-            # Page size selector
-            page_size_label = QLabel('Rows per page:')
-            page_size_combo = QComboBox()
-            page_size_combo.addItems(['1000', '5000', '10000', '25000', '50000'])
-            page_size_combo.setCurrentText('10000')
-            
-            # Progress bar
-            progress_bar = QProgressBar()
-            progress_bar.setVisible(False)
-            progress_bar.setMaximum(100)
-            
-            pagination_layout.addWidget(page_info_label)
-            pagination_layout.addStretch()
-            pagination_layout.addWidget(first_page_btn)
-            pagination_layout.addWidget(prev_page_btn)
-            pagination_layout.addWidget(next_page_btn)
-            pagination_layout.addWidget(last_page_btn)
-            pagination_layout.addStretch()
-            pagination_layout.addWidget(page_size_label)
-            pagination_layout.addWidget(page_size_combo)
+            (pagination_layout, pagination_container, page_info_label, first_page_btn, prev_page_btn, next_page_btn,
+             last_page_btn, page_size_label, page_size_combo, progress_bar,
+             cancel_btn) = self._build_pagination_bar(with_cancel=False)
             
             result_layout.addWidget(progress_bar)
             result_layout.addLayout(pagination_layout)
             
-            # Create result table for this query
-            result_table = QTableWidget()
+            # Create result table for this query; the model only formats the cells being painted
+            result_table = QTableView()
+            result_model = ResultTableModel(result_table)
+            result_table.setModel(result_model)
+            # Fitting columns only measures a sample of rows, even while the tab is hidden
+            result_table.horizontalHeader().setResizeContentsPrecision(self.COLUMN_FIT_SAMPLE_ROWS)
             result_table.setAlternatingRowColors(False)
             result_table.setSortingEnabled(False)
             
@@ -4838,13 +5520,7 @@ class DuckDBSQLApp(QMainWindow):
             
             result_layout.addWidget(result_table)
             
-            # Store pagination state for this tab
-            tab_state = {
-                'query': query,
-                'current_page': 0,
-                'total_rows': 0,
-                'columns': [],
-                'all_data': [],
+            parts = {
                 'page_info_label': page_info_label,
                 'first_page_btn': first_page_btn,
                 'prev_page_btn': prev_page_btn,
@@ -4852,89 +5528,109 @@ class DuckDBSQLApp(QMainWindow):
                 'last_page_btn': last_page_btn,
                 'page_size_combo': page_size_combo,
                 'result_table': result_table,
+                'result_model': result_model,
                 'progress_bar': progress_bar,
-                'tab_index': tab_index,
-                'result_index': idx
+                'page_size_label': page_size_label
             }
+            result_widget.parts = parts
+            result_widget.tab_state = None
             
-            # Connect context menu
+            # Connect context menu and pagination controls to the widget's current tab state
             result_table.customContextMenuRequested.connect(
-                lambda pos, ts=tab_state: self.show_multi_query_context_menu(pos, ts)
-            )
-            
-            # Create compact tab label
-            query_preview = query.replace('\n', ' ').strip()
-            tab_label = f'Result {idx}'
-            
-            # Add tab with tooltip showing full query
-            tab_idx = multi_query_tab_widget.addTab(result_widget, tab_label)
-            multi_query_tab_widget.setTabToolTip(tab_idx, query_preview)
-            
-            # Execute the query
-            try:
-                self.status_label.setText(f'Executing statement {idx} of {len(queries)}...')
-                QApplication.processEvents()
-                
-                cursor = self.connection.execute(query)
-                
-                # Check if query returns results
-                if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                    all_data = cursor.fetchall()
-                    
-                    # Store data in tab state
-                    tab_state['columns'] = columns
-                    tab_state['all_data'] = all_data
-                    tab_state['total_rows'] = len(all_data)
-                    
-                    # Display first page
-                    page_size = int(page_size_combo.currentText())
-                    self.display_multi_query_page(tab_state, 0, page_size)
-                    
-                    # Connect pagination controls
-                    first_page_btn.clicked.connect(lambda checked, ts=tab_state: self.multi_query_first_page(ts))
-                    prev_page_btn.clicked.connect(lambda checked, ts=tab_state: self.multi_query_prev_page(ts))
-                    next_page_btn.clicked.connect(lambda checked, ts=tab_state: self.multi_query_next_page(ts))
-                    last_page_btn.clicked.connect(lambda checked, ts=tab_state: self.multi_query_last_page(ts))
-                    page_size_combo.currentTextChanged.connect(lambda text, ts=tab_state: self.multi_query_change_page_size(ts))
-                    
-                    # Update tab label with row count
-                    multi_query_tab_widget.setTabText(tab_idx, f'Result {idx} ({len(all_data)} rows)')
-                else:
-                    # Query doesn't return results (INSERT, UPDATE, DELETE, etc.)
-                    result_table.setVisible(False)
-                    page_info_label.setText('✓ Query executed successfully (no results returned)')
-                    page_info_label.setStyleSheet('color: green; font-weight: bold;')
-                    
-                    # Hide pagination controls
-                    first_page_btn.setVisible(False)
-                    prev_page_btn.setVisible(False)
-                    next_page_btn.setVisible(False)
-                    last_page_btn.setVisible(False)
-                    page_size_label.setVisible(False)
-                    page_size_combo.setVisible(False)
-                    
-                    multi_query_tab_widget.setTabText(tab_idx, f'Result {idx} (OK)')
-                    
-            except Exception as e:
-                result_table.setVisible(False)
-                error_text = str(e)
-                page_info_label.setText(f'✗ Error: {error_text}')
-                page_info_label.setStyleSheet('color: red; font-weight: bold;')
-                page_info_label.setWordWrap(True)
-                
-                # Hide pagination controls
-                first_page_btn.setVisible(False)
-                prev_page_btn.setVisible(False)
-                next_page_btn.setVisible(False)
-                last_page_btn.setVisible(False)
-                page_size_label.setVisible(False)
-                page_size_combo.setVisible(False)
-                
-                multi_query_tab_widget.setTabText(tab_idx, f'Result {idx} (Error)')
-                multi_query_tab_widget.setTabIcon(tab_idx, self.style().standardIcon(QStyle.SP_MessageBoxCritical))
+                lambda pos: self.show_multi_query_context_menu(pos, result_widget.tab_state))
+            first_page_btn.clicked.connect(lambda checked: self.multi_query_first_page(result_widget.tab_state))
+            prev_page_btn.clicked.connect(lambda checked: self.multi_query_prev_page(result_widget.tab_state))
+            next_page_btn.clicked.connect(lambda checked: self.multi_query_next_page(result_widget.tab_state))
+            last_page_btn.clicked.connect(lambda checked: self.multi_query_last_page(result_widget.tab_state))
+            page_size_combo.currentTextChanged.connect(
+                lambda text: self.multi_query_change_page_size(result_widget.tab_state))
+        
+        # Nothing to page through until the statement's result arrives
+        for key in ('first_page_btn', 'prev_page_btn', 'next_page_btn', 'last_page_btn'):
+            parts[key].setEnabled(False)
+        return result_widget
+    
+    def _release_multi_query_result_widgets(self, multi_query_tab_widget):
+        """Remove every result tab from a multi-query tab widget and pool the widgets for reuse"""
+        result_widgets = [multi_query_tab_widget.widget(i) for i in range(multi_query_tab_widget.count())]
+        multi_query_tab_widget.clear()
+        for result_widget in result_widgets:
+            # Drop the previous statement's rows
+            result_widget.tab_state = None
+            result_widget.parts['result_model'].set_rows([], [])
+            if len(self._result_widget_pool) < self.RESULT_WIDGET_POOL_SIZE:
+                result_widget.setParent(None)
+                self._result_widget_pool.append(result_widget)
+            else:
+                result_widget.deleteLater()
+    
+    def handle_multi_query_result(self, tab_state, columns, all_data):
+        """Show the result of one statement of a multi-query script in its tab"""
+        if tab_state['result_widget'].tab_state is not tab_state:
+            return  # The tab was cleared and its widget reused before this result arrived
+        multi_query_tab_widget = tab_state['multi_query_tab_widget']
+        tab_position = multi_query_tab_widget.indexOf(tab_state['result_widget'])  # Tabs are movable
+        idx = tab_state['result_index']
+        
+        # Check if query returns results
+        if columns is not None:
+            # Store data in tab state
+            tab_state['columns'] = columns
+            tab_state['all_data'] = all_data
+            tab_state['total_rows'] = len(all_data)
+            
+            # Display first page
+            page_size = tab_state['page_size']
+            self.display_multi_query_page(tab_state, 0, page_size)
+            
+            # Update tab label with row count
+            multi_query_tab_widget.setTabText(tab_position, f'Result {idx} ({len(all_data)} rows)')
+        else:
+            # Query doesn't return results (INSERT, UPDATE, DELETE, etc.)
+            tab_state['result_table'].setVisible(False)
+            page_info_label = tab_state['page_info_label']
+            page_info_label.setText('✓ Query executed successfully (no results returned)')
+            page_info_label.setStyleSheet('color: green; font-weight: bold;')
+            self.hide_multi_query_pagination(tab_state)
+            
+            multi_query_tab_widget.setTabText(tab_position, f'Result {idx} (OK)')
+    
+    def handle_multi_query_error(self, tab_state, error_text):
+        """Show the error of one statement of a multi-query script in its tab"""
+        if tab_state['result_widget'].tab_state is not tab_state:
+            return
+        multi_query_tab_widget = tab_state['multi_query_tab_widget']
+        tab_position = multi_query_tab_widget.indexOf(tab_state['result_widget'])  # Tabs are movable
         
-        self.status_label.setText(f'Executed {len(queries)} statements')
+        tab_state['result_table'].setVisible(False)
+        page_info_label = tab_state['page_info_label']
+        page_info_label.setText(f'✗ Error: {error_text}')
+        page_info_label.setStyleSheet('color: red; font-weight: bold;')
+        page_info_label.setWordWrap(True)
+        self.hide_multi_query_pagination(tab_state)
+        
+        multi_query_tab_widget.setTabText(tab_position, f'Result {tab_state["result_index"]} (Error)')
+        multi_query_tab_widget.setTabIcon(tab_position, self.style().standardIcon(QStyle.SP_MessageBoxCritical))
+    
+    def handle_multi_query_finished(self, tab_data, multi_query_thread, statement_count):
+        """Clean up after a multi-query script stopped running"""
+        if tab_data.get('multi_query_thread') is multi_query_thread:
+            tab_data['multi_query_thread'] = None
+            tab_data['cancel_btn'].setEnabled(False)
+            if multi_query_thread.is_cancelled:
+                self.status_label.setText('Query cancelled')
+            else:
+                self.status_label.setText(f'Executed {statement_count} statements')
+        multi_query_thread.deleteLater()
+    
+    def hide_multi_query_pagination(self, tab_state):
+        """Hide the pagination controls of a multi-query result tab that has no rows to page through"""
+        tab_state['first_page_btn'].setVisible(False)
+        tab_state['prev_page_btn'].setVisible(False)
+        tab_state['next_page_btn'].setVisible(False)
+        tab_state['last_page_btn'].setVisible(False)
+        tab_state['page_size_label'].setVisible(False)
+        tab_state['page_size_combo'].setVisible(False)
     
     def display_multi_query_page(self, tab_state, page_num, page_size):
         """Display a specific page of data for a multi-query result tab"""
@@ -4944,74 +5640,75 @@ class DuckDBSQLApp(QMainWindow):
         page_info_label = tab_state['page_info_label']
         
         total_rows = len(all_data)
-        total_pages = (total_rows + page_size - 1) // page_size if page_size > 0 else 1
+        last_page = last_page_index(total_rows, page_size)
         
         # Clamp page number
-        page_num = max(0, min(page_num, total_pages - 1))
+        page_num = max(0, min(page_num, last_page))
         tab_state['current_page'] = page_num
         
-        # Calculate slice
+        # Calculate slice; recently shown pages are kept so paging back doesn't convert them again
         start_idx = page_num * page_size
         end_idx = min(start_idx + page_size, total_rows)
-        page_data = all_data[start_idx:end_idx]
+        page_cache = tab_state.setdefault('page_cache', OrderedDict())
+        page_key = (start_idx, end_idx)
+        page_data = page_cache.get(page_key)
+        if page_data is None:
+            page_data = slice_result_rows(all_data, start_idx, end_idx)
+            page_cache[page_key] = page_data
+            if len(page_cache) > self.MULTI_QUERY_PAGE_CACHE_SIZE:
+                page_cache.popitem(last=False)
+        else:
+            page_cache.move_to_end(page_key)
         
         # Populate table
-        result_table.setColumnCount(len(columns))
-        result_table.setHorizontalHeaderLabels(columns)
-        result_table.setRowCount(len(page_data))
-        
-        for row_idx, row_data in enumerate(page_data):
-            for col_idx, value in enumerate(row_data):
-                item = QTableWidgetItem(str(value) if value is not None else '')
-                result_table.setItem(row_idx, col_idx, item)
+        tab_state['result_model'].set_rows(columns, page_data)
         
         # Resize columns intelligently
         if len(page_data) < 1000:
             result_table.resizeColumnsToContents()
-            for col in range(result_table.columnCount()):
+            for col in range(len(columns)):
                 if result_table.columnWidth(col) > 300:
                     result_table.setColumnWidth(col, 300)
         else:
             result_table.horizontalHeader().setDefaultSectionSize(120)
         
         # Update page info
-        page_info_label.setText(f'Page {page_num + 1} of {total_pages} ({total_rows} total rows)')
+        page_info_label.setText(f'Page {page_num + 1} of {last_page + 1} ({total_rows} total rows)')
         
         # Update button states
-        tab_state['first_page_btn'].setEnabled(page_num > 0)
-        tab_state['prev_page_btn'].setEnabled(page_num > 0)
-        tab_state['next_page_btn'].setEnabled(page_num < total_pages - 1)
-        tab_state['last_page_btn'].setEnabled(page_num < total_pages - 1)
+        has_prev = page_num > 0
+        has_next = page_num < last_page
+        self.set_page_buttons_enabled(tab_state, has_prev, has_prev, has_next, has_next)
     
     def multi_query_first_page(self, tab_state):
         """Go to first page in multi-query result"""
-        page_size = int(tab_state['page_size_combo'].currentText())
+        page_size = tab_state['page_size']
         self.display_multi_query_page(tab_state, 0, page_size)
     
     def multi_query_prev_page(self, tab_state):
         """Go to previous page in multi-query result"""
-        page_size = int(tab_state['page_size_combo'].currentText())
+        page_size = tab_state['page_size']
         current_page = tab_state['current_page']
         self.display_multi_query_page(tab_state, current_page - 1, page_size)
     
     def multi_query_next_page(self, tab_state):
         """Go to next page in multi-query result"""
-        page_size = int(tab_state['page_size_combo'].currentText())
+        page_size = tab_state['page_size']
         current_page = tab_state['current_page']
         self.display_multi_query_page(tab_state, current_page + 1, page_size)
     
     def multi_query_last_page(self, tab_state):
         """Go to last page in multi-query result"""
-        page_size = int(tab_state['page_size_combo'].currentText())
-        total_rows = tab_state['total_rows']
-        last_page = (total_rows - 1) // page_size if page_size > 0 else 0
+        page_size = tab_state['page_size']
+        last_page = last_page_index(tab_state['total_rows'], page_size)
         self.display_multi_query_page(tab_state, last_page, page_size)
     
     def multi_query_change_page_size(self, tab_state):
         """Handle page size change in multi-query result"""
-        page_size = int(tab_state['page_size_combo'].currentText())
-        # Reset to first page when changing page size
-        self.display_multi_query_page(tab_state, 0, page_size)
+        page_size = tab_state['page_size'] = int(tab_state['page_size_combo'].currentText())
+        # Reset to first page when changing page size, once the statement has a result
+        if tab_state['columns']:
+            self.display_multi_query_page(tab_state, 0, page_size)
     
     def show_multi_query_context_menu(self, pos, tab_state):
         """Show context menu for multi-query result table"""
@@ -5021,17 +5718,18 @@ class DuckDBSQLApp(QMainWindow):
         menu = QMenu(self)
         
         # Get current cell/selection
-        current_item = result_table.itemAt(pos)
+        has_cell = result_table.indexAt(pos).isValid()
+        has_rows = tab_state['result_model'].rowCount() > 0
         has_selection = result_table.selectionModel().hasSelection()
         
         # Copy Cell Value
         copy_cell_action = menu.addAction('Copy Cell Value')
-        copy_cell_action.setEnabled(current_item is not None)
+        copy_cell_action.setEnabled(has_cell)
         copy_cell_action.triggered.connect(lambda: self.copy_multi_query_cell(tab_state))
         
         # Copy Column with Header
         copy_column_action = menu.addAction('Copy Column with Header')
-        copy_column_action.setEnabled(current_item is not None)
+        copy_column_action.setEnabled(has_cell)
         copy_column_action.triggered.connect(lambda: self.copy_multi_query_column(tab_state))
         
         # Copy Row with Header
@@ -5043,14 +5741,14 @@ class DuckDBSQLApp(QMainWindow):
         
         # Copy Entire Table
         copy_table_action = menu.addAction('Copy Entire Table')
-        copy_table_action.setEnabled(result_table.rowCount() > 0)
+        copy_table_action.setEnabled(has_rows)
         copy_table_action.triggered.connect(lambda: self.copy_multi_query_entire_table(tab_state))
         
         menu.addSeparator()
         
         # Build Dashboard
         dashboard_action = menu.addAction('Build Dashboard')
-        dashboard_action.setEnabled(result_table.rowCount() > 0 and PANDAS_AVAILABLE)
+        dashboard_action.setEnabled(has_rows and PANDAS_AVAILABLE)
         dashboard_action.triggered.connect(lambda: self.open_multi_query_dashboard(tab_state))
         
         # Show menu at cursor position
@@ -5058,76 +5756,49 @@ class DuckDBSQLApp(QMainWindow):
     
     def copy_multi_query_cell(self, tab_state):
         """Copy selected cell value from multi-query result"""
-        result_table = tab_state['result_table']
-        current_item = result_table.currentItem()
-        if current_item:
-            QApplication.clipboard().setText(current_item.text())
+        current_index = tab_state['result_table'].currentIndex()
+        if current_index.isValid():
+            self._set_clipboard_text(current_index.data() or '')
     
     def copy_multi_query_column(self, tab_state):
         """Copy entire column with header from multi-query result"""
-        result_table = tab_state['result_table']
-        current_column = result_table.currentColumn()
+        current_column = tab_state['result_table'].currentIndex().column()
         
         if current_column < 0:
             return
         
-        # Get header
-        header_item = result_table.horizontalHeaderItem(current_column)
-        header = header_item.text() if header_item else f"Column_{current_column}"
-        
-        # Get all values in column
-        values = [header]
-        for row in range(result_table.rowCount()):
-            item = result_table.item(row, current_column)
-            values.append(item.text() if item else '')
-        
-        QApplication.clipboard().setText('\n'.join(values))
+        # Get header and the column's values across the whole result, not just the shown page
+        columns = tab_state['columns']
+        if current_column >= len(columns):
+            return
+        values = map(_cell_str, result_column_values(tab_state['all_data'], current_column))
+        self._set_clipboard_text('\n'.join([columns[current_column], *values]))
     
     def copy_multi_query_row(self, tab_state):
         """Copy selected row with headers from multi-query result"""
-        result_table = tab_state['result_table']
-        current_row = result_table.currentRow()
+        current_row = tab_state['result_table'].currentIndex().row()
         
         if current_row < 0:
             return
         
-        # Get headers
-        headers = []
-        for col in range(result_table.columnCount()):
-            header_item = result_table.horizontalHeaderItem(col)
-            headers.append(header_item.text() if header_item else f"Column_{col}")
-        
-        # Get row values
-        values = []
-        for col in range(result_table.columnCount()):
-            item = result_table.item(current_row, col)
-            values.append(item.text() if item else '')
-        
-        # Format as tab-separated
-        result = '\t'.join(headers) + '\n' + '\t'.join(values)
-        QApplication.clipboard().setText(result)
+        # Format headers and row values as tab-separated
+        model = tab_state['result_model']
+        result = '\t'.join(model.columns) + '\n' + '\t'.join(model.row_text(current_row))
+        self._set_clipboard_text(result)
     
     def copy_multi_query_entire_table(self, tab_state):
         """Copy entire table with headers from multi-query result"""
-        result_table = tab_state['result_table']
-        
-        # Get headers
-        headers = []
-        for col in range(result_table.columnCount()):
-            header_item = result_table.horizontalHeaderItem(col)
-            headers.append(header_item.text() if header_item else f"Column_{col}")
-        
-        # Build table data
-        lines = ['\t'.join(headers)]
-        
-        for row in range(result_table.rowCount()):
-            row_data = []
-            for col in range(result_table.columnCount()):
-                item = result_table.item(row, col)
-                row_data.append(item.text() if item else '')
-            lines.append('\t'.join(row_data))
-        
-        QApplication.clipboard().setText('\n'.join(lines))
+        # Every row of the statement's result, with the same tab-separated quoting as copy_entire_table;
+        # the text is built in a thread since the result can have millions of rows
+        self.run_clipboard_copy(ResultClipboardCopyThread(tab_state['columns'], tab_state['all_data']), 'table')
+    
+    def multi_query_dataframe(self, tab_state):
+        """Build a pandas DataFrame from the full result of a multi-query statement"""
+        all_data = tab_state['all_data']
+        if isinstance(all_data, list):
+            return pd.DataFrame.from_records(all_data, columns=tab_state['columns'])
+        # Arrow results convert column by column without going through Python rows
+        return all_data.to_pandas()
     
     def graph_multi_query_data(self, tab_state):
         """Open Eel dashboard with data from multi-query result"""
@@ -5144,28 +5815,16 @@ class DuckDBSQLApp(QMainWindow):
             return
         
         try:
-            result_table = tab_state['result_table']
-            
             # Convert table data to pandas DataFrame
-            df = self.table_to_dataframe(result_table)
+            df = self.multi_query_dataframe(tab_state)
             
             if df.empty:
                 QMessageBox.information(self, 'No Data', 'No data available for dashboard.')
                 return
+            categorize_repeated_strings(df)
             
-            # Create and launch the Eel dashboard in a separate thread
-            import threading
-            
-            def launch_dashboard():
-                try:
-                    create_dashboard(df, title=f"Query Results - Statement {tab_state['result_index']}")
-                    while True:
-                        eel.sleep(1.0)
-                except Exception as e:
-                    print(f"Error launching dashboard: {e}")
-            
-            dashboard_thread = threading.Thread(target=launch_dashboard, daemon=True)
-            dashboard_thread.start()
+            # Launch the Eel dashboard on the dashboard thread
+            self.launch_eel_dashboard(df, f"Query Results - Statement {tab_state['result_index']}")
             
             # Show info message
             QMessageBox.information(
@@ -5187,10 +5846,8 @@ class DuckDBSQLApp(QMainWindow):
             return
             
         try:
-            result_table = tab_state['result_table']
-            
             # Convert table data to pandas DataFrame
-            df = self.table_to_dataframe(result_table)
+            df = self.multi_query_dataframe(tab_state)
             
             if df.empty:
                 QMessageBox.information(self, 'No Data', 'No data available for dashboard.')
@@ -5207,11 +5864,8 @@ class DuckDBSQLApp(QMainWindow):
             # Export DataFrame to Parquet
             df.to_parquet(temp_path)
             
-            # Launch dashboard.py
-            main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py')
-            
-            # Run in a separate process
-            subprocess.Popen([sys.executable, main_path, temp_path])
+            # Launch dashboard.py in a separate process
+            subprocess.Popen([sys.executable, DASHBOARD_PY, temp_path])
             
             self.status_label.setText(f'Opened Dashboard')
             
@@ -5228,16 +5882,15 @@ class DuckDBSQLApp(QMainWindow):
         # Hide multi-query widget if it exists and show single-result widgets
         if 'multi_query_widget' in tab_data and tab_data['multi_query_widget']:
             tab_data['multi_query_widget'].setVisible(False)
+        if tab_data.get('multi_query_thread'):
+            tab_data['multi_query_thread'].cancel()
+            tab_data['multi_query_thread'].wait()
+            tab_data['multi_query_thread'] = None
         
         # Show the original single-result widgets
         tab_data['results_table'].setVisible(True)
         tab_data['progress_bar'].setVisible(True)
-        tab_data['page_info_label'].setVisible(True)
-        tab_data['first_page_btn'].setVisible(True)
-        tab_data['prev_page_btn'].setVisible(True)
-        tab_data['next_page_btn'].setVisible(True)
-        tab_data['last_page_btn'].setVisible(True)
-        tab_data['page_size_combo'].setVisible(True)
+        tab_data['pagination_container'].setVisible(True)
         tab_data['cancel_btn'].setVisible(True)
         
         # Find results group and update title
@@ -5248,7 +5901,7 @@ class DuckDBSQLApp(QMainWindow):
             results_group.setTitle('Query Results')
         
         query = tab_data['current_query']
-        page_size = int(tab_data['page_size_combo'].currentText())
+        page_size = tab_data['page_size']
         offset = tab_data['current_page'] * page_size
         
         # Update UI state
@@ -5259,22 +5912,58 @@ class DuckDBSQLApp(QMainWindow):
         self.disable_pagination_controls(tab_index)
         
         # Stop any existing threads
-        if tab_data['streaming_thread']:
-            tab_data['streaming_thread'].cancel()
-            tab_data['streaming_thread'].wait()
+        self._retire_streaming_thread(tab_data)
         if tab_data['query_thread']:
             tab_data['query_thread'].terminate()
             tab_data['query_thread'].wait()
         
         # Start streaming query
         streaming_thread = StreamingQueryThread(self.connection, query, page_size, offset)
-        streaming_thread.batch_ready.connect(lambda cols, data, total, has_more: self.handle_batch_ready(tab_index, cols, data, total, has_more))
-        streaming_thread.error_occurred.connect(lambda error: self.handle_streaming_error(tab_index, error))
-        streaming_thread.progress_update.connect(lambda progress: self.handle_progress_update(tab_index, progress))
+        page = self.query_tab_widget.widget(tab_index)
+        index_of = self.query_tab_widget.indexOf
+        # Signals still queued from a retired thread are dropped once the tab has moved on
+        current = lambda: tab_data.get('streaming_thread') is streaming_thread
+        streaming_thread.batch_ready.connect(lambda cols, data, total, has_more: current() and self.handle_batch_ready(index_of(page), cols, data, total, has_more))
+        streaming_thread.error_occurred.connect(lambda error: current() and self.handle_streaming_error(index_of(page), error))
+        streaming_thread.progress_update.connect(lambda progress: current() and self.handle_progress_update(index_of(page), progress))
         
         tab_data['streaming_thread'] = streaming_thread
+        
+        # The connection holds a single pending result, so a cancelled query that is still
+        # running must stop before this one starts, or the two would read each other's rows
+        stopping_thread = tab_data.get('stopping_streaming_thread')
+        if stopping_thread is not None:
+            stopping_thread.finished.connect(lambda: self._start_streaming_thread(tab_data, streaming_thread))
+            if stopping_thread.isRunning():
+                return
+        self._start_streaming_thread(tab_data, streaming_thread)
+    
+    def _start_streaming_thread(self, tab_data, streaming_thread):
+        """Start a tab's streaming thread unless it was replaced or already started"""
+        if tab_data.get('streaming_thread') is not streaming_thread:
+            return
+        if streaming_thread.isRunning() or streaming_thread.isFinished():
+            return
+        tab_data['stopping_streaming_thread'] = None
         streaming_thread.start()
     
+    def _retire_streaming_thread(self, tab_data):
+        """Cancel a tab's streaming thread without blocking the UI until it stops"""
+        streaming_thread = tab_data.get('streaming_thread')
+        if streaming_thread is None:
+            return
+        tab_data['streaming_thread'] = None
+        streaming_thread.cancel()
+        if not streaming_thread.isRunning():
+            # Never started (still waiting for an earlier thread) or already done
+            return
+        # Keep a reference until run() returns; dropping a running QThread aborts the process
+        tab_data['stopping_streaming_thread'] = streaming_thread
+        self._retired_streaming_threads.add(streaming_thread)
+        streaming_thread.finished.connect(lambda: self._retired_streaming_threads.discard(streaming_thread))
+        if streaming_thread.isFinished():
+            self._retired_streaming_threads.discard(streaming_thread)
+    
     def handle_batch_ready(self, tab_index, columns, data, total_count, has_more):
         """Handle when a batch of results is ready"""
         if tab_index not in self.query_tabs:
@@ -5286,6 +5975,8 @@ class DuckDBSQLApp(QMainWindow):
         tab_data['columns'] = columns
         if total_count > 0:
             tab_data['total_rows'] = total_count
+        # Keep the rows when this page holds the whole result, so column copies can skip re-running the query
+        tab_data['complete_data'] = data if tab_data.get('current_page', 0) == 0 and total_count == len(data) else None
         
         # Display results
         self.display_results_for_tab(tab_index, columns, data)
@@ -5299,7 +5990,7 @@ class DuckDBSQLApp(QMainWindow):
         self.enable_pagination_controls(tab_index)
         
         # Update status
-        page_size = int(tab_data['page_size_combo'].currentText())
+        page_size = tab_data['page_size']
         start_row = tab_data['current_page'] * page_size + 1
         end_row = start_row + len(data) - 1
         if tab_data['total_rows'] > 0:
@@ -5334,10 +6025,7 @@ class DuckDBSQLApp(QMainWindow):
             return
             
         tab_data = self.query_tabs[tab_index]
-        tab_data['first_page_btn'].setEnabled(False)
-        tab_data['prev_page_btn'].setEnabled(False)
-        tab_data['next_page_btn'].setEnabled(False)
-        tab_data['last_page_btn'].setEnabled(False)
+        self.set_page_buttons_enabled(tab_data, False, False, False, False)
         tab_data['page_size_combo'].setEnabled(False)
     
     def enable_pagination_controls(self, tab_index):
@@ -5357,21 +6045,28 @@ class DuckDBSQLApp(QMainWindow):
         tab_data = self.query_tabs[tab_index]
         current_page = tab_data['current_page']
         total_rows = tab_data['total_rows']
-        page_size = int(tab_data['page_size_combo'].currentText())
+        page_size = tab_data['page_size']
         
         # Enable/disable based on current page
-        tab_data['first_page_btn'].setEnabled(current_page > 0)
-        tab_data['prev_page_btn'].setEnabled(current_page > 0)
+        has_prev = current_page > 0
         
         # For next/last buttons, we need to check if there are more results
         if total_rows > 0:
-            max_page = (total_rows - 1) // page_size
-            tab_data['next_page_btn'].setEnabled(current_page < max_page)
-            tab_data['last_page_btn'].setEnabled(current_page < max_page)
+            has_next = has_last = current_page < last_page_index(total_rows, page_size)
         else:
             # If we don't know total, enable next button and let the query determine if there are more results
-            tab_data['next_page_btn'].setEnabled(True)
-            tab_data['last_page_btn'].setEnabled(False)  # Can't go to last if we don't know total
+            has_next = True
+            has_last = False  # Can't go to last if we don't know total
+        self.set_page_buttons_enabled(tab_data, has_prev, has_prev, has_next, has_last)
+    
+    def set_page_buttons_enabled(self, tab_data, first, prev, next_, last):
+        """Enable or disable a tab's first/previous/next/last page buttons, skipping unchanged states"""
+        states = (first, prev, next_, last)
+        if tab_data.get('_page_button_states') == states:
+            return
+        tab_data['_page_button_states'] = states
+        for key, enabled in zip(('first_page_btn', 'prev_page_btn', 'next_page_btn', 'last_page_btn'), states):
+            tab_data[key].setEnabled(enabled)
     
     def update_pagination_info(self, tab_index, has_more):
         """Update pagination information display"""
@@ -5381,10 +6076,10 @@ class DuckDBSQLApp(QMainWindow):
         tab_data = self.query_tabs[tab_index]
         current_page = tab_data['current_page']
         total_rows = tab_data['total_rows']
-        page_size = int(tab_data['page_size_combo'].currentText())
+        page_size = tab_data['page_size']
         
         if total_rows > 0:
-            total_pages = (total_rows - 1) // page_size + 1
+            total_pages = last_page_index(total_rows, page_size) + 1
             tab_data['page_info_label'].setText(f'Page {current_page + 1} of {total_pages} ({total_rows:,} total rows)')
         else:
             more_text = ' (more available)' if has_more else ''
@@ -5428,9 +6123,7 @@ class DuckDBSQLApp(QMainWindow):
             
         tab_data = self.query_tabs[tab_index]
         if tab_data['total_rows'] > 0:
-            page_size = int(tab_data['page_size_combo'].currentText())
-            last_page = (tab_data['total_rows'] - 1) // page_size
-            self.go_to_page(tab_index, last_page)
+            self.go_to_page(tab_index, last_page_index(tab_data['total_rows'], tab_data['page_size']))
     
     def change_page_size(self, tab_index):
         """Handle page size change"""
@@ -5438,6 +6131,7 @@ class DuckDBSQLApp(QMainWindow):
             return
             
         tab_data = self.query_tabs[tab_index]
+        tab_data['page_size'] = int(tab_data['page_size_combo'].currentText())
         if tab_data['current_query']:  # Only re-execute if we have a query
             tab_data['current_page'] = 0  # Reset to first page
             self.execute_streaming_query(tab_index)
@@ -5449,10 +6143,12 @@ class DuckDBSQLApp(QMainWindow):
             
         tab_data = self.query_tabs[tab_index]
         
-        if tab_data['streaming_thread']:
-            tab_data['streaming_thread'].cancel()
-            tab_data['streaming_thread'].wait()
-            tab_data['streaming_thread'] = None
+        if tab_data.get('multi_query_thread'):
+            # Remaining statements are skipped; the finished handler updates the tab
+            tab_data['multi_query_thread'].cancel()
+            return
+        
+        self._retire_streaming_thread(tab_data)
             
         if tab_data['query_thread']:
             tab_data['query_thread'].terminate()
@@ -5469,51 +6165,11 @@ class DuckDBSQLApp(QMainWindow):
         if tab_index not in self.query_tabs:
             return
             
-        results_table = self.query_tabs[tab_index]['results_table']
-        
-        # Clear existing data efficiently and force garbage collection
-        results_table.clearContents()
-        gc.collect()  # Free memory from previous data
-        
-        # Set up the table dimensions
-        results_table.setRowCount(len(data))
-        results_table.setColumnCount(len(columns))
-        results_table.setHorizontalHeaderLabels(columns)
-        
-        # Optimize table performance for large datasets
-        results_table.setUpdatesEnabled(False)  # Disable updates during population
-        
-        try:
-            # Populate the table with batch processing
-            batch_size = 1000  # Process in batches to avoid UI freezing
-            for batch_start in range(0, len(data), batch_size):
-                batch_end = min(batch_start + batch_size, len(data))
-                
-                for row_idx in range(batch_start, batch_end):
-                    row_data = data[row_idx]
-                    for col_idx, cell_data in enumerate(row_data):
-                        # Convert to string efficiently and handle None values
-                        if cell_data is None:
-                            display_text = 'NULL'
-                        elif isinstance(cell_data, (int, float)):
-                            display_text = str(cell_data)
-                        elif isinstance(cell_data, str):
-                            # Truncate very long strings for display performance
-                            display_text = cell_data[:1000] + '...' if len(cell_data) > 1000 else cell_data
-                        else:
-                            display_text = str(cell_data)[:1000]
-                        
-                        item = QTableWidgetItem(display_text)
-                        # Set item flags for better performance (read-only)
-                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                        results_table.setItem(row_idx, col_idx, item)
-                
-                # Process events periodically to keep UI responsive
-                if batch_end < len(data):
-                    QApplication.processEvents()
+        tab_data = self.query_tabs[tab_index]
+        results_table = tab_data['results_table']
         
-        finally:
-            results_table.setUpdatesEnabled(True)  # Re-enable updates
+        # Hand the rows to the model; cells are only formatted when the view paints them
+        tab_data['result_model'].set_rows(columns, data)
         
         # Optimize column sizing for performance
         if len(data) > 0:
@@ -5525,7 +6181,7 @@ class DuckDBSQLApp(QMainWindow):
                 # Only resize columns to contents for smaller datasets
                 results_table.resizeColumnsToContents()
                 # Limit maximum column width for readability
-                for col in range(results_table.columnCount()):
+                for col in range(len(columns)):
                     if results_table.columnWidth(col) > 300:
                         results_table.setColumnWidth(col, 300)
         
@@ -5572,9 +6228,90 @@ class DuckDBSQLApp(QMainWindow):
             QMessageBox.warning(self, 'Export Error', 'No query available for export. Please execute a query first.')
             return
         
-        # Store format type and tab index for use in export callbacks
+        query = tab_data['current_query']
+        if format_type in COPY_EXPORT_OPTIONS:
+            # DuckDB writes these formats itself without building Python rows
+            self.export_via_copy(query, format_type)
+        else:
+            self.start_full_export(query, format_type)
+    
+    def export_via_copy(self, query, format_type):
+        """Export a complete query result with COPY ... TO, falling back to the row export if COPY fails"""
+        delimiter = ','
+        if format_type == 'csv':
+            delimiter_dialog = ExportDelimiterDialog(self)
+            if delimiter_dialog.exec_() != QDialog.Accepted:
+                return
+            delimiter = delimiter_dialog.get_delimiter()
+        
+        title, default_name, file_filter = {
+            'csv': ('Export to CSV', 'query_results.csv', 'CSV Files (*.csv)'),
+            'json': ('Export to JSON', 'query_results.json', 'JSON Files (*.json)'),
+            'parquet': ('Export to Parquet', 'query_results.parquet', 'Parquet Files (*.parquet)'),
+        }[format_type]
+        file_path, _ = QFileDialog.getSaveFileName(self, title, default_name, file_filter)
+        if not file_path:
+            return
+        
+        self.export_progress_dialog = QProgressDialog('Exporting query results...', 'Cancel', 0, 0, self)
+        self.export_progress_dialog.setWindowModality(Qt.WindowModal)
+        self.export_progress_dialog.setAutoClose(False)
+        self.export_progress_dialog.setAutoReset(False)
+        self.export_progress_dialog.show()
+        
+        thread = CopyExportThread(self.connection, copy_export_sql(query, file_path, format_type, delimiter))
+        thread.export_finished.connect(lambda count: self.handle_copy_export_finished(file_path, count))
+        thread.error_occurred.connect(lambda error, retryable: self.handle_copy_export_error(query, format_type, file_path, delimiter, error, retryable))
+        thread.finished.connect(lambda: self.handle_copy_export_cancelled(thread, file_path))
+        self.export_progress_dialog.canceled.connect(thread.cancel)
+        self.export_query_thread = thread
+        thread.start()
+    
+    def handle_copy_export_finished(self, file_path, count):
+        """Report a finished COPY ... TO export"""
+        self.finish_export_thread()
+        records = f'\nRecords exported: {count}' if count is not None else ''
+        QMessageBox.information(self, 'Export Successful', 
+                              f'Data exported successfully to:\n{file_path}{records}')
+    
+    def handle_copy_export_error(self, query, format_type, file_path, delimiter, error, retryable):
+        """Redo a failed COPY ... TO export (e.g. a statement COPY can't wrap) through the row export"""
+        self.finish_export_thread()
+        if not retryable:
+            QMessageBox.critical(self, 'Export Error', f'Failed to export data:\n{error}')
+            return
+        print(f'Warning: COPY export failed, exporting fetched rows instead: {error}')
+        self.start_full_export(query, format_type, file_path, delimiter)
+    
+    def handle_copy_export_cancelled(self, thread, file_path):
+        """Release a COPY ... TO export that was cancelled and remove the partial file it left"""
+        if getattr(self, 'export_query_thread', None) is not thread:
+            return  # Already handled as finished or failed
+        self.finish_export_thread()
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+        self.status_label.setText('Export cancelled')
+    
+    def finish_export_thread(self):
+        """Close the export progress dialog and release the export thread"""
+        if hasattr(self, 'export_progress_dialog'):
+            if hasattr(self, 'export_query_thread'):
+                # Closing the dialog emits canceled, which must not cancel a finished export
+                self.export_progress_dialog.canceled.disconnect(self.export_query_thread.cancel)
+            self.export_progress_dialog.close()
+            delattr(self, 'export_progress_dialog')
+        if hasattr(self, 'export_query_thread'):
+            self.export_query_thread.deleteLater()
+            delattr(self, 'export_query_thread')
+    
+    def start_full_export(self, query, format_type, file_path=None, delimiter=None):
+        """Fetch a complete query result in a thread and export its rows"""
+        # Store format type and chosen destination for use in export callbacks
         self.export_format_type = format_type
-        self.export_tab_index = tab_index
+        self.export_file_path = file_path
+        self.export_delimiter = delimiter
         
         # Create and show progress dialog
         from PyQt5.QtWidgets import QProgressDialog
@@ -5585,8 +6322,8 @@ class DuckDBSQLApp(QMainWindow):
         self.export_progress_dialog.show()
         
         # Create and start the full export query thread
-        query = tab_data['current_query']
-        self.export_query_thread = FullExportQueryThread(self.connection, query)
+        as_arrow = format_type == 'parquet' and PARQUET_AVAILABLE
+        self.export_query_thread = FullExportQueryThread(self.connection, query, as_arrow)
         self.export_query_thread.export_ready.connect(self.handle_export_data_ready)
         self.export_query_thread.error_occurred.connect(self.handle_export_error)
         self.export_query_thread.progress_update.connect(self.update_export_progress)
@@ -5613,11 +6350,11 @@ class DuckDBSQLApp(QMainWindow):
             if self.export_format_type == 'excel':
                 self.export_to_excel(columns, data)
             elif self.export_format_type == 'csv':
-                self.export_to_csv(columns, data)
+                self.export_to_csv(columns, data, self.export_file_path, self.export_delimiter)
             elif self.export_format_type == 'json':
-                self.export_to_json(columns, data)
+                self.export_to_json(columns, data, self.export_file_path)
             elif self.export_format_type == 'parquet':
-                self.export_to_parquet(columns, data)
+                self.export_to_parquet(columns, data, self.export_file_path)
                 
         except Exception as e:
             QMessageBox.critical(self, 'Export Error', f'Failed to export data:\n{str(e)}')
@@ -5658,35 +6395,38 @@ class DuckDBSQLApp(QMainWindow):
         
         try:
             from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font
             from openpyxl.utils import get_column_letter
             
-            wb = Workbook()
-            ws = wb.active
-            ws.title = 'Query Results'
-            
-            # Add headers with bold formatting
-            for col_idx, column in enumerate(columns, 1):
-                cell = ws.cell(row=1, column=col_idx, value=column)
-                cell.font = Font(bold=True)
+            # Write-only workbooks stream rows to the file instead of keeping a cell object per value
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet('Query Results')
             
-            # Add data
-            for row_idx, row_data in enumerate(data, 2):
-                for col_idx, value in enumerate(row_data, 1):
-                    ws.cell(row=row_idx, column=col_idx, value=value)
+            # Column widths and frozen panes go before the rows in the sheet XML,
+            # so they have to be set before the first append; each width is a single
+            # map/max chain down the column rather than a nested loop over every cell
+            for col_idx, column in enumerate(columns):
+                values = map(_cell_str, map(itemgetter(col_idx), data))
+                width = max(len(column), max(map(len, values), default=0))
+                # Set column width with some padding, but cap at reasonable maximum
+                ws.column_dimensions[get_column_letter(col_idx + 1)].width = min(width + 2, 50)
             
             # Freeze the top row (headers)
             ws.freeze_panes = 'A2'
             
-            # Auto-adjust column widths
-            for col_idx in range(1, len(columns) + 1):
-                column_letter = get_column_letter(col_idx)
-                max_length = len(columns[col_idx - 1])
-                for row_idx in range(2, len(data) + 2):
-                    cell_value = str(ws.cell(row=row_idx, column=col_idx).value or '')
-                    max_length = max(max_length, len(cell_value))
-                # Set column width with some padding, but cap at reasonable maximum
-                ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
+            # Add headers with bold formatting
+            header_font = Font(bold=True)
+            header_cells = []
+            for column in columns:
+                cell = WriteOnlyCell(ws, value=column)
+                cell.font = header_font
+                header_cells.append(cell)
+            ws.append(header_cells)
+            
+            # Add data
+            for row_data in data:
+                ws.append(row_data)
             
             wb.save(file_path)
             QMessageBox.information(self, 'Export Successful', 
@@ -5695,25 +6435,28 @@ class DuckDBSQLApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Export Error', f'Failed to export to Excel:\n{str(e)}')
     
-    def export_to_csv(self, columns, data):
-        """Export data to CSV format with delimiter selection"""
-        # Show delimiter selection dialog
-        delimiter_dialog = ExportDelimiterDialog(self)
-        if delimiter_dialog.exec_() != QDialog.Accepted:
-            return
-        
-        delimiter = delimiter_dialog.get_delimiter()
+    def export_to_csv(self, columns, data, file_path=None, delimiter=None):
+        """Export data to CSV format with delimiter selection, unless the destination was already chosen"""
+        if delimiter is None:
+            # Show delimiter selection dialog
+            delimiter_dialog = ExportDelimiterDialog(self)
+            if delimiter_dialog.exec_() != QDialog.Accepted:
+                return
+            
+            delimiter = delimiter_dialog.get_delimiter()
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 'Export to CSV', 'query_results.csv', 'CSV Files (*.csv)'
-        )
+        if file_path is None:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, 'Export to CSV', 'query_results.csv', 'CSV Files (*.csv)'
+            )
         
         if not file_path:
             return
         
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter=delimiter)
+            # A 1 MiB buffer keeps the writer from issuing a write() call every 8 KiB
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
                 
                 # Write headers
                 writer.writerow(columns)
@@ -5728,11 +6471,12 @@ class DuckDBSQLApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Export Error', f'Failed to export to CSV:\n{str(e)}')
     
-    def export_to_json(self, columns, data):
+    def export_to_json(self, columns, data, file_path=None):
         """Export data to JSON format"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 'Export to JSON', 'query_results.json', 'JSON Files (*.json)'
-        )
+        if file_path is None:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, 'Export to JSON', 'query_results.json', 'JSON Files (*.json)'
+            )
         
         if not file_path:
             return
@@ -5765,7 +6509,7 @@ class DuckDBSQLApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Export Error', f'Failed to export to JSON:\n{str(e)}')
     
-    def export_to_parquet(self, columns, data):
+    def export_to_parquet(self, columns, data, file_path=None):
         """Export data to Parquet format using Polars"""
         if not PARQUET_AVAILABLE:
             QMessageBox.critical(self, 'Export Error', 
@@ -5773,22 +6517,21 @@ class DuckDBSQLApp(QMainWindow):
                                'Please install it using: pip install pyarrow')
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 'Export to Parquet', 'query_results.parquet', 'Parquet Files (*.parquet)'
-        )
+        if file_path is None:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, 'Export to Parquet', 'query_results.parquet', 'Parquet Files (*.parquet)'
+            )
         
         if not file_path:
             return
         
         try:
-            # Convert data to dictionary format for Polars DataFrame
-            data_dict = {}
-            for i, column in enumerate(columns):
-                data_dict[column] = [row[i] for row in data]
-            
-            # Create Polars DataFrame and write to Parquet
-            df = pl.DataFrame(data_dict)
-            df.write_parquet(file_path)
+            if isinstance(data, pa.Table):
+                # Arrow results are written as they are, without converting to Python values
+                pq.write_table(data, file_path, compression='zstd', use_dictionary=True)
+            else:
+                # Create Polars DataFrame and write to Parquet
+                rows_to_polars(columns, data).write_parquet(file_path)
             
             QMessageBox.information(self, 'Export Successful', 
                                   f'Data exported successfully to:\n{file_path}\n'
@@ -5981,45 +6724,18 @@ class DuckDBSQLApp(QMainWindow):
         results_layout = QVBoxLayout(results_group)
         
         # Pagination controls
-        pagination_layout = QHBoxLayout()
-        
-        # Page info and controls
-        page_info_label = QLabel('No results')
-        first_page_btn = QPushButton('First')
-        prev_page_btn = QPushButton('Previous')
-        next_page_btn = QPushButton('Next')
-        last_page_btn = QPushButton('Last')
-        
-        # Page size selector
-        page_size_label = QLabel('Rows per page:')
-        page_size_combo = QComboBox()
-        page_size_combo.addItems(['1000', '5000', '10000', '25000', '50000'])
-        page_size_combo.setCurrentText('10000')
-        
-        # Cancel query button
-        cancel_btn = QPushButton('Cancel Query')
-        cancel_btn.setEnabled(False)
-        
-        # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setVisible(False)
-        progress_bar.setMaximum(100)
-        
-        pagination_layout.addWidget(page_info_label)
-        pagination_layout.addStretch()
-        pagination_layout.addWidget(first_page_btn)
-        pagination_layout.addWidget(prev_page_btn)
-        pagination_layout.addWidget(next_page_btn)
-        pagination_layout.addWidget(last_page_btn)
-        pagination_layout.addStretch()
-        pagination_layout.addWidget(page_size_label)
-        pagination_layout.addWidget(page_size_combo)
-        pagination_layout.addWidget(cancel_btn)
+        (pagination_layout, pagination_container, page_info_label, first_page_btn, prev_page_btn, next_page_btn,
+         last_page_btn, page_size_label, page_size_combo, progress_bar,
+         cancel_btn) = self._build_pagination_bar()
         
         # Add progress bar below pagination controls
         results_layout.addWidget(progress_bar)
         
-        results_table = QTableWidget()
+        # The model only formats the cells being painted
+        results_table = QTableView()
+        result_model = ResultTableModel(results_table, _display_cell)
+        results_table.setModel(result_model)
+        results_table.horizontalHeader().setResizeContentsPrecision(self.COLUMN_FIT_SAMPLE_ROWS)
         
         results_layout.addLayout(pagination_layout)
         results_layout.addWidget(results_table)
@@ -6045,20 +6761,7 @@ class DuckDBSQLApp(QMainWindow):
         # Create custom close button for this tab
         close_button = QPushButton('×')
         close_button.setFixedSize(16, 16)
-        close_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {self.get_current_theme_color('text')};
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: red;
-                color: white;
-                border-radius: 8px;
-            }}
-        """)
+        close_button.setStyleSheet(self._close_button_style)
         close_button.setToolTip('Close tab')
         close_button.clicked.connect(lambda: self.close_query_tab_for_widget(tab_widget, tab_index))
         
@@ -6074,13 +6777,14 @@ class DuckDBSQLApp(QMainWindow):
         cancel_btn.clicked.connect(lambda: self.cancel_query_for_widget(tab_widget, tab_index))
         
         # Store tab components - use unique key for split screen tabs
-        tab_key = f"{id(tab_widget)}_{tab_index}"
         if not hasattr(self, 'split_query_tabs'):
-            self.split_query_tabs = {}
+            self.split_query_tabs = weakref.WeakKeyDictionary()
             
-        self.split_query_tabs[tab_key] = {
+        # Entries go away with the tab widget, so they must not hold a reference to it
+        self.split_query_tabs.setdefault(tab_widget, {})[tab_index] = {
             'sql_editor': sql_editor,
             'results_table': results_table,
+            'result_model': result_model,
             'query_thread': None,
             'streaming_thread': None,
             'close_button': close_button,
@@ -6090,13 +6794,15 @@ class DuckDBSQLApp(QMainWindow):
             'next_page_btn': next_page_btn,
             'last_page_btn': last_page_btn,
             'page_size_combo': page_size_combo,
+            'page_size': int(page_size_combo.currentText()),  # updated by the page size handlers
             'cancel_btn': cancel_btn,
             'progress_bar': progress_bar,
+            'results_group': results_group,
+            'pagination_container': pagination_container,
             'current_page': 0,
             'total_rows': 0,
             'current_query': '',
-            'columns': [],
-            'tab_widget': tab_widget
+            'columns': []
         }
         
         # Switch to new tab
@@ -6116,13 +6822,12 @@ class DuckDBSQLApp(QMainWindow):
     
     def execute_query_for_split_tab(self, tab_widget, tab_index):
         """Execute query for split screen tab"""
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_key = (tab_widget, tab_index)
+        tab_data = self._split_data(*tab_key)
+        if tab_data is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
         sql_editor = tab_data['sql_editor']
-        results_table = tab_data['results_table']
         cancel_btn = tab_data['cancel_btn']
         progress_bar = tab_data['progress_bar']
         
@@ -6137,9 +6842,7 @@ class DuckDBSQLApp(QMainWindow):
             tab_data['query_thread'].wait()
         
         # Clear previous results
-        results_table.clear()
-        results_table.setRowCount(0)
-        results_table.setColumnCount(0)
+        tab_data['result_model'].set_rows([], [])
         
         # Show progress
         progress_bar.setVisible(True)
@@ -6149,6 +6852,7 @@ class DuckDBSQLApp(QMainWindow):
         # Store current query
         tab_data['current_query'] = query
         tab_data['current_page'] = 0
+        tab_data['data'] = None
         
         # Create and start query thread
         tab_data['query_thread'] = SQLQueryThread(self.connection, query)
@@ -6158,11 +6862,10 @@ class DuckDBSQLApp(QMainWindow):
     
     def handle_split_query_result(self, tab_key, columns, data):
         """Handle query result for split screen tab"""
-        if tab_key not in self.split_query_tabs:
+        if self._split_data(*tab_key) is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        results_table = tab_data['results_table']
+        tab_data = self._split_data(*tab_key)
         progress_bar = tab_data['progress_bar']
         cancel_btn = tab_data['cancel_btn']
         page_info_label = tab_data['page_info_label']
@@ -6188,10 +6891,10 @@ class DuckDBSQLApp(QMainWindow):
     
     def handle_split_query_error(self, tab_key, error):
         """Handle query error for split screen tab"""
-        if tab_key not in self.split_query_tabs:
+        if self._split_data(*tab_key) is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
+        tab_data = self._split_data(*tab_key)
         progress_bar = tab_data['progress_bar']
         cancel_btn = tab_data['cancel_btn']
         
@@ -6201,32 +6904,18 @@ class DuckDBSQLApp(QMainWindow):
     
     def update_split_results_table(self, tab_key, columns, data):
         """Update results table for split screen tab"""
-        if tab_key not in self.split_query_tabs:
+        if self._split_data(*tab_key) is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
+        tab_data = self._split_data(*tab_key)
         results_table = tab_data['results_table']
         
         if not data or len(data) == 0:
-            results_table.setRowCount(0)
-            results_table.setColumnCount(0)
+            tab_data['result_model'].set_rows([], [])
             return
         
-        # Set up table
-        results_table.setRowCount(len(data))
-        results_table.setColumnCount(len(columns))
-        results_table.setHorizontalHeaderLabels([str(col) for col in columns])
-        
-        # Populate table
-        for row_idx, row_data in enumerate(data):
-            for col_idx, value in enumerate(row_data):
-                if value is None:
-                    item_text = 'NULL'
-                else:
-                    item_text = str(value)
-                
-                item = QTableWidgetItem(item_text)
-                results_table.setItem(row_idx, col_idx, item)
+        # Set up table; the model formats cells as they are painted
+        tab_data['result_model'].set_rows(columns, data)
         
         # Auto-resize columns
         results_table.resizeColumnsToContents()
@@ -6236,18 +6925,15 @@ class DuckDBSQLApp(QMainWindow):
     
     def update_split_pagination_buttons(self, tab_key):
         """Update pagination buttons for split screen tab"""
-        if tab_key not in self.split_query_tabs:
+        if self._split_data(*tab_key) is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        page_size = int(tab_data['page_size_combo'].currentText())
-        total_pages = (tab_data['total_rows'] + page_size - 1) // page_size
+        tab_data = self._split_data(*tab_key)
         current_page = tab_data['current_page']
         
-        tab_data['first_page_btn'].setEnabled(current_page > 0)
-        tab_data['prev_page_btn'].setEnabled(current_page > 0)
-        tab_data['next_page_btn'].setEnabled(current_page < total_pages - 1)
-        tab_data['last_page_btn'].setEnabled(current_page < total_pages - 1)
+        has_prev = current_page > 0
+        has_next = current_page < last_page_index(tab_data['total_rows'], tab_data['page_size'])
+        self.set_page_buttons_enabled(tab_data, has_prev, has_prev, has_next, has_next)
     
     def export_results_for_tab_widget(self, tab_widget, format_type, tab_index):
         """Export results for a specific tab widget"""
@@ -6255,35 +6941,34 @@ class DuckDBSQLApp(QMainWindow):
             self.export_results(format_type, tab_index)
         else:
             # Handle right side tab widget export
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
                 self.export_split_results(tab_key, format_type)
     
     def export_split_results(self, tab_key, format_type):
         """Export results for split screen tab"""
-        if tab_key not in self.split_query_tabs:
+        if self._split_data(*tab_key) is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
+        tab_data = self._split_data(*tab_key)
         query = tab_data['current_query']
         
         if not query:
             QMessageBox.warning(self, 'Warning', 'No query results to export.')
             return
         
+        if format_type in COPY_EXPORT_OPTIONS:
+            # Same COPY ... TO export as the main tabs
+            self.export_via_copy(query, format_type)
+            return
+        
         # Use existing export logic but with split screen query
         try:
             # Execute full query for export
-            df = self.conn.execute(query).pl()
+            df = self.connection.execute(query).pl()
             
             if format_type == 'excel':
                 self.export_to_excel_split(df)
-            elif format_type == 'csv':
-                self.export_to_csv_split(df)
-            elif format_type == 'json':
-                self.export_to_json_split(df)
-            elif format_type == 'parquet':
-                self.export_to_parquet_split(df)
                 
         except Exception as e:
             QMessageBox.critical(self, 'Export Error', f'Failed to export: {str(e)}')
@@ -6302,60 +6987,25 @@ class DuckDBSQLApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, 'Export Error', f'Failed to export to Excel:\n{str(e)}')
     
-    def export_to_csv_split(self, df):
-        """Export split screen results to CSV"""
-        file_path, _ = QFileDialog.getSaveFileName(self, 'Export to CSV', '', 'CSV Files (*.csv)')
-        if file_path:
-            try:
-                df.write_csv(file_path)
-                QMessageBox.information(self, 'Success', f'Data exported to {file_path}')
-            except Exception as e:
-                QMessageBox.critical(self, 'Export Error', f'Failed to export to CSV:\n{str(e)}')
-    
-    def export_to_json_split(self, df):
-        """Export split screen results to JSON"""
-        file_path, _ = QFileDialog.getSaveFileName(self, 'Export to JSON', '', 'JSON Files (*.json)')
-        if file_path:
-            try:
-                df.write_json(file_path)
-                QMessageBox.information(self, 'Success', f'Data exported to {file_path}')
-            except Exception as e:
-                QMessageBox.critical(self, 'Export Error', f'Failed to export to JSON:\n{str(e)}')
-    
-    def export_to_parquet_split(self, df):
-        """Export split screen results to Parquet"""
-        if not PARQUET_AVAILABLE:
-            QMessageBox.warning(self, 'Warning', 'Parquet export requires pyarrow package.')
-            return
-        
-        file_path, _ = QFileDialog.getSaveFileName(self, 'Export to Parquet', '', 'Parquet Files (*.parquet)')
-        if file_path:
-            try:
-                df.write_parquet(file_path)
-                QMessageBox.information(self, 'Success', f'Data exported to {file_path}')
-            except Exception as e:
-                QMessageBox.critical(self, 'Export Error', f'Failed to export to Parquet:\n{str(e)}')
-    
     def show_results_context_menu_for_widget(self, pos, tab_widget, tab_index):
         """Show context menu for results table in specific tab widget"""
         if tab_widget == self.query_tab_widget:
             self.show_results_context_menu(pos, tab_index)
         else:
             # Handle right side context menu for split screen
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key not in self.split_query_tabs:
+            tab_data = self._split_data(tab_widget, tab_index)
+            if tab_data is None:
                 return
                 
-            tab_data = self.split_query_tabs[tab_key]
             results_table = tab_data['results_table']
             
-            # Get the item at the clicked position
-            item = results_table.itemAt(pos)
-            if not item:
+            # Get the cell at the clicked position
+            index = results_table.indexAt(pos)
+            if not index.isValid():
                 return
                 
-            row = item.row()
-            column = item.column()
+            row = index.row()
+            column = index.column()
             
             # Create context menu
             context_menu = QMenu(self)
@@ -6396,11 +7046,10 @@ class DuckDBSQLApp(QMainWindow):
             self.show_header_context_menu(pos, tab_index)
         else:
             # Handle right side header context menu for split screen
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key not in self.split_query_tabs:
+            tab_data = self._split_data(tab_widget, tab_index)
+            if tab_data is None:
                 return
                 
-            tab_data = self.split_query_tabs[tab_key]
             results_table = tab_data['results_table']
             header = results_table.horizontalHeader()
             
@@ -6424,16 +7073,16 @@ class DuckDBSQLApp(QMainWindow):
             self.close_query_tab(tab_index)
         else:
             # Handle right side tab closing
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
                 # Cancel any running query
-                tab_data = self.split_query_tabs[tab_key]
+                tab_data = self._split_data(*tab_key)
                 if tab_data['query_thread'] and tab_data['query_thread'].isRunning():
                     tab_data['query_thread'].terminate()
                     tab_data['query_thread'].wait()
                 
                 # Remove from tracking
-                del self.split_query_tabs[tab_key]
+                del self.split_query_tabs[tab_widget][tab_index]
             
             # Remove tab
             tab_widget.removeTab(tab_index)
@@ -6443,8 +7092,8 @@ class DuckDBSQLApp(QMainWindow):
         if tab_widget == self.query_tab_widget:
             self.go_to_page(tab_index, page)
         else:
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
                 self.go_to_split_page(tab_key, page)
     
     def prev_page_for_widget(self, tab_widget, tab_index):
@@ -6452,9 +7101,9 @@ class DuckDBSQLApp(QMainWindow):
         if tab_widget == self.query_tab_widget:
             self.prev_page(tab_index)
         else:
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
-                current_page = self.split_query_tabs[tab_key]['current_page']
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
+                current_page = self._split_data(*tab_key)['current_page']
                 if current_page > 0:
                     self.go_to_split_page(tab_key, current_page - 1)
     
@@ -6463,13 +7112,11 @@ class DuckDBSQLApp(QMainWindow):
         if tab_widget == self.query_tab_widget:
             self.next_page(tab_index)
         else:
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
-                tab_data = self.split_query_tabs[tab_key]
-                page_size = int(tab_data['page_size_combo'].currentText())
-                total_pages = (tab_data['total_rows'] + page_size - 1) // page_size
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
+                tab_data = self._split_data(*tab_key)
                 current_page = tab_data['current_page']
-                if current_page < total_pages - 1:
+                if current_page < last_page_index(tab_data['total_rows'], tab_data['page_size']):
                     self.go_to_split_page(tab_key, current_page + 1)
     
     def go_to_last_page_for_widget(self, tab_widget, tab_index):
@@ -6477,20 +7124,18 @@ class DuckDBSQLApp(QMainWindow):
         if tab_widget == self.query_tab_widget:
             self.go_to_last_page(tab_index)
         else:
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
-                tab_data = self.split_query_tabs[tab_key]
-                page_size = int(tab_data['page_size_combo'].currentText())
-                total_pages = (tab_data['total_rows'] + page_size - 1) // page_size
-                self.go_to_split_page(tab_key, total_pages - 1)
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
+                tab_data = self._split_data(*tab_key)
+                self.go_to_split_page(tab_key, last_page_index(tab_data['total_rows'], tab_data['page_size']))
     
     def go_to_split_page(self, tab_key, page):
         """Go to specific page for split screen tab"""
-        if tab_key not in self.split_query_tabs:
+        if self._split_data(*tab_key) is None:
             return
             
-        tab_data = self.split_query_tabs[tab_key]
-        page_size = int(tab_data['page_size_combo'].currentText())
+        tab_data = self._split_data(*tab_key)
+        page_size = tab_data['page_size']
         offset = page * page_size
         
         query = tab_data['current_query']
@@ -6502,7 +7147,7 @@ class DuckDBSQLApp(QMainWindow):
             self.update_split_results_table(tab_key, df)
             
             # Update page info
-            total_pages = (tab_data['total_rows'] + page_size - 1) // page_size
+            total_pages = last_page_index(tab_data['total_rows'], page_size) + 1
             current_page = page + 1
             tab_data['page_info_label'].setText(f'Page {current_page} of {total_pages} ({tab_data["total_rows"]:,} total rows)')
             
@@ -6517,8 +7162,10 @@ class DuckDBSQLApp(QMainWindow):
         if tab_widget == self.query_tab_widget:
             self.change_page_size(tab_index)
         else:
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
+            tab_key = (tab_widget, tab_index)
+            tab_data = self._split_data(*tab_key)
+            if tab_data is not None:
+                tab_data['page_size'] = int(tab_data['page_size_combo'].currentText())
                 # Reset to first page with new page size
                 self.go_to_split_page(tab_key, 0)
     
@@ -6527,10 +7174,34 @@ class DuckDBSQLApp(QMainWindow):
         if tab_widget == self.query_tab_widget:
             self.cancel_query(tab_index)
         else:
-            tab_key = f"{id(tab_widget)}_{tab_index}"
-            if tab_key in self.split_query_tabs:
+            tab_key = (tab_widget, tab_index)
+            if self._split_data(*tab_key) is not None:
                 self.cancel_split_query(tab_key)
     
+    def launch_eel_dashboard(self, df, title):
+        """Show a DataFrame in the Eel dashboard.
+        
+        Eel runs on a single long-lived daemon thread, started by the first dashboard;
+        later dashboards are queued for that thread instead of each starting its own.
+        """
+        self._eel_requests.put((df, title))
+        if self._eel_thread is None:
+            self._eel_thread = threading.Thread(target=self._run_eel_dashboards, daemon=True)
+            self._eel_thread.start()
+    
+    def _run_eel_dashboards(self):
+        """Dashboard thread: open each queued dashboard and keep Eel serving in between"""
+        while True:
+            try:
+                df, title = self._eel_requests.get_nowait()
+            except queue.Empty:
+                eel.sleep(0.5)
+                continue
+            try:
+                create_dashboard(df, title=title)
+            except Exception as e:
+                print(f"Error launching dashboard: {e}")
+    
     def open_eel_dashboard(self, tab_index):
         """Open Eel interactive dashboard with data from the specified tab"""
         if not EEL_AVAILABLE:
@@ -6549,34 +7220,15 @@ class DuckDBSQLApp(QMainWindow):
             return
             
         try:
-            # Get the results table
-            results_table = self.query_tabs[tab_index]['results_table']
-            
-            # Convert table data to pandas DataFrame
-            df = self.table_to_dataframe(results_table)
+            # Convert the shown results to a pandas DataFrame
+            df = self.table_to_dataframe(self.query_tabs[tab_index]['result_model'])
             
             if df.empty:
                 QMessageBox.information(self, 'No Data', 'No data available for dashboard.')
                 return
             
-            # Create and launch the Eel dashboard in a separate thread
-            import threading
-            
-            def launch_dashboard():
-                try:
-                    create_dashboard(df, title=f"Query Results - Tab {tab_index + 1}")
-                    # Keep the dashboard running
-                    while True:
-                        eel.sleep(1.0)
-                except Exception as e:
-                    print(f"Error launching dashboard: {e}")
-            
-            dashboard_thread = threading.Thread(target=launch_dashboard, daemon=True)
-            dashboard_thread.start()
-            
-            # Small delay to let dashboard start
-            import time
-            time.sleep(0.5)
+            # Launch the Eel dashboard on the dashboard thread
+            self.launch_eel_dashboard(df, f"Query Results - Tab {tab_index + 1}")
             
             # Show info message
             QMessageBox.information(
@@ -6610,34 +7262,20 @@ class DuckDBSQLApp(QMainWindow):
                               'pip install pandas')
             return
             
-        tab_key = f"{id(tab_widget)}_{tab_index}"
-        if tab_key not in self.split_query_tabs:
+        tab_data = self._split_data(tab_widget, tab_index)
+        if tab_data is None:
             return
             
         try:
-            # Get the results table
-            results_table = self.split_query_tabs[tab_key]['results_table']
-            
-            # Convert table data to pandas DataFrame
-            df = self.table_to_dataframe(results_table)
+            # Convert the shown results to a pandas DataFrame
+            df = self.table_to_dataframe(tab_data['result_model'])
             
             if df.empty:
                 QMessageBox.information(self, 'No Data', 'No data available for dashboard.')
                 return
                 
-            # Create and launch the Eel dashboard in a separate thread
-            import threading
-            
-            def launch_dashboard():
-                try:
-                    create_dashboard(df, title=f"Split Query Results - Tab {tab_index + 1}")
-                    while True:
-                        eel.sleep(1.0)
-                except Exception as e:
-                    print(f"Error launching dashboard: {e}")
-            
-            dashboard_thread = threading.Thread(target=launch_dashboard, daemon=True)
-            dashboard_thread.start()
+            # Launch the Eel dashboard on the dashboard thread
+            self.launch_eel_dashboard(df, f"Split Query Results - Tab {tab_index + 1}")
             
             # Show info message
             QMessageBox.information(
@@ -6650,38 +7288,14 @@ class DuckDBSQLApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to create dashboard: {str(e)}')
     
-    def table_to_dataframe(self, table_widget):
-        """Convert QTableWidget data to pandas DataFrame"""
-        if not table_widget or table_widget.rowCount() == 0:
+    def table_to_dataframe(self, result_model):
+        """Convert the rows shown by a results model to a pandas DataFrame"""
+        if not result_model or result_model.rowCount() == 0:
             return pd.DataFrame()
-            
-        # Get column headers
-        columns = []
-        for col in range(table_widget.columnCount()):
-            header_item = table_widget.horizontalHeaderItem(col)
-            columns.append(header_item.text() if header_item else f"Column_{col}")
-        
-        # Get data
-        data = []
-        for row in range(table_widget.rowCount()):
-            row_data = []
-            for col in range(table_widget.columnCount()):
-                item = table_widget.item(row, col)
-                value = item.text() if item else ""
-                
-                # Try to convert to numeric if possible
-                try:
-                    if '.' in value:
-                        value = float(value)
-                    elif value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
-                        value = int(value)
-                except (ValueError, AttributeError):
-                    pass  # Keep as string
-                    
-                row_data.append(value)
-            data.append(row_data)
         
-        return pd.DataFrame(data, columns=columns)
+        # The model holds the original values, so numbers keep their types without re-parsing text
+        columns = [str(column) for column in result_model.columns]
+        return pd.DataFrame(list(result_model.rows), columns=columns)
 
 def main():
     # Set Qt attribute for WebEngine before creating QApplication